@@ -63,6 +63,11 @@ Exemples:
         action="store_true",
         help="Forcer la reconversion même si le PDF existe",
     )
+    general.add_argument(
+        "-u", "--incremental",
+        action="store_true",
+        help="Reconvertir uniquement les fichiers modifiés depuis leur PDF",
+    )
     general.add_argument(
         "-d", "--delete",
         action="store_true",
@@ -78,6 +83,13 @@ Exemples:
         action="store_true",
         help="Simuler les conversions sans les exécuter",
     )
+    general.add_argument(
+        "-j", "--workers",
+        type=int,
+        metavar="N",
+        default=None,
+        help="Nombre de fichiers convertis en parallèle (défaut: 1)",
+    )
 
     # Méthode de conversion
     method = parser.add_argument_group("Méthode de conversion")
@@ -142,6 +142,35 @@ def create_office_app(
         raise COMError(f"Impossible de créer {app_name}: {e}") from e
 
 
+def set_app_properties(
+    app: Any,
+    properties: dict[str, Any],
+    logger: ConverterLogger | None = None,
+) -> None:
+    """
+    Applique des propriétés COM sur une application Office, sans échouer.
+
+    Les propriétés absentes ou refusées selon la version d'Office
+    sont simplement ignorées.
+
+    Args:
+        app: Instance COM de l'application
+        properties: Chemin de propriété ("Options.Pagination") -> valeur
+        logger: Logger optionnel
+    """
+    log = logger or get_logger()
+
+    for name, value in properties.items():
+        try:
+            target = app
+            *parents, attr = name.split(".")
+            for parent in parents:
+                target = getattr(target, parent)
+            setattr(target, attr, value)
+        except Exception as e:
+            log.debug(f"Propriété {name} non appliquée: {e}")
+
+
 def quit_office_app(app: Any, logger: ConverterLogger | None = None) -> None:
     """
     Ferme proprement une application Office.
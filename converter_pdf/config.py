@@ -67,6 +67,22 @@ class Config:
     report_enabled: bool = True
     """Activer la génération du rapport de session (fichier texte)"""
 
+    # === Journal CSV ===
+    journal_enabled: bool = False
+    """Activer le journal CSV des conversions"""
+
+    journal_errors_only: bool = True
+    """N'écrire dans le journal que les erreurs (pas les succès ni les PDF existants)"""
+
+    journal_flush_every: int = 64
+    """Nombre de lignes du journal entre deux écritures disque"""
+
+    journal_fsync_every_row: bool = False
+    """Forcer l'écriture disque (fsync) après chaque ligne du journal (lent)"""
+
+    journal_full_traceback: bool = False
+    """Écrire la trace complète des exceptions dans le journal (sinon une ligne)"""
+
     # === OCR ===
     ocr_enabled: bool = False
     """Activer l'OCR pour les images"""
@@ -84,6 +100,13 @@ class Config:
     browser_timeout: int = 30
     """Timeout pour le navigateur headless (HTML)"""
 
+    # === Options Office ===
+    word_optimize_for_screen: bool = False
+    """Export Word optimisé pour l'écran (PDF plus légers, images rééchantillonnées)"""
+
+    excel_skip_empty_sheets: bool = True
+    """Masquer les feuilles Excel vides avant l'export PDF"""
+
     # === Chemins externes (détectés automatiquement) ===
     libreoffice_path: Path | None = None
     """Chemin vers soffice.exe (détecté automatiquement si None)"""
@@ -98,6 +121,9 @@ class Config:
     force: bool = False
     """Forcer la reconversion même si le PDF existe"""
 
+    incremental: bool = False
+    """Reconvertir uniquement les fichiers modifiés depuis leur PDF (comparaison des dates)"""
+
     delete_source: bool = False
     """Supprimer le fichier source après conversion réussie"""
 
@@ -107,6 +133,9 @@ class Config:
     dry_run: bool = False
     """Simuler les conversions sans les exécuter"""
 
+    workers: int = 1
+    """Nombre de fichiers traités en parallèle (threads, 1 = séquentiel)"""
+
     # === Filtres de formats ===
     extensions: list[str] | None = None
     """Extensions à traiter (None = toutes)"""
@@ -135,6 +164,12 @@ class Config:
         if self.ocr_engine not in valid_ocr:
             raise ValueError(f"ocr_engine doit être dans {valid_ocr}")
 
+        if self.journal_flush_every < 1:
+            raise ValueError(f"journal_flush_every doit être >= 1, pas {self.journal_flush_every}")
+
+        if self.workers < 1:
+            raise ValueError(f"workers doit être >= 1, pas {self.workers}")
+
         # Vérifier l'incompatibilité delete_source / hide_source
         if self.delete_source and self.hide_source:
             raise ValueError(
@@ -252,6 +287,7 @@ class Config:
             "log_level": "log_level",
             "log_file": "log_file",
             "ocr_engine": "ocr_engine",
+            "workers": "workers",
         }
 
         for arg_name, config_name in non_bool_mapping.items():
@@ -265,6 +301,7 @@ class Config:
         bool_flags = {
             "recursive": "recursive",
             "force": "force",
+            "incremental": "incremental",
             "delete": "delete_source",
             "hide": "hide_source",
             "ocr": "ocr_enabled",
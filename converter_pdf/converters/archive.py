@@ -6,13 +6,14 @@ Décompresse les archives et convertit leur contenu en PDF.
 
 from __future__ import annotations
 
+import functools
 import os
-import re
 import shutil
 import tempfile
 import time
 import zipfile
 import tarfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -70,6 +71,9 @@ class ArchiveConverter(BaseConverter):
         ".rar",
         ".7z",
     ]
+    # Les fichiers extraits passent par la chaîne complète (COM, soffice)
+    thread_safe = False
+    produces_folder = True
 
     # Extensions convertibles en PDF
     CONVERTIBLE_EXTENSIONS = {
@@ -84,8 +88,34 @@ class ArchiveConverter(BaseConverter):
         ".pdf",  # Copier tel quel
     }
 
-    # Fichiers à ignorer (système, cache, etc.)
-    IGNORE_PATTERNS = {
+    # Caractères interdits dans un nom de fichier Windows -> '_'
+    # (table str.translate, un seul passage sans regex)
+    _SANITIZE_TABLE = str.maketrans(dict.fromkeys('<>:"|?*', '_'))
+
+    # Tampon de copie lors de l'extraction (octets)
+    COPY_BUFFER_SIZE = 1024 * 1024
+
+    # Mode d'ouverture tarfile par type d'archive
+    TAR_MODES = {"tar": "r", "tar.gz": "r:gz", "tar.bz2": "r:bz2"}
+
+    # Extraction ZIP parallèle: nombre de threads, et nombre minimal de
+    # fichiers pour que le coût des threads soit rentable
+    EXTRACT_WORKERS = min(8, os.cpu_count() or 1)
+    PARALLEL_EXTRACT_MIN_FILES = 64
+
+    # Type d'archive par extension (simple ou composée)
+    ARCHIVE_TYPES = {
+        ".zip": "zip",
+        ".tar.gz": "tar.gz", ".tgz": "tar.gz",
+        ".tar.bz2": "tar.bz2", ".tbz2": "tar.bz2",
+        ".tar": "tar",
+        ".rar": "rar",
+        ".7z": "7z",
+    }
+
+    # Fichiers à ignorer (système, cache, etc.): noms exacts, comparés
+    # par hachage (les noms cachés commençant par '.' sont toujours ignorés)
+    IGNORE_PATTERNS = frozenset({
         "__MACOSX",
         ".DS_Store",
         "Thumbs.db",
@@ -93,7 +123,7 @@ class ArchiveConverter(BaseConverter):
         ".git",
         ".svn",
         "__pycache__",
-    }
+    })
 
     def __init__(self, config: "Config", logger: "ConverterLogger"):
         super().__init__(config, logger)
@@ -124,35 +154,43 @@ class ArchiveConverter(BaseConverter):
 
     def _sanitize_filename(self, filename: str) -> str:
         """Nettoie un nom de fichier."""
-        sanitized = re.sub(r'[<>:"|?*]', '_', filename)
+        sanitized = filename.translate(self._SANITIZE_TABLE)
         if len(sanitized) > 200:
             sanitized = sanitized[:200]
         return sanitized.strip()
 
-    def _should_ignore(self, path: Path) -> bool:
-        """Vérifie si un fichier/dossier doit être ignoré."""
-        for part in path.parts:
-            if part in self.IGNORE_PATTERNS:
-                return True
-            if part.startswith('.'):
-                return True
-        return False
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _should_ignore_name(name: str) -> bool:
+        """
+        Vérifie si un nom (un seul composant de chemin) doit être ignoré.
+
+        Mis en cache: les mêmes noms de dossiers reviennent pour chaque
+        membre d'une archive (src/, docs/, __MACOSX/...).
+        """
+        return name in ArchiveConverter.IGNORE_PATTERNS or name.startswith('.')
+
+    def _should_ignore(self, path: Path | str) -> bool:
+        """
+        Vérifie si un fichier/dossier doit être ignoré.
+
+        Accepte aussi directement le nom d'un membre d'archive (chaîne
+        séparée par '/'), sans construire de Path.
+        """
+        parts = path.split('/') if isinstance(path, str) else path.parts
+        return any(part != '.' and self._should_ignore_name(part) for part in parts)
 
     def _get_archive_type(self, source: Path) -> str:
         """Détermine le type d'archive."""
-        name = source.name.lower()
-        if name.endswith('.zip'):
-            return 'zip'
-        elif name.endswith(('.tar.gz', '.tgz')):
-            return 'tar.gz'
-        elif name.endswith(('.tar.bz2', '.tbz2')):
-            return 'tar.bz2'
-        elif name.endswith('.tar'):
-            return 'tar'
-        elif name.endswith('.rar'):
-            return 'rar'
-        elif name.endswith('.7z'):
-            return '7z'
+        # Deux dernières extensions: d'abord l'extension composée
+        # (.tar.gz), puis la simple (un accès dict chacune)
+        parts = source.name.lower().rsplit('.', 2)
+        if len(parts) == 3:
+            archive_type = self.ARCHIVE_TYPES.get(f".{parts[1]}.{parts[2]}")
+            if archive_type:
+                return archive_type
+        if len(parts) > 1:
+            return self.ARCHIVE_TYPES.get(f".{parts[-1]}", 'unknown')
         return 'unknown'
 
     def _get_effective_source_dir(self, temp_dir: Path, archive_stem: str) -> Path:
@@ -173,7 +211,7 @@ class ArchiveConverter(BaseConverter):
         # Lister le contenu du dossier temporaire (sans fichiers ignorés)
         items = [
             item for item in temp_dir.iterdir()
-            if not self._should_ignore(item)
+            if not self._should_ignore_name(item.name)
         ]
 
         # Si un seul élément et c'est un dossier
@@ -207,7 +245,7 @@ class ArchiveConverter(BaseConverter):
         Returns:
             Résultat de la conversion
         """
-        start = time.time()
+        start = time.perf_counter()
         archive_type = self._get_archive_type(source)
 
         # Vérifier la disponibilité du décompresseur
@@ -216,7 +254,7 @@ class ArchiveConverter(BaseConverter):
                 status=ConversionStatus.FAILED,
                 source=source,
                 dest=None,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
                 message="rarfile non installé (pip install rarfile)",
             )
@@ -226,7 +264,7 @@ class ArchiveConverter(BaseConverter):
                 status=ConversionStatus.FAILED,
                 source=source,
                 dest=None,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
                 message="py7zr non installé (pip install py7zr)",
             )
@@ -236,7 +274,7 @@ class ArchiveConverter(BaseConverter):
                 status=ConversionStatus.FAILED,
                 source=source,
                 dest=None,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
                 message=f"Type d'archive non reconnu: {source.suffix}",
             )
@@ -256,7 +294,7 @@ class ArchiveConverter(BaseConverter):
                 status=ConversionStatus.SKIPPED_EXISTS,
                 source=source,
                 dest=output_folder,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
                 message="Dossier de sortie déjà existant",
             )
@@ -275,7 +313,7 @@ class ArchiveConverter(BaseConverter):
                     status=ConversionStatus.FAILED,
                     source=source,
                     dest=None,
-                    duration=time.time() - start,
+                    duration=time.perf_counter() - start,
                     method=self.name,
                     message="Archive vide ou erreur d'extraction",
                 )
@@ -302,7 +340,7 @@ class ArchiveConverter(BaseConverter):
                 status=ConversionStatus.SUCCESS,
                 source=source,
                 dest=output_folder,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=f"{self.name}_{archive_type}",
                 message=f"{converted} PDF, {kept} fichiers conservés",
             )
@@ -313,7 +351,7 @@ class ArchiveConverter(BaseConverter):
                 status=ConversionStatus.FAILED,
                 source=source,
                 dest=None,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
                 exception=e,
             )
@@ -335,44 +373,134 @@ class ArchiveConverter(BaseConverter):
         count = 0
 
         if archive_type == 'zip':
-            with zipfile.ZipFile(source, 'r') as zf:
-                for member in zf.namelist():
-                    if not self._should_ignore(Path(member)):
-                        zf.extract(member, dest_dir)
-                        count += 1
+            count = self._extract_zip(source, dest_dir)
 
         elif archive_type in ('tar', 'tar.gz', 'tar.bz2'):
-            mode = 'r'
-            if archive_type == 'tar.gz':
-                mode = 'r:gz'
-            elif archive_type == 'tar.bz2':
-                mode = 'r:bz2'
-
-            with tarfile.open(source, mode) as tf:
+            # Modes à accès direct (jamais 'r|gz', plus lent), tampon de
+            # copie agrandi pour l'extraction des membres
+            mode = self.TAR_MODES[archive_type]
+            with tarfile.open(source, mode, copybufsize=self.COPY_BUFFER_SIZE) as tf:
                 for member in tf.getmembers():
-                    if not self._should_ignore(Path(member.name)):
+                    if not self._should_ignore(member.name):
                         tf.extract(member, dest_dir)
                         count += 1
 
         elif archive_type == 'rar' and RARFILE_AVAILABLE:
             with rarfile.RarFile(source, 'r') as rf:
                 for member in rf.namelist():
-                    if not self._should_ignore(Path(member)):
+                    if not self._should_ignore(member):
                         rf.extract(member, dest_dir)
                         count += 1
 
         elif archive_type == '7z' and PY7ZR_AVAILABLE:
             with py7zr.SevenZipFile(source, 'r') as szf:
-                # py7zr extrait tout d'un coup
-                szf.extractall(dest_dir)
+                # py7zr extrait en une fois: ne cibler que les membres non
+                # ignorés (les autres ne sont jamais décompressés)
+                targets = [
+                    name for name in szf.getnames()
+                    if not self._should_ignore(name)
+                ]
+                if targets:
+                    szf.extract(dest_dir, targets=targets)
                 # Compter les fichiers
                 for root, dirs, files in os.walk(dest_dir):
+                    dirs[:] = [d for d in dirs if not self._should_ignore_name(d)]
                     for f in files:
-                        if not self._should_ignore(Path(root) / f):
+                        if not self._should_ignore_name(f):
                             count += 1
 
         return count
 
+    def _extract_zip(self, source: Path, dest_dir: Path) -> int:
+        """
+        Extrait un ZIP membre par membre, en parallèle pour les grosses archives.
+
+        Les dossiers sont créés d'abord (une seule fois chacun), puis les
+        fichiers sont copiés en flux avec un grand tampon. Au-delà de
+        PARALLEL_EXTRACT_MIN_FILES fichiers, la copie est répartie entre
+        plusieurs threads (zlib libère le GIL pendant la décompression),
+        chacun avec son propre ZipFile (un handle n'est pas thread-safe).
+
+        Returns:
+            Nombre de membres extraits (fichiers et dossiers)
+        """
+        dest_root = os.fspath(dest_dir)
+        created_dirs = {dest_root}
+        count = 0
+        jobs: list[tuple[zipfile.ZipInfo, str]] = []
+
+        with zipfile.ZipFile(source, 'r') as zf:
+            for info in zf.infolist():
+                if self._should_ignore(info.filename):
+                    continue
+                target = self._zip_member_target(dest_root, info.filename)
+                if target is None:
+                    continue
+
+                directory = target if info.is_dir() else os.path.dirname(target)
+                if directory not in created_dirs:
+                    os.makedirs(directory, exist_ok=True)
+                    created_dirs.add(directory)
+                if not info.is_dir():
+                    jobs.append((info, target))
+                count += 1
+
+            workers = min(self.EXTRACT_WORKERS, len(jobs))
+            if len(jobs) < self.PARALLEL_EXTRACT_MIN_FILES or workers < 2:
+                self._copy_zip_members(zf, jobs)
+                return count
+
+        # Lots contigus (lecture séquentielle dans chaque handle)
+        batch_size = -(-len(jobs) // workers)
+        batches = [jobs[i:i + batch_size] for i in range(0, len(jobs), batch_size)]
+
+        def copy_batch(batch: list[tuple[zipfile.ZipInfo, str]]) -> None:
+            with zipfile.ZipFile(source, 'r') as zf:
+                self._copy_zip_members(zf, batch)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # list(): propage la première exception d'un thread
+            list(executor.map(copy_batch, batches))
+
+        return count
+
+    def _copy_zip_members(
+        self,
+        zf: zipfile.ZipFile,
+        jobs: list[tuple[zipfile.ZipInfo, str]],
+    ) -> None:
+        """Copie les membres d'un ZIP vers leurs chemins de destination."""
+        buffer_size = self.COPY_BUFFER_SIZE
+        for info, target in jobs:
+            with zf.open(info) as src, open(target, 'wb') as dst:
+                shutil.copyfileobj(src, dst, buffer_size)
+
+    def _zip_member_target(self, dest_root: str, filename: str) -> str | None:
+        """
+        Calcule le chemin d'extraction d'un membre ZIP.
+
+        Même nettoyage que ZipFile.extract: lecteur, composants vides,
+        '.' et '..' retirés (le membre reste sous dest_root), caractères
+        interdits remplacés sous Windows.
+
+        Returns:
+            Chemin de destination, ou None si le nom ne contient rien d'utilisable
+        """
+        arcname = filename.replace('/', os.sep)
+        if os.altsep:
+            arcname = arcname.replace(os.altsep, os.sep)
+        arcname = os.path.splitdrive(arcname)[1]
+        parts = [
+            part for part in arcname.split(os.sep)
+            if part not in ('', os.curdir, os.pardir)
+        ]
+        if os.sep == '\\':
+            parts = [part.translate(self._SANITIZE_TABLE).rstrip('.') for part in parts]
+            parts = [part for part in parts if part]
+        if not parts:
+            return None
+        return os.path.join(dest_root, *parts)
+
     def _process_extracted_files(
         self,
         source_dir: Path,
@@ -392,12 +520,12 @@ class ArchiveConverter(BaseConverter):
         # Parcourir tous les fichiers
         for root, dirs, files in os.walk(source_dir):
             # Filtrer les dossiers à ignorer
-            dirs[:] = [d for d in dirs if not self._should_ignore(Path(d))]
+            dirs[:] = [d for d in dirs if not self._should_ignore_name(d)]
 
             rel_root = Path(root).relative_to(source_dir)
 
             for filename in files:
-                if self._should_ignore(Path(filename)):
+                if self._should_ignore_name(filename):
                     continue
 
                 source_file = Path(root) / filename
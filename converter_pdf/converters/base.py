@@ -33,6 +33,9 @@ class ConversionStatus(Enum):
     SKIPPED_EXISTS = "skipped_exists"
     """Ignoré: PDF existe déjà"""
 
+    SKIPPED_UNCHANGED = "skipped_unchanged"
+    """Ignoré: PDF plus récent que le source (mode incrémental)"""
+
     SKIPPED_UNSUPPORTED = "skipped_unsupported"
     """Ignoré: format non supporté"""
 
@@ -77,11 +80,22 @@ class ConversionResult:
     """Taille du PDF généré en bytes"""
 
     def __post_init__(self):
-        """Calcule les tailles si possible."""
-        if self.source and self.source.exists():
-            self.source_size = self.source.stat().st_size
-        if self.dest and self.dest.exists():
-            self.dest_size = self.dest.stat().st_size
+        """
+        Calcule les tailles si elles ne sont pas fournies.
+
+        Un seul stat() par fichier, fait ici une fois pour toutes :
+        source_size_mb / dest_size_mb ne touchent plus au disque.
+        """
+        if not self.source_size and self.source:
+            try:
+                self.source_size = self.source.stat().st_size
+            except OSError:
+                pass
+        if not self.dest_size and self.dest:
+            try:
+                self.dest_size = self.dest.stat().st_size
+            except OSError:
+                pass
 
     @property
     def is_success(self) -> bool:
@@ -94,6 +108,7 @@ class ConversionResult:
         return self.status in (
             ConversionStatus.SKIPPED_PASSWORD,
             ConversionStatus.SKIPPED_EXISTS,
+            ConversionStatus.SKIPPED_UNCHANGED,
             ConversionStatus.SKIPPED_UNSUPPORTED,
             ConversionStatus.SKIPPED_PDF,
         )
@@ -149,6 +164,12 @@ class BaseConverter(ABC):
     supported_extensions: list[str] = []
     """Extensions supportées (avec le point, ex: [".docx", ".doc"])"""
 
+    thread_safe: bool = True
+    """Peut convertir plusieurs fichiers simultanément (False pour COM, soffice)"""
+
+    produces_folder: bool = False
+    """Peut produire un dossier à traiter ensuite au lieu d'un PDF (archives, MSG)"""
+
     def __init__(self, config: "Config", logger: "ConverterLogger"):
         """
         Initialise le convertisseur.
@@ -192,6 +213,16 @@ class BaseConverter(ABC):
         """
         pass
 
+    @staticmethod
+    def _temp_path(dest: Path) -> Path:
+        """
+        Chemin temporaire dans le répertoire de destination.
+
+        Le PDF y est écrit puis renommé avec os.replace : un PDF partiel
+        (plantage, interruption) n'apparaît jamais sous le nom final.
+        """
+        return dest.with_name(dest.name + ".tmp")
+
     def is_available(self) -> bool:
         """
         Vérifie si le convertisseur est disponible.
@@ -7,8 +7,10 @@ des pages HTML avec CSS, images, etc.
 
 from __future__ import annotations
 
+import functools
 import shutil
 import subprocess
+import tempfile
 import time
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -31,10 +33,6 @@ class HtmlConverter(BaseConverter):
     name = "html_browser"
     supported_extensions = [".htm", ".html"]
 
-    def __init__(self, config: "Config", logger: "ConverterLogger"):
-        super().__init__(config, logger)
-        self._browser_path: Path | None = None
-
     def _detect_browser(self) -> Path | None:
         """Détecte Chrome ou Edge."""
         # Utiliser le chemin configuré si disponible
@@ -62,12 +60,10 @@ class HtmlConverter(BaseConverter):
 
         return None
 
-    @property
+    @functools.cached_property
     def browser_path(self) -> Path | None:
-        """Chemin vers le navigateur (détecté au premier accès)."""
-        if self._browser_path is None:
-            self._browser_path = self._detect_browser()
-        return self._browser_path
+        """Chemin vers le navigateur (détecté une seule fois, même si absent)."""
+        return self._detect_browser()
 
     def is_available(self) -> bool:
         """Vérifie qu'un navigateur est disponible."""
@@ -75,14 +71,14 @@ class HtmlConverter(BaseConverter):
 
     def convert(self, source: Path, dest: Path) -> ConversionResult:
         """Convertit un fichier HTML en PDF via navigateur headless."""
-        start = time.time()
+        start = time.perf_counter()
 
         if not self.is_available():
             return ConversionResult(
                 status=ConversionStatus.FAILED,
                 source=source,
                 dest=None,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
                 message="Aucun navigateur (Chrome/Edge) détecté",
             )
@@ -91,9 +87,10 @@ class HtmlConverter(BaseConverter):
             # Convertir en URI file://
             source_uri = source.absolute().as_uri()
 
-            # Créer un profil temporaire pour éviter les conflits
-            tmp_profile = dest.parent / f".tmp_browser_{int(time.time() * 1000)}"
-            tmp_profile.mkdir(parents=True, exist_ok=True)
+            # Créer un profil temporaire unique (conversions en parallèle
+            # dans le même dossier: un profil par appel)
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            tmp_profile = Path(tempfile.mkdtemp(prefix=".tmp_browser_", dir=dest.parent))
 
             # Commande navigateur headless
             cmd = [
@@ -130,7 +127,7 @@ class HtmlConverter(BaseConverter):
                     status=ConversionStatus.FAILED,
                     source=source,
                     dest=None,
-                    duration=time.time() - start,
+                    duration=time.perf_counter() - start,
                     method=self.name,
                     message=f"Erreur navigateur: {result.stderr[:200]}",
                 )
@@ -140,7 +137,7 @@ class HtmlConverter(BaseConverter):
                     status=ConversionStatus.FAILED,
                     source=source,
                     dest=None,
-                    duration=time.time() - start,
+                    duration=time.perf_counter() - start,
                     method=self.name,
                     message="PDF non créé ou vide",
                 )
@@ -150,7 +147,7 @@ class HtmlConverter(BaseConverter):
                 status=ConversionStatus.SUCCESS,
                 source=source,
                 dest=dest,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
             )
 
@@ -165,7 +162,7 @@ class HtmlConverter(BaseConverter):
                 status=ConversionStatus.FAILED,
                 source=source,
                 dest=None,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
                 message=f"Timeout après {self.config.browser_timeout}s",
             )
@@ -176,7 +173,7 @@ class HtmlConverter(BaseConverter):
                 status=ConversionStatus.FAILED,
                 source=source,
                 dest=None,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
                 exception=e,
             )
@@ -7,6 +7,7 @@ Support optionnel de l'OCR pour créer des PDF recherchables.
 
 from __future__ import annotations
 
+import os
 import time
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -50,18 +51,19 @@ class ImageConverter(BaseConverter):
 
     def convert(self, source: Path, dest: Path) -> ConversionResult:
         """Convertit une image en PDF."""
-        start = time.time()
+        start = time.perf_counter()
 
         if not self.is_available():
             return ConversionResult(
                 status=ConversionStatus.FAILED,
                 source=source,
                 dest=None,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
                 message="Pillow non installé (pip install Pillow)",
             )
 
+        tmp = self._temp_path(dest)
         try:
             self.logger.debug(f"Ouverture image: {source.name}")
 
@@ -79,40 +81,33 @@ class ImageConverter(BaseConverter):
                     self.logger.debug(f"Conversion mode {img.mode} -> RGB")
                     img = img.convert("RGB")
 
-                # Sauvegarder en PDF
+                # Sauvegarder en PDF (fichier temporaire puis renommage atomique)
                 img.save(
-                    str(dest),
+                    str(tmp),
                     "PDF",
                     resolution=100.0,
                     quality=95,
                 )
 
-            if not dest.exists():
-                return ConversionResult(
-                    status=ConversionStatus.FAILED,
-                    source=source,
-                    dest=None,
-                    duration=time.time() - start,
-                    method=self.name,
-                    message="PDF non créé",
-                )
+            os.replace(tmp, dest)
 
             self.logger.debug("Conversion image réussie")
             return ConversionResult(
                 status=ConversionStatus.SUCCESS,
                 source=source,
                 dest=dest,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
             )
 
         except Exception as e:
+            tmp.unlink(missing_ok=True)
             self.logger.error(f"Erreur conversion image: {e}", exc=e)
             return ConversionResult(
                 status=ConversionStatus.FAILED,
                 source=source,
                 dest=None,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
                 exception=e,
             )
@@ -7,6 +7,7 @@ les documents Office en PDF.
 
 from __future__ import annotations
 
+import functools
 import os
 import shutil
 import subprocess
@@ -38,10 +39,8 @@ class LibreOfficeConverter(BaseConverter):
         # PowerPoint
         ".ppt", ".pptx", ".odp",
     ]
-
-    def __init__(self, config: "Config", logger: "ConverterLogger"):
-        super().__init__(config, logger)
-        self._libreoffice_path: Path | None = None
+    # Instances soffice simultanées: conflit sur le profil utilisateur partagé
+    thread_safe = False
 
     def _detect_libreoffice(self) -> Path | None:
         """Détecte l'installation de LibreOffice."""
@@ -69,12 +68,10 @@ class LibreOfficeConverter(BaseConverter):
 
         return None
 
-    @property
+    @functools.cached_property
     def libreoffice_path(self) -> Path | None:
-        """Chemin vers soffice.exe (détecté au premier accès)."""
-        if self._libreoffice_path is None:
-            self._libreoffice_path = self._detect_libreoffice()
-        return self._libreoffice_path
+        """Chemin vers soffice.exe (détecté une seule fois, même si absent)."""
+        return self._detect_libreoffice()
 
     def is_available(self) -> bool:
         """Vérifie que LibreOffice est installé."""
@@ -82,14 +79,14 @@ class LibreOfficeConverter(BaseConverter):
 
     def convert(self, source: Path, dest: Path) -> ConversionResult:
         """Convertit un document via LibreOffice headless."""
-        start = time.time()
+        start = time.perf_counter()
 
         if not self.is_available():
             return ConversionResult(
                 status=ConversionStatus.FAILED,
                 source=source,
                 dest=None,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
                 message="LibreOffice non installé",
             )
@@ -126,7 +123,7 @@ class LibreOfficeConverter(BaseConverter):
                     status=ConversionStatus.FAILED,
                     source=source,
                     dest=None,
-                    duration=time.time() - start,
+                    duration=time.perf_counter() - start,
                     method=self.name,
                     message=f"LibreOffice erreur: {result.stderr[:200]}",
                 )
@@ -134,18 +131,19 @@ class LibreOfficeConverter(BaseConverter):
             # LibreOffice crée le PDF avec le nom du source
             pdf_generated = output_dir / (source.stem + ".pdf")
 
-            # Renommer si nécessaire
+            # Renommer si nécessaire (os.replace écrase un PDF existant, y compris sous Windows)
             if pdf_generated != dest:
-                if dest.exists():
-                    dest.unlink()
-                pdf_generated.rename(dest)
+                try:
+                    os.replace(pdf_generated, dest)
+                except FileNotFoundError:
+                    pass  # PDF non généré: signalé ci-dessous
 
             if not dest.exists():
                 return ConversionResult(
                     status=ConversionStatus.FAILED,
                     source=source,
                     dest=None,
-                    duration=time.time() - start,
+                    duration=time.perf_counter() - start,
                     method=self.name,
                     message="PDF non créé par LibreOffice",
                 )
@@ -155,7 +153,7 @@ class LibreOfficeConverter(BaseConverter):
                 status=ConversionStatus.SUCCESS,
                 source=source,
                 dest=dest,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
             )
 
@@ -165,7 +163,7 @@ class LibreOfficeConverter(BaseConverter):
                 status=ConversionStatus.FAILED,
                 source=source,
                 dest=None,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
                 message=f"Timeout après {self.config.libreoffice_timeout}s",
             )
@@ -176,7 +174,7 @@ class LibreOfficeConverter(BaseConverter):
                 status=ConversionStatus.FAILED,
                 source=source,
                 dest=None,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
                 exception=e,
             )
@@ -10,10 +10,13 @@ Gère les pièces jointes :
 
 from __future__ import annotations
 
+import functools
+import importlib.util
 import io
 import re
 import shutil
 import time
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -35,20 +38,80 @@ except ImportError:
     EXTRACT_MSG_AVAILABLE = False
     extract_msg = None  # type: ignore
 
-# Import conditionnel de ReportLab (pour fallback texte)
-try:
+# ReportLab (pour fallback texte) : détecté sans être importé, le module est
+# lent à charger et n'est utile que si le rendu HTML échoue
+REPORTLAB_AVAILABLE = importlib.util.find_spec("reportlab") is not None
+
+
+@functools.lru_cache(maxsize=None)
+def _text_pdf_styles() -> tuple:
+    """
+    Construit une seule fois les styles ReportLab du fallback texte.
+
+    Returns:
+        Tuple (feuille de styles, style corps, style en-tête, kwargs SimpleDocTemplate)
+    """
     from reportlab.lib.pagesizes import A4
     from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-    REPORTLAB_AVAILABLE = True
-except ImportError:
-    REPORTLAB_AVAILABLE = False
+
+    styles = getSampleStyleSheet()
+
+    # Style pour le corps avec word-wrap
+    body_style = ParagraphStyle(
+        "BodyStyle",
+        parent=styles["Normal"],
+        fontName="Courier",
+        fontSize=9,
+        leading=11,
+        wordWrap='CJK',
+    )
+
+    # Style pour les en-têtes
+    header_style = ParagraphStyle(
+        "HeaderStyle",
+        parent=styles["Normal"],
+        fontSize=10,
+        leading=12,
+        wordWrap='CJK',
+    )
+
+    doc_kwargs = dict(
+        pagesize=A4,
+        rightMargin=36,
+        leftMargin=36,
+        topMargin=36,
+        bottomMargin=36,
+    )
+
+    return styles, body_style, header_style, doc_kwargs
+
+
+# Éléments HTML inutiles au rendu PDF : scripts et redirections <meta refresh>
+_SCRIPT_RE = re.compile(r"<script\b[^>]*>.*?</script\s*>", re.DOTALL | re.IGNORECASE)
+_META_REFRESH_RE = re.compile(r"<meta\b[^>]*http-equiv\s*=\s*[\"']?refresh[^>]*>", re.IGNORECASE)
 
 if TYPE_CHECKING:
     from ..config import Config
     from ..logger import ConverterLogger
 
 
+@dataclass
+class MessageContent:
+    """
+    Contenu d'un message MSG, extrait une seule fois.
+
+    Partagé par le rendu HTML et le fallback texte pour ne jamais
+    relire le fichier OLE.
+    """
+
+    subject: str = ""
+    sender: str = ""
+    to: str = ""
+    date: str = ""
+    body: str = ""
+    html_body: str | bytes | None = None
+
+
 class MsgConverter(BaseConverter):
     """
     Convertisseur de fichiers Outlook MSG en PDF.
@@ -70,6 +133,10 @@ class MsgConverter(BaseConverter):
 
     name = "msg"
     supported_extensions = [".msg"]
+    # Les pièces jointes passent par la chaîne complète (COM, soffice)
+    thread_safe = False
+    # Avec pièces jointes, la sortie est un dossier message.msg-open/
+    produces_folder = True
 
     # Extensions convertibles en PDF
     CONVERTIBLE_EXTENSIONS = {
@@ -85,6 +152,9 @@ class MsgConverter(BaseConverter):
         ".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2",
     }
 
+    # Nombre de lignes par Paragraph dans le fallback texte
+    TEXT_CHUNK_LINES = 200
+
     # Extensions d'images (pour filtrage des petites images)
     IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".bmp", ".gif", ".tiff", ".tif", ".webp"}
 
@@ -275,14 +345,14 @@ class MsgConverter(BaseConverter):
         - Le PDF du message
         - Les pièces jointes (converties en PDF si possible)
         """
-        start = time.time()
+        start = time.perf_counter()
 
         if not EXTRACT_MSG_AVAILABLE:
             return ConversionResult(
                 status=ConversionStatus.FAILED,
                 source=source,
                 dest=None,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
                 message="extract_msg non installé",
             )
@@ -299,7 +369,7 @@ class MsgConverter(BaseConverter):
                     status=ConversionStatus.FAILED,
                     source=source,
                     dest=None,
-                    duration=time.time() - start,
+                    duration=time.perf_counter() - start,
                     method=self.name,
                     message=f"Fichier MSG malformé: {e}",
                     exception=e,
@@ -311,38 +381,8 @@ class MsgConverter(BaseConverter):
             except Exception:
                 pass
 
-            # Extraire les métadonnées
-            subject = getattr(msg, "subject", "") or ""
-            sender = getattr(msg, "sender", "") or ""
-            to = getattr(msg, "to", "") or ""
-
-            # Date peut être un datetime, un int (timestamp) ou une string
-            raw_date = getattr(msg, "date", None)
-            if raw_date is None:
-                date = ""
-            elif isinstance(raw_date, str):
-                date = raw_date
-            elif hasattr(raw_date, "strftime"):
-                # C'est un datetime
-                date = raw_date.strftime("%Y-%m-%d %H:%M:%S")
-            elif isinstance(raw_date, (int, float)):
-                # C'est un timestamp
-                from datetime import datetime
-                try:
-                    date = datetime.fromtimestamp(raw_date).strftime("%Y-%m-%d %H:%M:%S")
-                except (ValueError, OSError):
-                    date = str(raw_date)
-            else:
-                date = str(raw_date)
-
-            body = getattr(msg, "body", "") or ""
-
-            # Corps HTML
-            html_body = (
-                getattr(msg, "htmlBody", None)
-                or getattr(msg, "html", None)
-                or getattr(msg, "bodyHtml", None)
-            )
+            # Extraire les métadonnées et le corps (une seule lecture)
+            content = self._extract_content(msg)
 
             # Pièces jointes
             attachments = []
@@ -385,10 +425,7 @@ class MsgConverter(BaseConverter):
 
             # Si pas de pièces jointes, conversion simple
             if not attachments:
-                return self._convert_message_only(
-                    source, dest, start,
-                    subject, sender, to, date, body, html_body, []
-                )
+                return self._convert_message_only(source, dest, start, content, [])
 
             # Avec pièces jointes: créer un dossier
             self.logger.debug(f"  {len(attachments)} pièce(s) jointe(s) brute(s)")
@@ -404,7 +441,7 @@ class MsgConverter(BaseConverter):
                     status=ConversionStatus.SKIPPED_EXISTS,
                     source=source,
                     dest=output_folder,
-                    duration=time.time() - start,
+                    duration=time.perf_counter() - start,
                     method=self.name,
                     message="Dossier de sortie déjà existant",
                 )
@@ -431,8 +468,7 @@ class MsgConverter(BaseConverter):
             # Convertir le message lui-même
             message_pdf = output_folder / "_message.pdf"
             result = self._convert_message_only(
-                source, message_pdf, start,
-                subject, sender, to, date, body, html_body, attachments_info
+                source, message_pdf, start, content, attachments_info
             )
 
             if result.status == ConversionStatus.SUCCESS:
@@ -441,7 +477,7 @@ class MsgConverter(BaseConverter):
                     status=ConversionStatus.SUCCESS,
                     source=source,
                     dest=output_folder,
-                    duration=time.time() - start,
+                    duration=time.perf_counter() - start,
                     method=f"{self.name}_folder",
                     message=f"Dossier créé avec {len(attachments)} pièce(s) jointe(s)",
                 )
@@ -459,7 +495,7 @@ class MsgConverter(BaseConverter):
                 status=ConversionStatus.FAILED,
                 source=source,
                 dest=None,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
                 exception=e,
             )
@@ -473,6 +509,49 @@ class MsgConverter(BaseConverter):
                 except Exception:
                     pass
 
+    def _extract_content(self, msg: object) -> MessageContent:
+        """
+        Extrait les métadonnées et le corps d'un message ouvert.
+
+        Args:
+            msg: Objet extract_msg.Message
+
+        Returns:
+            MessageContent utilisé par tous les chemins de rendu
+        """
+        # Date peut être un datetime, un int (timestamp) ou une string
+        raw_date = getattr(msg, "date", None)
+        if raw_date is None:
+            date = ""
+        elif isinstance(raw_date, str):
+            date = raw_date
+        elif hasattr(raw_date, "strftime"):
+            # C'est un datetime
+            date = raw_date.strftime("%Y-%m-%d %H:%M:%S")
+        elif isinstance(raw_date, (int, float)):
+            # C'est un timestamp
+            from datetime import datetime
+            try:
+                date = datetime.fromtimestamp(raw_date).strftime("%Y-%m-%d %H:%M:%S")
+            except (ValueError, OSError):
+                date = str(raw_date)
+        else:
+            date = str(raw_date)
+
+        return MessageContent(
+            subject=getattr(msg, "subject", "") or "",
+            sender=getattr(msg, "sender", "") or "",
+            to=getattr(msg, "to", "") or "",
+            date=date,
+            body=getattr(msg, "body", "") or "",
+            # Corps HTML
+            html_body=(
+                getattr(msg, "htmlBody", None)
+                or getattr(msg, "html", None)
+                or getattr(msg, "bodyHtml", None)
+            ),
+        )
+
     def _process_attachments(
         self,
         attachments: list,
@@ -596,12 +675,7 @@ class MsgConverter(BaseConverter):
         source: Path,
         dest: Path,
         start: float,
-        subject: str,
-        sender: str,
-        to: str,
-        date: str,
-        body: str,
-        html_body: str | bytes | None,
+        content: MessageContent,
         attachments_info: list[str],
     ) -> ConversionResult:
         """Convertit uniquement le corps du message en PDF."""
@@ -611,6 +685,7 @@ class MsgConverter(BaseConverter):
             attachments_block = "\n\nPièces jointes:\n" + "\n".join(attachments_info)
 
         # Essayer HTML d'abord
+        html_body = content.html_body
         if html_body and isinstance(html_body, (str, bytes)):
             if isinstance(html_body, bytes):
                 try:
@@ -618,30 +693,24 @@ class MsgConverter(BaseConverter):
                 except UnicodeDecodeError:
                     html_body = html_body.decode('latin-1', errors='replace')
 
+            html_body = self._strip_html(html_body)
             if html_body.strip():
                 result = self._convert_html_message(
-                    source, dest, start,
-                    subject, sender, to, date, html_body, attachments_block
+                    source, dest, start, content, html_body, attachments_block
                 )
                 if result.status == ConversionStatus.SUCCESS:
                     return result
                 self.logger.debug("Conversion HTML échouée, fallback texte")
 
         # Fallback texte
-        return self._create_text_pdf(
-            source, dest, start,
-            subject, sender, to, date, body, attachments_block
-        )
+        return self._create_text_pdf(source, dest, start, content, attachments_block)
 
     def _convert_html_message(
         self,
         source: Path,
         dest: Path,
         start: float,
-        subject: str,
-        sender: str,
-        to: str,
-        date: str,
+        content: MessageContent,
         html_body: str,
         attachments_block: str,
     ) -> ConversionResult:
@@ -654,7 +723,7 @@ class MsgConverter(BaseConverter):
 <html>
 <head>
 <meta charset='utf-8'>
-<title>{self._escape_html(subject)}</title>
+<title>{self._escape_html(content.subject)}</title>
 <style>
   body {{
     font-family: Arial, sans-serif;
@@ -702,10 +771,10 @@ class MsgConverter(BaseConverter):
 <body>
 <div class="header">
 <h3>{self._escape_html(source.name)}</h3>
-<div><b>Objet:</b> {self._escape_html(subject)}</div>
-<div><b>De:</b> {self._escape_html(sender)}</div>
-<div><b>À:</b> {self._escape_html(to)}</div>
-<div><b>Date:</b> {self._escape_html(date)}</div>
+<div><b>Objet:</b> {self._escape_html(content.subject)}</div>
+<div><b>De:</b> {self._escape_html(content.sender)}</div>
+<div><b>À:</b> {self._escape_html(content.to)}</div>
+<div><b>Date:</b> {self._escape_html(content.date)}</div>
 </div>
 <hr/>
 {html_body}
@@ -729,7 +798,7 @@ class MsgConverter(BaseConverter):
                     status=ConversionStatus.SUCCESS,
                     source=source,
                     dest=dest,
-                    duration=time.time() - start,
+                    duration=time.perf_counter() - start,
                     method=f"{self.name}_html",
                 )
 
@@ -740,11 +809,16 @@ class MsgConverter(BaseConverter):
                 status=ConversionStatus.FAILED,
                 source=source,
                 dest=None,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
                 exception=e,
             )
 
+    def _strip_html(self, html: str) -> str:
+        """Supprime les scripts et redirections avant le rendu navigateur."""
+        html = _SCRIPT_RE.sub("", html)
+        return _META_REFRESH_RE.sub("", html)
+
     def _escape_html(self, text: str) -> str:
         """Échappe les caractères HTML."""
         if not text:
@@ -778,6 +852,22 @@ class MsgConverter(BaseConverter):
 
         return '\n'.join(wrapped_lines)
 
+    def _split_lines(self, text: str, chunk_lines: int | None = None) -> list[str]:
+        """
+        Découpe un texte en blocs de lignes.
+
+        Un seul Paragraph pour un corps de plusieurs milliers de lignes
+        rend la pagination ReportLab quadratique ; des blocs courts la
+        gardent linéaire.
+        """
+        if chunk_lines is None:
+            chunk_lines = self.TEXT_CHUNK_LINES
+        lines = text.split('\n')
+        return [
+            '\n'.join(lines[i:i + chunk_lines])
+            for i in range(0, len(lines), chunk_lines)
+        ]
+
     def _escape_xml(self, text) -> str:
         """Échappe les caractères spéciaux XML pour ReportLab."""
         if text is None:
@@ -799,11 +889,7 @@ class MsgConverter(BaseConverter):
         source: Path,
         dest: Path,
         start: float,
-        subject: str,
-        sender: str,
-        to: str,
-        date: str,
-        body: str,
+        content: MessageContent,
         attachments: str,
     ) -> ConversionResult:
         """Crée un PDF texte avec word-wrap automatique."""
@@ -812,65 +898,44 @@ class MsgConverter(BaseConverter):
                 status=ConversionStatus.FAILED,
                 source=source,
                 dest=None,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
                 message="ReportLab non installé",
             )
 
         try:
-            styles = getSampleStyleSheet()
-
-            # Style pour le corps avec word-wrap
-            body_style = ParagraphStyle(
-                "BodyStyle",
-                parent=styles["Normal"],
-                fontName="Courier",
-                fontSize=9,
-                leading=11,
-                wordWrap='CJK',
-            )
+            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
 
-            # Style pour les en-têtes
-            header_style = ParagraphStyle(
-                "HeaderStyle",
-                parent=styles["Normal"],
-                fontSize=10,
-                leading=12,
-                wordWrap='CJK',
-            )
-
-            doc = SimpleDocTemplate(
-                str(dest),
-                pagesize=A4,
-                rightMargin=36,
-                leftMargin=36,
-                topMargin=36,
-                bottomMargin=36,
-            )
+            styles, body_style, header_style, doc_kwargs = _text_pdf_styles()
+            doc = SimpleDocTemplate(str(dest), **doc_kwargs)
 
             story = []
 
             # En-tête
             story.append(Paragraph(f"<b>{self._escape_xml(source.name)}</b>", styles["Heading2"]))
             story.append(Spacer(1, 6))
-            story.append(Paragraph(f"<b>Objet:</b> {self._escape_xml(subject)}", header_style))
-            story.append(Paragraph(f"<b>De:</b> {self._escape_xml(sender)}", header_style))
-            story.append(Paragraph(f"<b>À:</b> {self._escape_xml(self._wrap_long_lines(to, 80))}", header_style))
-            story.append(Paragraph(f"<b>Date:</b> {self._escape_xml(date)}", header_style))
+            # Un seul Paragraph pour les champs d'en-tête (un seul passage du parser)
+            header_html = "<br/>".join([
+                f"<b>Objet:</b> {self._escape_xml(content.subject)}",
+                f"<b>De:</b> {self._escape_xml(content.sender)}",
+                f"<b>À:</b> {self._escape_xml(self._wrap_long_lines(content.to, 80))}",
+                f"<b>Date:</b> {self._escape_xml(content.date)}",
+            ])
+            story.append(Paragraph(header_html, header_style))
             story.append(Spacer(1, 12))
 
-            # Corps
-            body_wrapped = self._wrap_long_lines(body, 95)
-            body_escaped = self._escape_xml(body_wrapped)
-            body_html = body_escaped.replace('\n', '<br/>')
-            story.append(Paragraph(body_html, body_style))
+            # Corps (découpé en blocs pour borner le coût de mise en page)
+            body_wrapped = self._wrap_long_lines(content.body, 95)
+            for chunk in self._split_lines(body_wrapped):
+                chunk_html = self._escape_xml(chunk).replace('\n', '<br/>')
+                story.append(Paragraph(chunk_html, body_style))
 
             # Pièces jointes
             if attachments:
                 story.append(Spacer(1, 12))
-                att_escaped = self._escape_xml(attachments)
-                att_html = att_escaped.replace('\n', '<br/>')
-                story.append(Paragraph(att_html, body_style))
+                for chunk in self._split_lines(attachments):
+                    chunk_html = self._escape_xml(chunk).replace('\n', '<br/>')
+                    story.append(Paragraph(chunk_html, body_style))
 
             doc.build(story)
 
@@ -879,7 +944,7 @@ class MsgConverter(BaseConverter):
                     status=ConversionStatus.SUCCESS,
                     source=source,
                     dest=dest,
-                    duration=time.time() - start,
+                    duration=time.perf_counter() - start,
                     method=f"{self.name}_text",
                 )
 
@@ -887,7 +952,7 @@ class MsgConverter(BaseConverter):
                 status=ConversionStatus.FAILED,
                 source=source,
                 dest=None,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
                 message="PDF non créé",
             )
@@ -897,7 +962,7 @@ class MsgConverter(BaseConverter):
                 status=ConversionStatus.FAILED,
                 source=source,
                 dest=None,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
                 exception=e,
             )
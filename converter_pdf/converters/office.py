@@ -15,6 +15,7 @@ from .base import BaseConverter, ConversionResult, ConversionStatus
 from ..com_utils import (
     WIN32COM_AVAILABLE,
     office_app_context,
+    set_app_properties,
     is_password_error,
     COMError,
     COMTimeoutError,
@@ -35,25 +36,67 @@ class OfficeWordConverter(BaseConverter):
 
     name = "office_word"
     supported_extensions = [".doc", ".docx", ".rtf", ".odt"]
+    thread_safe = False  # COM: une seule instance Office par processus
 
     def is_available(self) -> bool:
         """Vérifie que pywin32 est installé."""
         return WIN32COM_AVAILABLE
 
+    def _export_pdf(self, doc, dest_path: str) -> None:
+        """
+        Exporte le document ouvert en PDF.
+
+        Avec word_optimize_for_screen, utilise ExportAsFixedFormat2
+        (Word 2016+) optimisé écran : images rééchantillonnées et pas de
+        rastérisation des polices manquantes. Repli sur ExportAsFixedFormat
+        si la méthode n'existe pas.
+        """
+        optimize_for_screen = self.config.word_optimize_for_screen
+        export_args = dict(
+            OutputFileName=dest_path,
+            ExportFormat=17,    # wdExportFormatPDF
+            OpenAfterExport=False,
+            OptimizeFor=1 if optimize_for_screen else 0,  # wdExportOptimizeForOnScreen / Print
+            Range=0,            # wdExportAllDocument
+            Item=0,             # wdExportDocumentContent
+            IncludeDocProps=True,
+            KeepIRM=True,
+            CreateBookmarks=1,  # wdExportCreateHeadingBookmarks
+            DocStructureTags=True,
+            BitmapMissingFonts=not optimize_for_screen,
+            UseISO19005_1=False,
+        )
+
+        if optimize_for_screen:
+            try:
+                doc.ExportAsFixedFormat2(OptimizeForImageQuality=False, **export_args)
+                self.logger.debug("ExportAsFixedFormat2 (écran) réussi")
+                return
+            except Exception as e:
+                self.logger.debug(f"ExportAsFixedFormat2 indisponible: {e}")
+
+        # Export PDF via ExportAsFixedFormat (méthode préférée)
+        doc.ExportAsFixedFormat(**export_args)
+        self.logger.debug("ExportAsFixedFormat réussi")
+
     def convert(self, source: Path, dest: Path) -> ConversionResult:
         """Convertit un document Word en PDF via COM."""
-        start = time.time()
+        start = time.perf_counter()
 
         if not self.is_available():
             return ConversionResult(
                 status=ConversionStatus.FAILED,
                 source=source,
                 dest=None,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
                 message="pywin32 non installé",
             )
 
+        # Chemins absolus calculés une seule fois pour les appels COM
+        source_path = str(source.absolute())
+        dest_path = str(dest.absolute())
+
         try:
             with office_app_context(
                 "Word.Application",
@@ -61,57 +104,58 @@ class OfficeWordConverter(BaseConverter):
             ) as word:
                 self.logger.debug("Word.Application créé (nouvelle instance)")
 
-                # Ouvrir le document en lecture seule
-                doc = word.Documents.Open(
-                    str(source.absolute()),
-                    ReadOnly=True,
-                    AddToRecentFiles=False,
-                    ConfirmConversions=False,
-                    NoEncodingDialog=True,
-                    # Mot de passe invalide pour détecter les fichiers protégés
-                    PasswordDocument="__INVALID__",
-                    WritePasswordDocument="__INVALID__",
-                    Revert=False,
-                    Visible=False,
-                )
-                self.logger.debug(f"Document ouvert: {source.name}")
+                # Pas de rafraîchissement écran ni de pagination en arrière-plan.
+                # La pagination est une option de l'utilisateur, elle est restaurée.
+                try:
+                    previous_pagination = word.Options.Pagination
+                except Exception:
+                    previous_pagination = None
+                set_app_properties(word, {
+                    "ScreenUpdating": False,
+                    "Options.Pagination": False,
+                }, logger=self.logger)
 
                 try:
-                    # Export PDF via ExportAsFixedFormat (méthode préférée)
-                    # 17 = wdExportFormatPDF
-                    doc.ExportAsFixedFormat(
-                        OutputFileName=str(dest.absolute()),
-                        ExportFormat=17,
-                        OpenAfterExport=False,
-                        OptimizeFor=0,      # wdExportOptimizeForPrint
-                        Range=0,            # wdExportAllDocument
-                        Item=0,             # wdExportDocumentContent
-                        IncludeDocProps=True,
-                        KeepIRM=True,
-                        CreateBookmarks=1,  # wdExportCreateHeadingBookmarks
-                        DocStructureTags=True,
-                        BitmapMissingFonts=True,
-                        UseISO19005_1=False,
+                    # Ouvrir le document en lecture seule
+                    doc = word.Documents.Open(
+                        source_path,
+                        ReadOnly=True,
+                        AddToRecentFiles=False,
+                        ConfirmConversions=False,
+                        NoEncodingDialog=True,
+                        # Mot de passe invalide pour détecter les fichiers protégés
+                        PasswordDocument="__INVALID__",
+                        WritePasswordDocument="__INVALID__",
+                        Revert=False,
+                        Visible=False,
                     )
-                    self.logger.debug("ExportAsFixedFormat réussi")
+                    self.logger.debug(f"Document ouvert: {source.name}")
 
-                except Exception as export_err:
-                    # Fallback: SaveAs2 avec FileFormat=17
-                    self.logger.debug(f"ExportAsFixedFormat échoué: {export_err}, essai SaveAs2")
                     try:
-                        if hasattr(doc, "SaveAs2"):
-                            doc.SaveAs2(str(dest.absolute()), FileFormat=17)
-                        else:
-                            doc.SaveAs(str(dest.absolute()), FileFormat=17)
-                        self.logger.debug("SaveAs2/SaveAs réussi")
-                    except Exception as save_err:
-                        raise export_err  # Relever l'erreur originale
-
+                        self._export_pdf(doc, dest_path)
+
+                    except Exception as export_err:
+                        # Fallback: SaveAs2 avec FileFormat=17
+                        self.logger.debug(f"ExportAsFixedFormat échoué: {export_err}, essai SaveAs2")
+                        try:
+                            if hasattr(doc, "SaveAs2"):
+                                doc.SaveAs2(dest_path, FileFormat=17)
+                            else:
+                                doc.SaveAs(dest_path, FileFormat=17)
+                            self.logger.debug("SaveAs2/SaveAs réussi")
+                        except Exception as save_err:
+                            raise export_err  # Relever l'erreur originale
+
+                    finally:
+                        doc.Close(False)
+                        self.logger.debug("Document fermé")
                 finally:
-                    doc.Close(False)
-                    self.logger.debug("Document fermé")
+                    if previous_pagination is not None:
+                        set_app_properties(word, {
+                            "Options.Pagination": previous_pagination,
+                        }, logger=self.logger)
 
-                duration = time.time() - start
+                duration = time.perf_counter() - start
                 return ConversionResult(
                     status=ConversionStatus.SUCCESS,
                     source=source,
@@ -121,7 +165,7 @@ class OfficeWordConverter(BaseConverter):
                 )
 
         except Exception as e:
-            duration = time.time() - start
+            duration = time.perf_counter() - start
 
             if is_password_error(e):
                 self.logger.warning(f"Document protégé par mot de passe: {source.name}")
@@ -162,24 +206,58 @@ class OfficeExcelConverter(BaseConverter):
 
     name = "office_excel"
     supported_extensions = [".xls", ".xlsx", ".xlsm", ".xlsb"]
+    thread_safe = False  # COM: une seule instance Office par processus
 
     def is_available(self) -> bool:
+        """Vérifie que pywin32 est installé."""
         return WIN32COM_AVAILABLE
 
+    def _hide_empty_sheets(self, wb) -> None:
+        """
+        Masque les feuilles vides avant l'export.
+
+        Les feuilles déjà masquées ne sont jamais exportées par Excel.
+        Au moins une feuille reste visible (exigence d'Excel). Le classeur
+        est fermé sans sauvegarde, le masquage n'est donc pas persisté.
+        """
+        try:
+            visible = [ws for ws in wb.Worksheets if ws.Visible == -1]  # xlSheetVisible
+            # Feuille vide: plage utilisée d'une seule cellule, elle-même
+            # vide (pas forcément A1), et aucune forme ni graphique
+            empty = [
+                ws for ws in visible
+                if ws.UsedRange.Count == 1
+                and ws.UsedRange.Cells(1, 1).Value is None
+                and ws.Shapes.Count == 0
+            ]
+            if len(empty) == len(visible):
+                empty = empty[1:]
+
+            for ws in empty:
+                ws.Visible = 0  # xlSheetHidden
+            if empty:
+                self.logger.debug(f"{len(empty)} feuille(s) vide(s) masquée(s)")
+        except Exception as e:
+            self.logger.debug(f"Détection des feuilles vides impossible: {e}")
+
     def convert(self, source: Path, dest: Path) -> ConversionResult:
         """Convertit un classeur Excel en PDF via COM."""
-        start = time.time()
+        start = time.perf_counter()
 
         if not self.is_available():
             return ConversionResult(
                 status=ConversionStatus.FAILED,
                 source=source,
                 dest=None,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
                 message="pywin32 non installé",
             )
 
+        # Chemins absolus calculés une seule fois pour les appels COM
+        source_path = str(source.absolute())
+        dest_path = str(dest.absolute())
+
         try:
             with office_app_context(
                 "Excel.Application",
@@ -187,15 +265,16 @@ class OfficeExcelConverter(BaseConverter):
             ) as excel:
                 self.logger.debug("Excel.Application créé (nouvelle instance)")
 
-                # Désactiver les mises à jour de liens
-                try:
-                    excel.AskToUpdateLinks = False
-                except AttributeError:
-                    pass
+                # Désactiver les mises à jour de liens et les événements
+                set_app_properties(excel, {
+                    "AskToUpdateLinks": False,
+                    "ScreenUpdating": False,
+                    "EnableEvents": False,
+                }, logger=self.logger)
 
                 # Ouvrir le classeur en lecture seule
                 wb = excel.Workbooks.Open(
-                    str(source.absolute()),
+                    source_path,
                     ReadOnly=True,
                     UpdateLinks=0,
                     Password="",
@@ -205,11 +284,25 @@ class OfficeExcelConverter(BaseConverter):
                 )
                 self.logger.debug(f"Classeur ouvert: {source.name}")
 
+                # Recalcul manuel (pas de recalcul des formules volatiles):
+                # Excel refuse Calculation tant qu'aucun classeur n'est ouvert.
+                # Le mode est une option de l'utilisateur, il est restauré.
                 try:
+                    previous_calculation = excel.Calculation
+                except Exception:
+                    previous_calculation = None
+                set_app_properties(excel, {
+                    "Calculation": -4135,  # xlCalculationManual
+                }, logger=self.logger)
+
+                try:
+                    if self.config.excel_skip_empty_sheets:
+                        self._hide_empty_sheets(wb)
+
                     # Export PDF (Type=0 = xlTypePDF)
                     wb.ExportAsFixedFormat(
                         Type=0,
-                        Filename=str(dest.absolute()),
+                        Filename=dest_path,
                         Quality=0,  # xlQualityStandard
                         IncludeDocProperties=True,
                         IgnorePrintAreas=False,
@@ -217,10 +310,14 @@ class OfficeExcelConverter(BaseConverter):
                     )
                     self.logger.debug("ExportAsFixedFormat réussi")
                 finally:
+                    if previous_calculation is not None:
+                        set_app_properties(excel, {
+                            "Calculation": previous_calculation,
+                        }, logger=self.logger)
                     wb.Close(False)
                     self.logger.debug("Classeur fermé")
 
-                duration = time.time() - start
+                duration = time.perf_counter() - start
                 return ConversionResult(
                     status=ConversionStatus.SUCCESS,
                     source=source,
@@ -230,7 +327,7 @@ class OfficeExcelConverter(BaseConverter):
                 )
 
         except Exception as e:
-            duration = time.time() - start
+            duration = time.perf_counter() - start
 
             if is_password_error(e):
                 self.logger.warning(f"Classeur protégé par mot de passe: {source.name}")
@@ -269,24 +366,30 @@ class OfficePowerPointConverter(BaseConverter):
 
     name = "office_powerpoint"
     supported_extensions = [".ppt", ".pptx"]
+    thread_safe = False  # COM: une seule instance Office par processus
 
     def is_available(self) -> bool:
+        """Vérifie que pywin32 est installé."""
         return WIN32COM_AVAILABLE
 
     def convert(self, source: Path, dest: Path) -> ConversionResult:
         """Convertit une présentation PowerPoint en PDF via COM."""
-        start = time.time()
+        start = time.perf_counter()
 
         if not self.is_available():
             return ConversionResult(
                 status=ConversionStatus.FAILED,
                 source=source,
                 dest=None,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
                 message="pywin32 non installé",
             )
 
+        # Chemins absolus calculés une seule fois pour les appels COM
+        source_path = str(source.absolute())
+        dest_path = str(dest.absolute())
+
         try:
             with office_app_context(
                 "PowerPoint.Application",
@@ -296,7 +399,7 @@ class OfficePowerPointConverter(BaseConverter):
 
                 # Ouvrir la présentation
                 presentation = ppt.Presentations.Open(
-                    str(source.absolute()),
+                    source_path,
                     ReadOnly=True,
                     Untitled=False,
                     WithWindow=False,
@@ -306,7 +409,7 @@ class OfficePowerPointConverter(BaseConverter):
                 try:
                     # Export PDF (32 = ppSaveAsPDF)
                     presentation.SaveAs(
-                        str(dest.absolute()),
+                        dest_path,
                         32,  # ppSaveAsPDF
                     )
                     self.logger.debug("SaveAs PDF réussi")
@@ -314,7 +417,7 @@ class OfficePowerPointConverter(BaseConverter):
                     presentation.Close()
                     self.logger.debug("Présentation fermée")
 
-                duration = time.time() - start
+                duration = time.perf_counter() - start
                 return ConversionResult(
                     status=ConversionStatus.SUCCESS,
                     source=source,
@@ -324,7 +427,7 @@ class OfficePowerPointConverter(BaseConverter):
                 )
 
         except Exception as e:
-            duration = time.time() - start
+            duration = time.perf_counter() - start
 
             if is_password_error(e):
                 self.logger.warning(f"Présentation protégée: {source.name}")
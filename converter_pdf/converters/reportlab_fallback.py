@@ -7,52 +7,149 @@ ne sont pas disponibles. Qualité réduite mais fonctionnel.
 
 from __future__ import annotations
 
+import functools
+import importlib.util
+import os
 import time
+import zipfile
 from pathlib import Path
 from typing import TYPE_CHECKING
+from xml.sax.saxutils import escape
 
 from .base import BaseConverter, ConversionResult, ConversionStatus
 
-# Import conditionnel de ReportLab
-try:
-    from reportlab.lib.pagesizes import A4
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib import colors
-    from reportlab.lib.units import cm
-    from reportlab.platypus import (
-        SimpleDocTemplate, Paragraph, Spacer, Preformatted, Table, TableStyle
-    )
-    REPORTLAB_AVAILABLE = True
-except ImportError:
-    REPORTLAB_AVAILABLE = False
-
-# Import conditionnel de python-docx
-try:
-    from docx import Document
-    PYTHON_DOCX_AVAILABLE = True
-except ImportError:
-    PYTHON_DOCX_AVAILABLE = False
-    Document = None  # type: ignore
-
-# Import conditionnel de pandas/openpyxl
-try:
-    import pandas as pd
-    PANDAS_AVAILABLE = True
-except ImportError:
-    PANDAS_AVAILABLE = False
-    pd = None  # type: ignore
+# Dépendances optionnelles détectées sans être importées : pandas seul
+# coûte plusieurs centaines de ms. Import différé à la première conversion.
+REPORTLAB_AVAILABLE = importlib.util.find_spec("reportlab") is not None
+PYTHON_DOCX_AVAILABLE = importlib.util.find_spec("docx") is not None
+PANDAS_AVAILABLE = importlib.util.find_spec("pandas") is not None
+OPENPYXL_AVAILABLE = importlib.util.find_spec("openpyxl") is not None
+# lxml : lecture directe du XML .docx
+LXML_AVAILABLE = importlib.util.find_spec("lxml") is not None
 
-try:
-    import openpyxl
-    OPENPYXL_AVAILABLE = True
-except ImportError:
-    OPENPYXL_AVAILABLE = False
+# Espace de noms WordprocessingML
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from ..config import Config
     from ..logger import ConverterLogger
 
 
+@functools.lru_cache(maxsize=None)
+def _word_styles() -> dict:
+    """
+    Construit une seule fois les styles ReportLab du fallback Word.
+
+    Returns:
+        Dictionnaire nom -> style de paragraphe ou de tableau (partagé, ne pas modifier)
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import TableStyle
+
+    styles = getSampleStyleSheet()
+    return {
+        "normal": ParagraphStyle(
+            "WordNormal",
+            parent=styles["Normal"],
+            fontName="Helvetica",
+            fontSize=11,
+            leading=14,
+            spaceAfter=6,
+        ),
+        "h1": ParagraphStyle(
+            "WordHeading1",
+            parent=styles["Heading1"],
+            fontName="Helvetica-Bold",
+            fontSize=16,
+            spaceAfter=12,
+            spaceBefore=12,
+            textColor=colors.HexColor("#2F5597"),
+        ),
+        "h2": ParagraphStyle(
+            "WordHeading2",
+            parent=styles["Heading2"],
+            fontName="Helvetica-Bold",
+            fontSize=14,
+            spaceAfter=10,
+            spaceBefore=10,
+            textColor=colors.HexColor("#2F5597"),
+        ),
+        "note": ParagraphStyle(
+            "Note",
+            parent=styles["Italic"],
+            fontSize=8,
+            textColor=colors.grey,
+            alignment=1,
+        ),
+        "table": TableStyle([
+            ("FONTNAME", (0, 0), (-1, -1), "Helvetica"),
+            ("FONTSIZE", (0, 0), (-1, -1), 9),
+            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#4472C4")),
+            ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+            ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+            ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#F2F2F2")]),
+            ("TOPPADDING", (0, 0), (-1, -1), 4),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+        ]),
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _excel_styles() -> dict:
+    """
+    Construit une seule fois les styles ReportLab du fallback Excel.
+
+    Returns:
+        Dictionnaire nom -> style de paragraphe ou de tableau (partagé, ne pas modifier)
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import TableStyle
+
+    styles = getSampleStyleSheet()
+    return {
+        "title": ParagraphStyle(
+            "ExcelTitle",
+            parent=styles["Title"],
+            fontName="Helvetica",
+            fontSize=14,
+            spaceAfter=15,
+        ),
+        "sheet": styles["Heading2"],
+        "info": ParagraphStyle(
+            "InfoStyle",
+            parent=styles["Italic"],
+            fontSize=8,
+            textColor=colors.grey,
+        ),
+        "table": TableStyle([
+            # En-têtes
+            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#4472C4")),
+            ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+            ("FONTSIZE", (0, 0), (-1, 0), 9),
+            ("ALIGN", (0, 0), (-1, 0), "CENTER"),
+            # Données
+            ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
+            ("FONTSIZE", (0, 1), (-1, -1), 8),
+            ("ALIGN", (0, 1), (-1, -1), "LEFT"),
+            # Grille
+            ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+            ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#F2F2F2")]),
+            # Padding
+            ("LEFTPADDING", (0, 0), (-1, -1), 4),
+            ("RIGHTPADDING", (0, 0), (-1, -1), 4),
+            ("TOPPADDING", (0, 0), (-1, -1), 3),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
+        ]),
+    }
+
+
 class ReportLabWordConverter(BaseConverter):
     """
     Convertisseur Word de secours via ReportLab + python-docx.
@@ -65,35 +162,39 @@ class ReportLabWordConverter(BaseConverter):
     supported_extensions = [".docx"]  # Uniquement .docx
 
     def is_available(self) -> bool:
-        """Vérifie que ReportLab et python-docx sont installés."""
-        return REPORTLAB_AVAILABLE and PYTHON_DOCX_AVAILABLE
+        """Vérifie que ReportLab et lxml (ou python-docx) sont installés."""
+        return REPORTLAB_AVAILABLE and (LXML_AVAILABLE or PYTHON_DOCX_AVAILABLE)
 
     def convert(self, source: Path, dest: Path) -> ConversionResult:
         """Convertit un document Word en PDF via ReportLab."""
-        start = time.time()
+        start = time.perf_counter()
 
         if not self.is_available():
             missing = []
             if not REPORTLAB_AVAILABLE:
                 missing.append("reportlab")
-            if not PYTHON_DOCX_AVAILABLE:
-                missing.append("python-docx")
+            if not (LXML_AVAILABLE or PYTHON_DOCX_AVAILABLE):
+                missing.append("lxml ou python-docx")
             return ConversionResult(
                 status=ConversionStatus.FAILED,
                 source=source,
                 dest=None,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
                 message=f"Modules manquants: {', '.join(missing)}",
             )
 
+        tmp = self._temp_path(dest)
         try:
-            self.logger.debug(f"Lecture Word avec python-docx: {source.name}")
-            doc = Document(source)
+            from reportlab.lib.pagesizes import A4
+            from reportlab.lib.units import cm
+            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table
+
+            paragraphs, tables = self._read_docx(source)
 
             # Configuration du PDF
             pdf_doc = SimpleDocTemplate(
-                str(dest),
+                str(tmp),
                 pagesize=A4,
                 leftMargin=2.5 * cm,
                 rightMargin=2.5 * cm,
@@ -101,74 +202,37 @@ class ReportLabWordConverter(BaseConverter):
                 bottomMargin=2.5 * cm,
             )
 
-            styles = getSampleStyleSheet()
-
-            # Styles personnalisés
-            style_normal = ParagraphStyle(
-                "WordNormal",
-                parent=styles["Normal"],
-                fontName="Helvetica",
-                fontSize=11,
-                leading=14,
-                spaceAfter=6,
-            )
-
-            style_heading1 = ParagraphStyle(
-                "WordHeading1",
-                parent=styles["Heading1"],
-                fontName="Helvetica-Bold",
-                fontSize=16,
-                spaceAfter=12,
-                spaceBefore=12,
-                textColor=colors.HexColor("#2F5597"),
-            )
-
-            style_heading2 = ParagraphStyle(
-                "WordHeading2",
-                parent=styles["Heading2"],
-                fontName="Helvetica-Bold",
-                fontSize=14,
-                spaceAfter=10,
-                spaceBefore=10,
-                textColor=colors.HexColor("#2F5597"),
-            )
-
+            styles = _word_styles()
             story = []
 
             # Titre du document
             title = source.stem.replace("_", " ")
-            story.append(Paragraph(title, style_heading1))
+            story.append(Paragraph(title, styles["h1"]))
             story.append(Spacer(1, 20))
 
             # Parcourir les paragraphes
-            for para in doc.paragraphs:
-                text = para.text.strip()
+            for style_name, text in paragraphs:
+                text = text.strip()
                 if text:
                     # Déterminer le style
-                    style_name = para.style.name if para.style else ""
-                    if style_name.startswith("Heading 1"):
-                        style = style_heading1
-                    elif style_name.startswith("Heading 2"):
-                        style = style_heading2
+                    style_name = style_name.lower()
+                    if style_name.startswith("heading 1"):
+                        style = styles["h1"]
+                    elif style_name.startswith("heading 2"):
+                        style = styles["h2"]
                     else:
-                        style = style_normal
+                        style = styles["normal"]
 
                     # Échapper les caractères spéciaux
-                    text_escaped = (
-                        text.replace("&", "&amp;")
-                        .replace("<", "&lt;")
-                        .replace(">", "&gt;")
-                    )
-
-                    story.append(Paragraph(text_escaped, style))
+                    story.append(Paragraph(escape(text), style))
 
             # Parcourir les tableaux
-            for table in doc.tables:
+            for table in tables:
                 table_data = []
-                for row in table.rows:
+                for row in table:
                     row_data = []
-                    for cell in row.cells:
-                        cell_text = cell.text.strip()
+                    for cell_text in row:
+                        cell_text = cell_text.strip()
                         if len(cell_text) > 100:
                             cell_text = cell_text[:97] + "..."
                         row_data.append(cell_text)
@@ -179,67 +243,130 @@ class ReportLabWordConverter(BaseConverter):
                     col_width = (A4[0] - 5 * cm) / num_cols
 
                     t = Table(table_data, colWidths=[col_width] * num_cols)
-                    t.setStyle(TableStyle([
-                        ("FONTNAME", (0, 0), (-1, -1), "Helvetica"),
-                        ("FONTSIZE", (0, 0), (-1, -1), 9),
-                        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#4472C4")),
-                        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                        ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                        ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
-                        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#F2F2F2")]),
-                        ("TOPPADDING", (0, 0), (-1, -1), 4),
-                        ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-                    ]))
+                    t.setStyle(styles["table"])
                     story.append(t)
                     story.append(Spacer(1, 12))
 
             # Note de conversion
-            note_style = ParagraphStyle(
-                "Note",
-                parent=styles["Italic"],
-                fontSize=8,
-                textColor=colors.grey,
-                alignment=1,
-            )
             story.append(Spacer(1, 30))
             story.append(Paragraph(
                 "Converti avec ReportLab (qualité réduite)",
-                note_style,
+                styles["note"],
             ))
 
             pdf_doc.build(story)
 
-            if dest.exists():
-                self.logger.debug("Conversion ReportLab Word réussie")
-                return ConversionResult(
-                    status=ConversionStatus.SUCCESS,
-                    source=source,
-                    dest=dest,
-                    duration=time.time() - start,
-                    method=self.name,
-                )
+            os.replace(tmp, dest)
 
+            self.logger.debug("Conversion ReportLab Word réussie")
             return ConversionResult(
-                status=ConversionStatus.FAILED,
+                status=ConversionStatus.SUCCESS,
                 source=source,
-                dest=None,
-                duration=time.time() - start,
+                dest=dest,
+                duration=time.perf_counter() - start,
                 method=self.name,
-                message="PDF non créé",
             )
 
         except Exception as e:
+            tmp.unlink(missing_ok=True)
             self.logger.error(f"Erreur ReportLab Word: {e}", exc=e)
             return ConversionResult(
                 status=ConversionStatus.FAILED,
                 source=source,
                 dest=None,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
                 exception=e,
             )
 
+    def _read_docx(
+        self,
+        source: Path,
+    ) -> tuple[list[tuple[str, str]], list[list[list[str]]]]:
+        """
+        Extrait paragraphes et tableaux d'un .docx.
+
+        Lit directement word/document.xml avec lxml si disponible
+        (beaucoup plus rapide), sinon passe par python-docx.
+
+        Args:
+            source: Fichier .docx
+
+        Returns:
+            Tuple (paragraphes [(nom du style, texte)], tableaux [lignes [cellules]])
+        """
+        if not LXML_AVAILABLE:
+            from docx import Document
+
+            self.logger.debug(f"Lecture Word avec python-docx: {source.name}")
+            doc = Document(source)
+            paragraphs = [
+                (para.style.name if para.style else "", para.text)
+                for para in doc.paragraphs
+            ]
+            tables = [
+                [[cell.text for cell in row.cells] for row in table.rows]
+                for table in doc.tables
+            ]
+            return paragraphs, tables
+
+        from lxml import etree
+
+        self.logger.debug(f"Lecture Word avec lxml: {source.name}")
+        parser = etree.XMLParser(resolve_entities=False)
+        with zipfile.ZipFile(source) as z:
+            document = etree.fromstring(z.read("word/document.xml"), parser)
+            try:
+                styles_xml = etree.fromstring(z.read("word/styles.xml"), parser)
+            except KeyError:
+                styles_xml = None
+
+        # styleId (ex: "Titre1") -> nom du style (ex: "heading 1")
+        style_names: dict[str, str] = {}
+        if styles_xml is not None:
+            for style in styles_xml.iterchildren(f"{_W}style"):
+                name = style.find(f"{_W}name")
+                if name is not None:
+                    style_names[style.get(f"{_W}styleId")] = name.get(f"{_W}val", "")
+
+        body = document.find(f"{_W}body")
+        if body is None:
+            return [], []
+
+        paragraphs = []
+        for p in body.iterchildren(f"{_W}p"):
+            p_style = p.find(f"{_W}pPr/{_W}pStyle")
+            style_id = p_style.get(f"{_W}val", "") if p_style is not None else ""
+            paragraphs.append((style_names.get(style_id, style_id), self._docx_text(p)))
+
+        tables = []
+        for tbl in body.iterchildren(f"{_W}tbl"):
+            rows = [
+                [
+                    "\n".join(self._docx_text(p) for p in tc.iterchildren(f"{_W}p"))
+                    for tc in tr.iterchildren(f"{_W}tc")
+                ]
+                for tr in tbl.iterchildren(f"{_W}tr")
+            ]
+            # Cellules fusionnées : compléter les lignes courtes
+            width = max((len(row) for row in rows), default=0)
+            tables.append([row + [""] * (width - len(row)) for row in rows if width])
+
+        return paragraphs, tables
+
+    @staticmethod
+    def _docx_text(p) -> str:
+        """Texte d'un paragraphe w:p (texte, tabulations, sauts de ligne)."""
+        parts = []
+        for el in p.iter(f"{_W}t", f"{_W}tab", f"{_W}br", f"{_W}cr"):
+            if el.tag == f"{_W}t":
+                parts.append(el.text or "")
+            elif el.tag == f"{_W}tab":
+                parts.append("\t")
+            else:
+                parts.append("\n")
+        return "".join(parts)
+
 
 class ReportLabExcelConverter(BaseConverter):
     """
@@ -257,7 +384,7 @@ class ReportLabExcelConverter(BaseConverter):
 
     def convert(self, source: Path, dest: Path) -> ConversionResult:
         """Convertit un classeur Excel en PDF via ReportLab."""
-        start = time.time()
+        start = time.perf_counter()
 
         if not self.is_available():
             missing = []
@@ -269,21 +396,35 @@ class ReportLabExcelConverter(BaseConverter):
                 status=ConversionStatus.FAILED,
                 source=source,
                 dest=None,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
                 message=f"Modules manquants: {', '.join(missing)}",
             )
 
+        tmp = self._temp_path(dest)
         try:
+            import pandas as pd
+            from reportlab.lib.pagesizes import A4
+            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table
+
             self.logger.debug(f"Lecture Excel avec pandas: {source.name}")
 
-            # Lire toutes les feuilles
+            # Traiter chaque feuille
+            max_rows = 100  # Limite pour éviter les PDF trop longs
+
+            # Lire toutes les feuilles en une seule ouverture du classeur,
+            # sans charger plus de lignes que nécessaire (+1 pour savoir
+            # si la feuille est tronquée)
             engine = "openpyxl" if OPENPYXL_AVAILABLE else None
-            excel_file = pd.ExcelFile(source, engine=engine)
+            with pd.ExcelFile(source, engine=engine) as excel_file:
+                sheets = [
+                    (sheet_name, excel_file.parse(sheet_name, nrows=max_rows + 1, na_filter=True))
+                    for sheet_name in excel_file.sheet_names
+                ]
 
             # Configuration du PDF
             pdf_doc = SimpleDocTemplate(
-                str(dest),
+                str(tmp),
                 pagesize=A4,
                 leftMargin=20,
                 rightMargin=20,
@@ -291,36 +432,19 @@ class ReportLabExcelConverter(BaseConverter):
                 bottomMargin=30,
             )
 
-            styles = getSampleStyleSheet()
+            styles = _excel_styles()
             story = []
 
             # Titre principal
-            title_style = ParagraphStyle(
-                "ExcelTitle",
-                parent=styles["Title"],
-                fontName="Helvetica",
-                fontSize=14,
-                spaceAfter=15,
-            )
-            story.append(Paragraph(source.name, title_style))
+            story.append(Paragraph(source.name, styles["title"]))
             story.append(Spacer(1, 10))
 
-            # Traiter chaque feuille
-            max_rows = 100  # Limite pour éviter les PDF trop longs
-
-            for sheet_name in excel_file.sheet_names:
-                df = pd.read_excel(
-                    source,
-                    sheet_name=sheet_name,
-                    engine=engine,
-                    na_filter=True,
-                )
-
+            for sheet_name, df in sheets:
                 if df.empty:
                     continue
 
                 # Titre de la feuille
-                story.append(Paragraph(f"Feuille: {sheet_name}", styles["Heading2"]))
+                story.append(Paragraph(f"Feuille: {sheet_name}", styles["sheet"]))
                 story.append(Spacer(1, 10))
 
                 # Préparer les données
@@ -336,18 +460,7 @@ class ReportLabExcelConverter(BaseConverter):
                 data.append(headers)
 
                 # Données (limitées)
-                df_display = df.head(max_rows)
-                for _, row in df_display.iterrows():
-                    row_data = []
-                    for val in row:
-                        if pd.isna(val) or str(val) == "nan":
-                            cell_text = ""
-                        else:
-                            cell_text = str(val)
-                            if len(cell_text) > 50:
-                                cell_text = cell_text[:47] + "..."
-                        row_data.append(cell_text)
-                    data.append(row_data)
+                data.extend(self._display_rows(df.head(max_rows)))
 
                 if len(data) > 1:
                     # Calculer les largeurs de colonnes
@@ -358,73 +471,64 @@ class ReportLabExcelConverter(BaseConverter):
 
                     # Créer le tableau
                     table = Table(data, colWidths=col_widths, repeatRows=1)
-                    table.setStyle(TableStyle([
-                        # En-têtes
-                        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#4472C4")),
-                        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                        ("FONTSIZE", (0, 0), (-1, 0), 9),
-                        ("ALIGN", (0, 0), (-1, 0), "CENTER"),
-                        # Données
-                        ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
-                        ("FONTSIZE", (0, 1), (-1, -1), 8),
-                        ("ALIGN", (0, 1), (-1, -1), "LEFT"),
-                        # Grille
-                        ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
-                        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#F2F2F2")]),
-                        # Padding
-                        ("LEFTPADDING", (0, 0), (-1, -1), 4),
-                        ("RIGHTPADDING", (0, 0), (-1, -1), 4),
-                        ("TOPPADDING", (0, 0), (-1, -1), 3),
-                        ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
-                    ]))
+                    table.setStyle(styles["table"])
 
                     story.append(table)
 
                     # Note si données tronquées
                     if len(df) > max_rows:
-                        info_style = ParagraphStyle(
-                            "InfoStyle",
-                            parent=styles["Italic"],
-                            fontSize=8,
-                            textColor=colors.grey,
-                        )
                         story.append(Spacer(1, 5))
                         story.append(Paragraph(
-                            f"* Affichage limité à {max_rows} lignes sur {len(df)}",
-                            info_style,
+                            f"* Affichage limité aux {max_rows} premières lignes",
+                            styles["info"],
                         ))
 
                 story.append(Spacer(1, 20))
 
+            # Les DataFrames ne servent plus : les libérer avant le rendu.
+            # build() retire chaque flowable de `story` une fois dessiné,
+            # la mémoire redescend donc au fil des pages.
+            sheets.clear()
+            df = None
             pdf_doc.build(story)
 
-            if dest.exists():
-                self.logger.debug("Conversion ReportLab Excel réussie")
-                return ConversionResult(
-                    status=ConversionStatus.SUCCESS,
-                    source=source,
-                    dest=dest,
-                    duration=time.time() - start,
-                    method=self.name,
-                )
+            os.replace(tmp, dest)
 
+            self.logger.debug("Conversion ReportLab Excel réussie")
             return ConversionResult(
-                status=ConversionStatus.FAILED,
+                status=ConversionStatus.SUCCESS,
                 source=source,
-                dest=None,
-                duration=time.time() - start,
+                dest=dest,
+                duration=time.perf_counter() - start,
                 method=self.name,
-                message="PDF non créé",
             )
 
         except Exception as e:
+            tmp.unlink(missing_ok=True)
             self.logger.error(f"Erreur ReportLab Excel: {e}", exc=e)
             return ConversionResult(
                 status=ConversionStatus.FAILED,
                 source=source,
                 dest=None,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
                 exception=e,
             )
+
+    def _display_rows(self, df: "pd.DataFrame") -> list[list[str]]:
+        """
+        Convertit les cellules en texte affichable (opérations par colonne).
+
+        Cellules vides (NaN/None/NaT) -> "", texte tronqué à 50 caractères.
+
+        Args:
+            df: Données de la feuille (déjà limitées)
+
+        Returns:
+            Lignes de cellules texte
+        """
+        display = df.astype(str).where(df.notna(), "")
+        display = display.apply(
+            lambda col: col.where(col.str.len() <= 50, col.str.slice(0, 47) + "...")
+        )
+        return display.values.tolist()
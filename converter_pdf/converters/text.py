@@ -7,26 +7,46 @@ police monospace et pagination.
 
 from __future__ import annotations
 
+import functools
+import importlib.util
+import os
 import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from .base import BaseConverter, ConversionResult, ConversionStatus
 
-# Import conditionnel de ReportLab
-try:
-    from reportlab.lib.pagesizes import A4
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Preformatted
-    REPORTLAB_AVAILABLE = True
-except ImportError:
-    REPORTLAB_AVAILABLE = False
+# ReportLab : détecté sans être importé (import différé à la première conversion)
+REPORTLAB_AVAILABLE = importlib.util.find_spec("reportlab") is not None
 
 if TYPE_CHECKING:
     from ..config import Config
     from ..logger import ConverterLogger
 
 
+@functools.lru_cache(maxsize=None)
+def _get_styles() -> dict:
+    """
+    Construit une seule fois les styles ReportLab du convertisseur texte.
+
+    Returns:
+        Dictionnaire nom -> style (partagé, ne pas modifier)
+    """
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+
+    styles = getSampleStyleSheet()
+    return {
+        "title": styles["Heading2"],
+        "mono": ParagraphStyle(
+            "MonoStyle",
+            parent=styles["Normal"],
+            fontName="Courier",
+            fontSize=9,
+            leading=11,
+        ),
+    }
+
+
 class TextConverter(BaseConverter):
     """
     Convertisseur de fichiers texte (.txt, .log) en PDF.
@@ -38,46 +58,37 @@ class TextConverter(BaseConverter):
     name = "text"
     supported_extensions = [".txt", ".log"]
 
+    # Nombre de lignes par bloc Preformatted
+    CHUNK_LINES = 500
+
     def is_available(self) -> bool:
         """Vérifie que ReportLab est installé."""
         return REPORTLAB_AVAILABLE
 
     def convert(self, source: Path, dest: Path) -> ConversionResult:
         """Convertit un fichier texte en PDF."""
-        start = time.time()
+        start = time.perf_counter()
 
         if not self.is_available():
             return ConversionResult(
                 status=ConversionStatus.FAILED,
                 source=source,
                 dest=None,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
                 message="ReportLab non installé (pip install reportlab)",
             )
 
+        tmp = self._temp_path(dest)
         try:
-            # Lire le contenu
-            self.logger.debug(f"Lecture du fichier texte: {source.name}")
-            try:
-                content = source.read_text(encoding="utf-8", errors="replace")
-            except Exception:
-                # Fallback encodage
-                content = source.read_text(encoding="latin-1", errors="replace")
-
-            # Créer les styles
-            styles = getSampleStyleSheet()
-            mono_style = ParagraphStyle(
-                "MonoStyle",
-                parent=styles["Normal"],
-                fontName="Courier",
-                fontSize=9,
-                leading=11,
-            )
+            from reportlab.lib.pagesizes import A4
+            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Preformatted
+
+            styles = _get_styles()
 
             # Créer le document
             doc = SimpleDocTemplate(
-                str(dest),
+                str(tmp),
                 pagesize=A4,
                 rightMargin=36,
                 leftMargin=36,
@@ -88,42 +99,44 @@ class TextConverter(BaseConverter):
             story = []
 
             # Titre (nom du fichier)
-            title_style = styles["Heading2"]
-            story.append(Paragraph(source.name, title_style))
+            story.append(Paragraph(source.name, styles["title"]))
             story.append(Spacer(1, 12))
 
-            # Contenu avec Preformatted (préserve les espaces et retours à la ligne)
-            story.append(Preformatted(content, mono_style))
+            # Contenu lu en flux, par blocs Preformatted (préserve les espaces
+            # et retours à la ligne sans charger tout le fichier d'un coup)
+            self.logger.debug(f"Lecture du fichier texte: {source.name}")
+            with source.open("r", encoding="utf-8", errors="replace") as f:
+                buffer: list[str] = []
+                for line in f:
+                    buffer.append(line)
+                    if len(buffer) >= self.CHUNK_LINES:
+                        story.append(Preformatted("".join(buffer), styles["mono"]))
+                        buffer = []
+                if buffer:
+                    story.append(Preformatted("".join(buffer), styles["mono"]))
 
             # Générer le PDF
             doc.build(story)
 
-            if not dest.exists():
-                return ConversionResult(
-                    status=ConversionStatus.FAILED,
-                    source=source,
-                    dest=None,
-                    duration=time.time() - start,
-                    method=self.name,
-                    message="PDF non créé",
-                )
+            os.replace(tmp, dest)
 
             self.logger.debug("Conversion texte réussie")
             return ConversionResult(
                 status=ConversionStatus.SUCCESS,
                 source=source,
                 dest=dest,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
             )
 
         except Exception as e:
+            tmp.unlink(missing_ok=True)
             self.logger.error(f"Erreur conversion texte: {e}", exc=e)
             return ConversionResult(
                 status=ConversionStatus.FAILED,
                 source=source,
                 dest=None,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
                 exception=e,
             )
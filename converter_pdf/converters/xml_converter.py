@@ -7,6 +7,9 @@ mise en forme du XML (coloration syntaxique basique).
 
 from __future__ import annotations
 
+import functools
+import importlib.util
+import os
 import time
 import xml.dom.minidom
 from pathlib import Path
@@ -14,21 +17,47 @@ from typing import TYPE_CHECKING
 
 from .base import BaseConverter, ConversionResult, ConversionStatus
 
-# Import conditionnel de ReportLab
-try:
-    from reportlab.lib.pagesizes import A4
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib import colors
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Preformatted
-    REPORTLAB_AVAILABLE = True
-except ImportError:
-    REPORTLAB_AVAILABLE = False
+# Dépendances optionnelles détectées sans être importées
+# (import différé à la première conversion)
+REPORTLAB_AVAILABLE = importlib.util.find_spec("reportlab") is not None
+# lxml : formatage rapide, sinon minidom
+LXML_AVAILABLE = importlib.util.find_spec("lxml") is not None
 
 if TYPE_CHECKING:
     from ..config import Config
     from ..logger import ConverterLogger
 
 
+@functools.lru_cache(maxsize=None)
+def _get_styles() -> dict:
+    """
+    Construit une seule fois les styles ReportLab du convertisseur XML.
+
+    Returns:
+        Dictionnaire nom -> style (partagé, ne pas modifier)
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+
+    styles = getSampleStyleSheet()
+    return {
+        "title": ParagraphStyle(
+            "XmlTitle",
+            parent=styles["Heading1"],
+            fontSize=16,
+            spaceAfter=30,
+            textColor=colors.darkblue,
+        ),
+        "code": ParagraphStyle(
+            "XmlCode",
+            parent=styles["Code"],
+            fontSize=8,
+            leftIndent=20,
+            fontName="Courier",
+        ),
+    }
+
+
 class XmlConverter(BaseConverter):
     """
     Convertisseur de fichiers XML en PDF.
@@ -40,25 +69,32 @@ class XmlConverter(BaseConverter):
     name = "xml"
     supported_extensions = [".xml"]
 
+    # Nombre de lignes par bloc Preformatted
+    CHUNK_LINES = 500
+
     def is_available(self) -> bool:
         """Vérifie que ReportLab est installé."""
         return REPORTLAB_AVAILABLE
 
     def convert(self, source: Path, dest: Path) -> ConversionResult:
         """Convertit un fichier XML en PDF."""
-        start = time.time()
+        start = time.perf_counter()
 
         if not self.is_available():
             return ConversionResult(
                 status=ConversionStatus.FAILED,
                 source=source,
                 dest=None,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
                 message="ReportLab non installé (pip install reportlab)",
             )
 
+        tmp = self._temp_path(dest)
         try:
+            from reportlab.lib.pagesizes import A4
+            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Preformatted
+
             # Lire le contenu XML
             self.logger.debug(f"Lecture du fichier XML: {source.name}")
             try:
@@ -68,37 +104,16 @@ class XmlConverter(BaseConverter):
 
             # Essayer de formater le XML pour une meilleure lisibilité
             try:
-                dom = xml.dom.minidom.parseString(xml_content)
-                xml_formatted = dom.toprettyxml(indent="  ")
-                # Supprimer les lignes vides
-                lines = [line for line in xml_formatted.split("\n") if line.strip()]
-                xml_formatted = "\n".join(lines)
+                xml_formatted = self._format_xml(xml_content)
             except Exception:
                 # Si le parsing échoue, garder le contenu original
                 xml_formatted = xml_content
 
-            # Créer les styles
-            styles = getSampleStyleSheet()
-
-            title_style = ParagraphStyle(
-                "XmlTitle",
-                parent=styles["Heading1"],
-                fontSize=16,
-                spaceAfter=30,
-                textColor=colors.darkblue,
-            )
-
-            code_style = ParagraphStyle(
-                "XmlCode",
-                parent=styles["Code"],
-                fontSize=8,
-                leftIndent=20,
-                fontName="Courier",
-            )
+            styles = _get_styles()
 
             # Créer le document
             doc = SimpleDocTemplate(
-                str(dest),
+                str(tmp),
                 pagesize=A4,
                 rightMargin=36,
                 leftMargin=36,
@@ -110,49 +125,71 @@ class XmlConverter(BaseConverter):
 
             # Titre
             title = f"Fichier XML: {source.name}"
-            story.append(Paragraph(title, title_style))
+            story.append(Paragraph(title, styles["title"]))
             story.append(Spacer(1, 12))
 
-            # Contenu XML
-            # Échapper les caractères spéciaux pour ReportLab
-            for line in xml_formatted.split("\n"):
-                if line.strip():
-                    line_escaped = (
-                        line.replace("&", "&amp;")
-                        .replace("<", "&lt;")
-                        .replace(">", "&gt;")
-                    )
-                    story.append(Preformatted(line_escaped, code_style))
+            # Contenu XML par blocs de lignes (un flowable par ligne rend la
+            # mise en page très coûteuse sur les gros fichiers).
+            # Preformatted affiche le texte tel quel : pas d'échappement.
+            lines = [line for line in xml_formatted.split("\n") if line.strip()]
+            for i in range(0, len(lines), self.CHUNK_LINES):
+                chunk = "\n".join(lines[i:i + self.CHUNK_LINES])
+                story.append(Preformatted(chunk, styles["code"]))
 
             # Générer le PDF
             doc.build(story)
 
-            if not dest.exists():
-                return ConversionResult(
-                    status=ConversionStatus.FAILED,
-                    source=source,
-                    dest=None,
-                    duration=time.time() - start,
-                    method=self.name,
-                    message="PDF non créé",
-                )
+            os.replace(tmp, dest)
 
             self.logger.debug("Conversion XML réussie")
             return ConversionResult(
                 status=ConversionStatus.SUCCESS,
                 source=source,
                 dest=dest,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
             )
 
         except Exception as e:
+            tmp.unlink(missing_ok=True)
             self.logger.error(f"Erreur conversion XML: {e}", exc=e)
             return ConversionResult(
                 status=ConversionStatus.FAILED,
                 source=source,
                 dest=None,
-                duration=time.time() - start,
+                duration=time.perf_counter() - start,
                 method=self.name,
                 exception=e,
             )
+
+    def _format_xml(self, xml_content: str) -> str:
+        """
+        Indente le XML (lxml si disponible, sinon minidom).
+
+        Args:
+            xml_content: Contenu XML brut
+
+        Returns:
+            XML indenté
+
+        Raises:
+            Exception: Si le XML est mal formé
+        """
+        if LXML_AVAILABLE:
+            from lxml import etree
+
+            # Le texte est déjà décodé : forcer l'encodage plutôt que
+            # celui de la déclaration XML. Pas de résolution d'entités externes.
+            parser = etree.XMLParser(
+                encoding="utf-8",
+                remove_blank_text=True,
+                resolve_entities=False,
+            )
+            root = etree.fromstring(xml_content.encode("utf-8"), parser)
+            return etree.tostring(root, pretty_print=True, encoding="unicode")
+
+        dom = xml.dom.minidom.parseString(xml_content)
+        xml_formatted = dom.toprettyxml(indent="  ")
+        # Supprimer les lignes vides
+        lines = [line for line in xml_formatted.split("\n") if line.strip()]
+        return "\n".join(lines)
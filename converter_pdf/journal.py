@@ -7,17 +7,57 @@ dans un fichier CSV pour traçabilité.
 
 from __future__ import annotations
 
+import atexit
 import csv
+import os
+import queue
+import threading
+import time
+import traceback
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from .config import Config
     from .logger import ConverterLogger
     from .converters.base import ConversionResult
 
 
+class NullJournal:
+    """
+    Journal désactivé : toutes les opérations sont sans effet.
+
+    Retourné par Journal() quand journal_enabled est False, pour éviter
+    tout test de configuration dans la boucle de traitement.
+    """
+
+    path = None
+
+    def open(self) -> None:
+        """Sans effet."""
+
+    def close(self) -> None:
+        """Sans effet."""
+
+    def flush(self) -> None:
+        """Sans effet."""
+
+    def log(self, result: "ConversionResult") -> None:
+        """Sans effet."""
+
+    def log_many(self, results: "Iterable[ConversionResult]") -> None:
+        """Sans effet."""
+
+    def __enter__(self) -> "NullJournal":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        pass
+
+
 class Journal:
     """
     Journal CSV pour tracer les conversions.
@@ -53,6 +93,29 @@ class Journal:
         "exception",
     ]
 
+    BUFFER_SIZE = 1 << 20
+    """Taille du tampon d'écriture (1 Mio) : les écritures disque suivent les flush"""
+
+    QUEUE_SIZE = 4096
+    """Lignes en attente pour le thread d'écriture (au-delà: l'appelant attend)"""
+
+    QUEUE_PUT_TIMEOUT = 5.0
+    """Attente (s) sur une file pleine avant d'avertir que le disque est lent"""
+
+    DRAIN_BATCH = 256
+    """Lignes retirées de la file par le thread d'écriture à chaque tour"""
+
+    def __new__(
+        cls,
+        config: "Config",
+        logger: "ConverterLogger",
+        output_dir: Path | None = None,
+    ):
+        """Retourne un NullJournal si le journal est désactivé."""
+        if not config.journal_enabled:
+            return NullJournal()
+        return super().__new__(cls)
+
     def __init__(
         self,
         config: "Config",
@@ -73,12 +136,19 @@ class Journal:
         self._file_handle = None
         self._writer = None
         self._path: Path | None = None
+        # Lignes en attente, écrites d'un bloc par writerows() dans flush()
+        self._row_buffer: list[list[str]] = []
+        self._flush_every = config.journal_flush_every
+        # Horodatage ISO mis en cache (précision à la seconde)
+        self._last_ts_epoch = 0
+        self._last_ts_str = ""
+        # Thread d'écriture alimenté par une file bornée (sauf fsync ligne à ligne)
+        self._queue: queue.Queue[list[str] | None] | None = None
+        self._thread: threading.Thread | None = None
+        self._write_lock = threading.Lock()
 
     def open(self) -> None:
         """Ouvre le fichier journal."""
-        if not self.config.journal_enabled:
-            return
-
         if self._file_handle is not None:
             return  # Déjà ouvert
 
@@ -92,9 +162,25 @@ class Journal:
                 "w",
                 newline="",
                 encoding="utf-8",
+                buffering=self.BUFFER_SIZE,
             )
             self._writer = csv.writer(self._file_handle)
             self._writer.writerow(self.COLUMNS)
+            self._file_handle.flush()
+            self._row_buffer.clear()
+            # Ne pas perdre les dernières lignes si close() n'est pas appelé
+            atexit.register(self.close)
+
+            # Écritures disque hors du thread de traitement. En mode fsync
+            # ligne à ligne, l'écriture reste synchrone (durabilité immédiate).
+            if not self.config.journal_fsync_every_row:
+                self._queue = queue.Queue(maxsize=self.QUEUE_SIZE)
+                self._thread = threading.Thread(
+                    target=self._writer_loop,
+                    name="converter_pdf-journal",
+                    daemon=True,
+                )
+                self._thread.start()
 
             self.logger.info(f"Journal ouvert: {self._path}")
 
@@ -107,8 +193,14 @@ class Journal:
     def close(self) -> None:
         """Ferme le fichier journal."""
         if self._file_handle is not None:
+            atexit.unregister(self.close)
+            if self._thread is not None:
+                self._queue.put(None)  # Sentinelle: fin du thread d'écriture
+                self._thread.join()
+                self._thread = None
+                self._queue = None
             try:
-                self._file_handle.flush()
+                self.flush()
                 self._file_handle.close()
                 self.logger.debug(f"Journal fermé: {self._path}")
             except Exception as e:
@@ -116,6 +208,65 @@ class Journal:
             finally:
                 self._file_handle = None
                 self._writer = None
+                self._row_buffer.clear()
+
+    def flush(self) -> None:
+        """Écrit sur disque les lignes en attente (y compris celles de la file)."""
+        if self._file_handle is None:
+            return
+        if self._queue is not None:
+            self._queue.join()
+        with self._write_lock:
+            self._write_rows()
+
+    def _write_rows(self) -> None:
+        """Écrit le tampon de lignes (appelé sous _write_lock)."""
+        if self._row_buffer:
+            self._writer.writerows(self._row_buffer)
+            self._row_buffer.clear()
+        self._file_handle.flush()
+        if self.config.journal_fsync_every_row:
+            os.fsync(self._file_handle.fileno())
+
+    def _buffer_rows(self, rows: list[list[str]]) -> None:
+        """Ajoute des lignes au tampon et l'écrit si le seuil est atteint."""
+        with self._write_lock:
+            self._row_buffer.extend(rows)
+            if len(self._row_buffer) >= self._flush_every:
+                self._write_rows()
+
+    def _writer_loop(self) -> None:
+        """Thread d'écriture: vide la file par lots jusqu'à la sentinelle."""
+        q = self._queue
+        while True:
+            rows: list[list[str]] = []
+            stop = False
+            item = q.get()
+            taken = 1
+            while True:
+                if item is None:
+                    stop = True
+                    break
+                rows.append(item)
+                if taken >= self.DRAIN_BATCH:
+                    break
+                try:
+                    item = q.get_nowait()
+                except queue.Empty:
+                    break
+                taken += 1
+
+            try:
+                if rows:
+                    self._buffer_rows(rows)
+            except Exception as e:
+                self.logger.error(f"Erreur écriture journal: {e}")
+            finally:
+                for _ in range(taken):
+                    q.task_done()
+
+            if stop:
+                return
 
     def log(self, result: "ConversionResult") -> None:
         """
@@ -124,56 +275,98 @@ class Journal:
         Args:
             result: Résultat de la conversion
         """
-        if not self.config.journal_enabled:
-            return
+        self.log_many((result,))
+
+    def log_many(self, results: "Iterable[ConversionResult]") -> None:
+        """
+        Enregistre plusieurs résultats de conversion.
+
+        Les lignes sont confiées au thread d'écriture, qui les écrit par
+        lots de journal_flush_every (un seul writerows par lot).
 
+        Args:
+            results: Résultats de conversion
+        """
         # Ouvrir si pas encore fait
         if self._writer is None:
             self.open()
             if self._writer is None:
                 return  # Impossible d'ouvrir
 
-        # Filtrer selon la config (erreurs seulement ou tout)
-        if self.config.journal_errors_only:
-            if result.is_success or result.status.value == "skipped_exists":
-                return
-
         try:
-            # Formater l'exception
-            exception_str = ""
-            if result.exception:
-                try:
-                    import traceback
-                    exception_str = "".join(
-                        traceback.format_exception(
-                            type(result.exception),
-                            result.exception,
-                            result.exception.__traceback__,
-                        )
-                    ).strip()
-                except Exception:
-                    exception_str = str(result.exception)
-
-            row = [
-                datetime.now().isoformat(timespec="seconds"),
-                result.status.value,
-                result.source.suffix.lower().lstrip("."),
-                str(result.source),
-                str(result.dest) if result.dest else "",
-                f"{result.duration:.3f}",
-                result.method,
-                f"{result.source_size_mb:.3f}",
-                f"{result.dest_size_mb:.3f}",
-                result.message,
-                exception_str,
-            ]
-
-            self._writer.writerow(row)
-            self._file_handle.flush()  # Flush immédiat pour éviter les pertes
+            for result in results:
+                # Filtrer selon la config (erreurs seulement ou tout)
+                if self.config.journal_errors_only:
+                    if result.is_success or result.status.value in ("skipped_exists", "skipped_unchanged"):
+                        continue
+
+                row = self._row(result)
+                if self._queue is not None:
+                    # File pleine: attendre le thread d'écriture (contre-pression)
+                    # plutôt qu'écrire ici, ce qui doublerait les lignes en file
+                    try:
+                        self._queue.put(row, timeout=self.QUEUE_PUT_TIMEOUT)
+                    except queue.Full:
+                        self.logger.warning("Journal: écriture disque lente, attente de la file")
+                        self._queue.put(row)
+                    continue
+
+                if self.config.journal_fsync_every_row:
+                    with self._write_lock:
+                        self._row_buffer.append(row)
+                        self._write_rows()  # Durabilité ligne à ligne demandée
+                else:
+                    self._buffer_rows([row])
 
         except Exception as e:
             self.logger.error(f"Erreur écriture journal: {e}")
 
+    def _row(self, result: "ConversionResult") -> list[str]:
+        """Ligne CSV d'un résultat de conversion."""
+        # Formater l'exception
+        exception_str = ""
+        if result.exception:
+            exception_str = self._format_exception(result.exception)
+
+        return [
+            self._timestamp(),
+            result.status.value,
+            result.source.suffix.lower().lstrip("."),
+            str(result.source),
+            str(result.dest) if result.dest else "",
+            f"{result.duration:.3f}",
+            result.method,
+            f"{result.source_size_mb:.3f}",
+            f"{result.dest_size_mb:.3f}",
+            result.message,
+            exception_str,
+        ]
+
+    def _timestamp(self) -> str:
+        """Horodatage ISO de la seconde courante (recalculé une fois par seconde)."""
+        now = int(time.time())
+        if now != self._last_ts_epoch:
+            self._last_ts_str = datetime.fromtimestamp(now).isoformat(timespec="seconds")
+            self._last_ts_epoch = now
+        return self._last_ts_str
+
+    def _format_exception(self, exc: BaseException) -> str:
+        """
+        Formate une exception pour le journal.
+
+        Par défaut un résumé d'une ligne (type: message) ; la trace complète
+        (coûteuse : lecture des sources de chaque frame) seulement si
+        journal_full_traceback est activé.
+        """
+        if not self.config.journal_full_traceback:
+            return f"{type(exc).__name__}: {exc}"
+        try:
+            return "".join(
+                traceback.format_exception(type(exc), exc, exc.__traceback__)
+            ).strip()
+        except Exception:
+            return str(exc)
+
     @property
     def path(self) -> Path | None:
         """Chemin du fichier journal."""
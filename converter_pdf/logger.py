@@ -8,16 +8,46 @@ Fournit un logging multi-niveaux avec:
 - Format structuré pour debug efficace
 """
 
+import atexit
 import logging
+import os
+import queue
+import re
 import sys
+import threading
+import time
 from contextlib import contextmanager
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Any
 
 
-class ColoredFormatter(logging.Formatter):
+class _CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter qui met en cache l'horodatage de la seconde courante.
+
+    Avec un datefmt à la seconde, strftime n'est appelé qu'une fois par
+    seconde au lieu d'une fois par record.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._ts_cache: tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        if not datefmt:
+            # Format par défaut avec millisecondes: pas de cache possible
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, cached = self._ts_cache
+        if second != cached_second:
+            cached = time.strftime(datefmt, self.converter(second))
+            self._ts_cache = (second, cached)
+        return cached
+
+
+class ColoredFormatter(_CachedTimeFormatter):
     """Formatter avec couleurs ANSI pour la console."""
 
     COLORS = {
@@ -30,45 +60,97 @@ class ColoredFormatter(logging.Formatter):
     RESET = "\033[0m"
     BOLD = "\033[1m"
 
+    # Champ %(levelname)s du format, avec alignement éventuel (ex: %(levelname)-7s)
+    _LEVELNAME_FIELD = re.compile(r"%\(levelname\)(-?\d*)s")
+
     def __init__(self, fmt: str | None = None, include_colors: bool = True):
         super().__init__(fmt)
         self.include_colors = include_colors
+        # isatty() est un appel système: évalué une seule fois
+        self._is_tty = include_colors and sys.stdout.isatty()
+        # Un format par niveau avec le nom du niveau déjà coloré
+        self._level_styles: dict[int, logging.PercentStyle] = {}
+        if self._is_tty:
+            for level, color in self.COLORS.items():
+                level_fmt = self._LEVELNAME_FIELD.sub(
+                    lambda m, level=level, color=color: self._colored_levelname(
+                        level, color, m.group(1)
+                    ),
+                    self._fmt,
+                )
+                self._level_styles[level] = logging.PercentStyle(level_fmt)
+
+    def _colored_levelname(self, level: int, color: str, width: str) -> str:
+        """Nom du niveau aligné puis coloré (texte littéral pour le format)."""
+        name = logging.getLevelName(level)
+        padded = f"%{width}s" % name
+        colored = padded.replace(name, f"{color}{self.BOLD}{name}{self.RESET}", 1)
+        return colored.replace("%", "%%")
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        return self._level_styles.get(record.levelno, self._style).format(record)
+
+
+class _FastRotatingHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler avec compteur d'octets en mémoire.
+
+    Le handler standard formate chaque record deux fois et interroge la
+    position du fichier (seek/tell) à chaque écriture pour décider de la
+    rotation. Ici la taille est suivie par un compteur (en caractères,
+    donc approximatif pour l'UTF-8) initialisé depuis la taille du fichier.
+    Le fichier est ouvert avec un tampon de 64 Kio, vidé par flush() (appelé
+    périodiquement par ConverterLogger.flush()) ou dès un record ERROR,
+    plutôt qu'à chaque record.
+    """
 
-    def format(self, record: logging.LogRecord) -> str:
-        # Ajouter le contexte fichier si présent
-        file_context = getattr(record, "current_file", None)
-        if file_context:
-            record.file_ctx = f"[{file_context}] "
-        else:
-            record.file_ctx = ""
-
-        # Formater le message de base
-        message = super().format(record)
-
-        # Ajouter les couleurs si activées
-        if self.include_colors and sys.stdout.isatty():
-            color = self.COLORS.get(record.levelno, "")
-            level_name = record.levelname
-            # Colorer uniquement le niveau
-            message = message.replace(
-                level_name,
-                f"{color}{self.BOLD}{level_name}{self.RESET}",
-                1
-            )
-
-        return message
+    STREAM_BUFFER_SIZE = 64 * 1024
+    """Tampon du fichier: vidé par flush(), à la fermeture ou dès un record ERROR"""
 
+    def __init__(self, filename: str | os.PathLike, *args: Any, **kwargs: Any):
+        super().__init__(filename, *args, **kwargs)
+        try:
+            self._bytes_written = os.path.getsize(self.baseFilename)
+        except OSError:
+            self._bytes_written = 0
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            encoding=self.encoding,
+            errors=self.errors,
+            buffering=self.STREAM_BUFFER_SIZE,
+        )
 
-class FileContextFilter(logging.Filter):
-    """Filter qui ajoute le contexte fichier aux records."""
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        # Décision prise dans emit() à partir du compteur
+        return False
 
-    def __init__(self, logger_instance: "ConverterLogger"):
-        super().__init__()
-        self.logger_instance = logger_instance
+    def doRollover(self) -> None:
+        super().doRollover()
+        self._bytes_written = 0
 
-    def filter(self, record: logging.LogRecord) -> bool:
-        record.current_file = self.logger_instance._current_file
-        return True
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            if (
+                self.maxBytes > 0
+                and self._bytes_written
+                and self._bytes_written + len(msg) >= self.maxBytes
+                and os.path.isfile(self.baseFilename)
+            ):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(msg)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+            self._bytes_written += len(msg)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 
 class ConverterLogger:
@@ -85,15 +167,50 @@ class ConverterLogger:
             logger.info("Conversion réussie", duration=2.3, method="office")
     """
 
+    # Attributs ajoutés aux records hors contexte fichier
+    _NO_FILE_CONTEXT = {"current_file": None, "file_ctx": ""}
+
     # Format par défaut
     DEFAULT_FORMAT = "%(asctime)s | %(levelname)-7s | %(file_ctx)s%(message)s"
     DEFAULT_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+    # Tampon du fichier de log: nombre de records et intervalle de vidage (s)
+    FILE_BUFFER_CAPACITY = 1024
+    FILE_FLUSH_INTERVAL = 1.0
+
     def __init__(self, name: str = "converter_pdf"):
         self.name = name
         self.logger = logging.getLogger(name)
-        self._current_file: str | None = None
+        # Contexte par thread: les fichiers traités en parallèle ne se mélangent pas
+        self._context = threading.local()
         self._setup_done = False
+        self._file_handler: RotatingFileHandler | None = None
+        self._file_buffer: MemoryHandler | None = None
+        self._flush_stop = threading.Event()
+        self._flush_thread: threading.Thread | None = None
+        self._queue_listener: QueueListener | None = None
+
+    @property
+    def _record_extra(self) -> dict[str, str | None]:
+        """
+        Attributs de contexte fichier pour les records du thread courant.
+
+        Passés en `extra` à Logger.log: calculés une fois par file_context
+        au lieu d'un filtre exécuté à chaque record.
+        """
+        return getattr(self._context, "extra", self._NO_FILE_CONTEXT)
+
+    @property
+    def _current_file(self) -> str | None:
+        """Nom du fichier en cours de traitement dans le thread courant."""
+        return self._record_extra["current_file"]
+
+    @_current_file.setter
+    def _current_file(self, value: str | None) -> None:
+        if value:
+            self._context.extra = {"current_file": value, "file_ctx": f"[{value}] "}
+        else:
+            self._context.extra = self._NO_FILE_CONTEXT
 
     def setup(
         self,
@@ -116,19 +233,22 @@ class ConverterLogger:
             console_colors: Activer les couleurs dans la console
         """
         if self._setup_done:
-            # Éviter la double configuration
+            # Éviter la double configuration (close() permet de reconfigurer)
             return
 
-        self.logger.setLevel(logging.DEBUG)  # Le logger accepte tout
-        self.logger.handlers.clear()  # Nettoyer les handlers existants
+        # Arrêter un éventuel thread de vidage ou fichier restant
+        self.close()
 
-        # Ajouter le filter de contexte fichier
-        context_filter = FileContextFilter(self)
-        self.logger.addFilter(context_filter)
+        # Le logger filtre au niveau le plus bas de ses handlers, ce qui
+        # permet à _log() d'ignorer les niveaux désactivés sans rien formater
+        console_level = getattr(logging, level.upper())
+        file_level = getattr(logging, log_file_level.upper())
+        self.logger.setLevel(min(console_level, file_level) if log_file else console_level)
+        self.logger.handlers.clear()  # Nettoyer les handlers existants
 
         # Handler console
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(getattr(logging, level.upper()))
+        console_handler.setLevel(console_level)
         console_formatter = ColoredFormatter(
             fmt=self.DEFAULT_FORMAT,
             include_colors=console_colors,
@@ -142,24 +262,112 @@ class ConverterLogger:
             log_file = Path(log_file)
             log_file.parent.mkdir(parents=True, exist_ok=True)
 
-            file_handler = RotatingFileHandler(
+            file_handler = _FastRotatingHandler(
                 log_file,
                 maxBytes=max_file_size,
                 backupCount=backup_count,
                 encoding="utf-8",
             )
-            file_handler.setLevel(getattr(logging, log_file_level.upper()))
-            file_formatter = logging.Formatter(
+            file_handler.setLevel(file_level)
+            file_formatter = _CachedTimeFormatter(
                 fmt=self.DEFAULT_FORMAT,
                 datefmt=self.DEFAULT_DATE_FORMAT,
             )
             file_handler.setFormatter(file_formatter)
-            self.logger.addHandler(file_handler)
+
+            # Écritures regroupées: vidage tous les FILE_BUFFER_CAPACITY records,
+            # toutes les FILE_FLUSH_INTERVAL secondes, ou immédiatement dès ERROR
+            file_buffer = MemoryHandler(
+                capacity=self.FILE_BUFFER_CAPACITY,
+                flushLevel=logging.ERROR,
+                target=file_handler,
+                flushOnClose=True,
+            )
+            file_buffer.setLevel(file_handler.level)
+            self.logger.addHandler(file_buffer)
+            self._file_handler = file_handler
+            self._file_buffer = file_buffer
+
+            self._flush_stop = threading.Event()
+            self._flush_thread = threading.Thread(
+                target=self._flush_loop,
+                name="converter_pdf-log-flush",
+                daemon=True,
+            )
+            self._flush_thread.start()
+            atexit.register(self.close)
 
             self.info(f"Fichier de log: {log_file}")
 
         self._setup_done = True
 
+    def close(self) -> None:
+        """
+        Arrête le thread de vidage et ferme le fichier de log.
+
+        Les records en attente sont écrits. Le logger peut ensuite être
+        reconfiguré par setup(). Appelé aussi à la sortie du programme.
+        """
+        self.stop_queue()
+        if self._flush_thread is not None:
+            self._flush_stop.set()
+            self._flush_thread.join()
+            self._flush_thread = None
+        atexit.unregister(self.close)
+
+        if self._file_buffer is not None:
+            self.logger.removeHandler(self._file_buffer)
+            self._file_buffer.close()  # flushOnClose: écrit le tampon
+            self._file_handler.close()
+            self._file_buffer = None
+            self._file_handler = None
+        self._setup_done = False
+
+    def start_queue(self) -> None:
+        """
+        Déporte le formatage et l'écriture des logs dans un thread dédié.
+
+        Les handlers configurés sont remplacés par un QueueHandler: les
+        threads de conversion ne font plus qu'empiler leurs records, un
+        QueueListener les formate et les écrit. À appeler autour d'un
+        traitement parallèle, suivi de stop_queue().
+        """
+        if self._queue_listener is not None or not self.logger.handlers:
+            return
+
+        handlers = list(self.logger.handlers)
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        for handler in handlers:
+            self.logger.removeHandler(handler)
+        self.logger.addHandler(QueueHandler(log_queue))
+        self._queue_listener.start()
+
+    def stop_queue(self) -> None:
+        """Écrit les records en attente et rétablit les handlers directs."""
+        listener = self._queue_listener
+        if listener is None:
+            return
+
+        listener.stop()  # Vide la file avant de rendre la main
+        for handler in list(self.logger.handlers):
+            if isinstance(handler, QueueHandler):
+                self.logger.removeHandler(handler)
+        for handler in listener.handlers:
+            self.logger.addHandler(handler)
+        self._queue_listener = None
+
+    def _flush_loop(self) -> None:
+        """Vide périodiquement le tampon du fichier de log (thread daemon)."""
+        while not self._flush_stop.wait(self.FILE_FLUSH_INTERVAL):
+            self.flush()
+
+    def flush(self) -> None:
+        """Écrit immédiatement les logs en attente dans le fichier."""
+        if self._file_buffer is not None:
+            self._file_buffer.flush()
+            self._file_handler.flush()
+
     @contextmanager
     def file_context(self, source_file: Path | str):
         """
@@ -182,38 +390,45 @@ class ConverterLogger:
         level: int,
         msg: str,
         exc: Exception | None = None,
-        **extra: Any,
+        extra: dict[str, Any] | None = None,
     ) -> None:
-        """Méthode interne de logging avec extras formatés."""
+        """
+        Méthode interne de logging avec extras formatés.
+
+        Le niveau est déjà vérifié par l'appelant: le record est créé via
+        Logger._log, sans repasser par les contrôles de Logger.log.
+        """
         # Formater les extras dans le message
         if extra:
             extras_str = ", ".join(f"{k}={v}" for k, v in extra.items())
             msg = f"{msg} ({extras_str})"
 
-        if exc:
-            self.logger.log(level, msg, exc_info=exc)
-        else:
-            self.logger.log(level, msg)
+        self.logger._log(level, msg, (), exc_info=exc, extra=self._record_extra)
 
     def debug(self, msg: str, **extra: Any) -> None:
         """Log niveau DEBUG - détails techniques pour debug."""
-        self._log(logging.DEBUG, msg, **extra)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._log(logging.DEBUG, msg, None, extra)
 
     def info(self, msg: str, **extra: Any) -> None:
         """Log niveau INFO - informations générales."""
-        self._log(logging.INFO, msg, **extra)
+        if self.logger.isEnabledFor(logging.INFO):
+            self._log(logging.INFO, msg, None, extra)
 
     def warning(self, msg: str, **extra: Any) -> None:
         """Log niveau WARNING - avertissements non bloquants."""
-        self._log(logging.WARNING, msg, **extra)
+        if self.logger.isEnabledFor(logging.WARNING):
+            self._log(logging.WARNING, msg, None, extra)
 
     def error(self, msg: str, exc: Exception | None = None, **extra: Any) -> None:
         """Log niveau ERROR - erreurs avec traceback optionnel."""
-        self._log(logging.ERROR, msg, exc=exc, **extra)
+        if self.logger.isEnabledFor(logging.ERROR):
+            self._log(logging.ERROR, msg, exc, extra)
 
     def critical(self, msg: str, exc: Exception | None = None, **extra: Any) -> None:
         """Log niveau CRITICAL - erreurs fatales."""
-        self._log(logging.CRITICAL, msg, exc=exc, **extra)
+        if self.logger.isEnabledFor(logging.CRITICAL):
+            self._log(logging.CRITICAL, msg, exc, extra)
 
     def success(self, msg: str, **extra: Any) -> None:
         """Log de succès (niveau INFO avec préfixe)."""
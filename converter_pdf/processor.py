@@ -7,13 +7,19 @@ et la coordination avec le rapport et le logger.
 
 from __future__ import annotations
 
+import itertools
+import os
+import queue
 import signal
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator, TypeVar
 
 from .config import Config
+from .journal import Journal, NullJournal
 from .logger import ConverterLogger
 from .report import SessionReport
 from .converters import get_converter_chain, ConversionResult, ConversionStatus
@@ -21,17 +27,154 @@ from .converters import get_converter_chain, ConversionResult, ConversionStatus
 if TYPE_CHECKING:
     from .converters.base import BaseConverter
 
+_T = TypeVar("_T")
+
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    # Fonctions kernel32 résolues une fois (instance WinDLL propre: les
+    # argtypes ne modifient pas ctypes.windll.kernel32 partagé)
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _GetFileAttributesW = _kernel32.GetFileAttributesW
+    _GetFileAttributesW.argtypes = (wintypes.LPCWSTR,)
+    _GetFileAttributesW.restype = wintypes.DWORD
+    _SetFileAttributesW = _kernel32.SetFileAttributesW
+    _SetFileAttributesW.argtypes = (wintypes.LPCWSTR, wintypes.DWORD)
+    _SetFileAttributesW.restype = wintypes.BOOL
+
+FILE_ATTRIBUTE_HIDDEN = 0x02
+INVALID_FILE_ATTRIBUTES = 0xFFFFFFFF
+
+
+# (unité, diviseur, décimales), indexé par tranche de 10 bits
+_UNITS = (
+    ("B", 1, 0),
+    ("KB", 1024, 1),
+    ("MB", 1024 * 1024, 1),
+    ("GB", 1024 * 1024 * 1024, 2),
+)
+
 
 def format_size(size_bytes: float) -> str:
     """Formate une taille en format lisible."""
-    if size_bytes < 1024:
-        return f"{size_bytes:.0f} B"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.1f} KB"
-    elif size_bytes < 1024 * 1024 * 1024:
-        return f"{size_bytes / (1024 * 1024):.1f} MB"
-    else:
-        return f"{size_bytes / (1024 * 1024 * 1024):.2f} GB"
+    index = min(max(int(size_bytes).bit_length() - 1, 0) // 10, len(_UNITS) - 1)
+    unit, divisor, precision = _UNITS[index]
+    return f"{size_bytes / divisor:.{precision}f} {unit}"
+
+
+def _sorted_entries(directory: str) -> Iterator[os.DirEntry]:
+    """Entrées d'un répertoire triées par nom (vide s'il est illisible)."""
+    try:
+        with os.scandir(directory) as entries:
+            listed = list(entries)
+    except OSError:
+        return iter(())
+    listed.sort(key=lambda entry: os.path.normcase(entry.name))
+    return iter(listed)
+
+
+def _iter_files(
+    directory: Path,
+    recursive: bool,
+    extensions: frozenset[str],
+) -> Iterator[tuple[Path, os.stat_result | None]]:
+    """
+    Parcourt les fichiers d'un répertoire dont l'extension est à traiter.
+
+    Parcours os.scandir: l'extension est testée sur le nom de l'entrée
+    avant toute création de Path, et is_file/is_dir utilisent les
+    informations déjà fournies par le système (pas de stat par entrée).
+    Le stat des fichiers retenus est pris une seule fois ici puis transmis
+    à process_file. Les répertoires illisibles sont ignorés, comme avec
+    Path.glob.
+
+    Générateur en profondeur d'abord: seul le répertoire en cours est
+    trié en mémoire, le premier fichier est produit sans attendre la fin
+    du parcours. Les entrées (fichiers et sous-répertoires) étant triées
+    par nom à chaque niveau, l'ordre obtenu est celui de
+    sorted(directory.glob(...)).
+
+    Args:
+        directory: Répertoire à parcourir
+        recursive: Descendre dans les sous-répertoires
+        extensions: Extensions acceptées (minuscules, avec le point)
+
+    Yields:
+        Couples (chemin, stat), stat à None s'il a échoué
+    """
+    stack = [_sorted_entries(os.fspath(directory))]
+    while stack:
+        entry = next(stack[-1], None)
+        if entry is None:
+            stack.pop()
+        elif recursive and entry.is_dir(follow_symlinks=False):
+            stack.append(_sorted_entries(entry.path))
+        elif os.path.splitext(entry.name)[1].lower() in extensions and entry.is_file():
+            try:
+                stat = entry.stat()
+            except OSError:
+                stat = None
+            yield Path(entry.path), stat
+
+
+# Fichiers lus à l'avance par le thread de parcours (borne mémoire)
+PREFETCH_SIZE = 256
+
+_PREFETCH_DONE = object()
+
+
+def _prefetch(items: Iterator[_T], size: int = PREFETCH_SIZE) -> Iterator[_T]:
+    """
+    Produit les éléments d'un itérateur calculés d'avance par un thread.
+
+    Le thread remplit une file bornée pendant que l'appelant traite les
+    éléments déjà produits (parcours et stat recouverts par la conversion).
+    Il s'arrête dès que l'appelant abandonne l'itération.
+
+    Args:
+        items: Itérateur à consommer dans le thread
+        size: Nombre maximum d'éléments en avance
+
+    Yields:
+        Les éléments de items, dans l'ordre
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=size)
+    closed = threading.Event()
+    errors: list[BaseException] = []
+
+    def put(item: object) -> bool:
+        while not closed.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put(item):
+                    return
+        except BaseException as e:
+            errors.append(e)
+        put(_PREFETCH_DONE)
+
+    threading.Thread(target=produce, name="converter_pdf-walk", daemon=True).start()
+    try:
+        while (item := buffer.get()) is not _PREFETCH_DONE:
+            yield item
+        if errors:
+            raise errors[0]
+    finally:
+        closed.set()
+
+
+def _file_size(item: tuple[Path, os.stat_result | None]) -> int:
+    """Taille d'un fichier listé par _iter_files (0 s'il est illisible)."""
+    stat = item[1]
+    return stat.st_size if stat is not None else 0
 
 
 class FileProcessor:
@@ -60,9 +203,19 @@ class FileProcessor:
         """
         self.config = config
         self.logger = logger
+        self._available: list[BaseConverter] = []
+        self._by_ext: dict[str, list[BaseConverter]] = {}
         self.converters = get_converter_chain(config, logger)
         self.report: SessionReport | None = None
-        self._interrupted = False
+        self.journal: Journal | NullJournal = NullJournal()
+        # Arrêt demandé (Ctrl+C): Event partagé avec les threads du pool
+        self._stop = threading.Event()
+        # Pool en cours (annulé par le gestionnaire de Ctrl+C)
+        self._executor: ThreadPoolExecutor | None = None
+        # Suppressions des sources (delete_source) déléguées à un thread
+        # pendant process_directory; None = suppression immédiate
+        self._delete_queue: queue.SimpleQueue | None = None
+        self._delete_thread: threading.Thread | None = None
 
         # Statistiques
         self.stats = {
@@ -77,40 +230,166 @@ class FileProcessor:
         # Dossiers déjà traités (pour éviter les boucles infinies)
         self._processed_folders: set[Path] = set()
 
+        # Traitement parallèle (config.workers > 1): verrou du rapport et
+        # noms de PDF réservés par les threads en cours
+        self._lock = threading.Lock()
+        self._reserved_dests: set[Path] = set()
+        # Dernier suffixe _N attribué par PDF en conflit: les conflits
+        # suivants reprennent au suivant au lieu de retester depuis _1
+        self._last_suffix: dict[Path, int] = {}
+
+        # Noms présents dans chaque répertoire de destination (os.path.normcase),
+        # lus une seule fois pendant process_directory (None = stat à chaque appel)
+        self._dest_cache: dict[Path, set[str]] | None = None
+        # Répertoires de destination déjà créés (un seul makedirs par répertoire)
+        self._ensured_dirs: set[Path] = set()
+
+    @property
+    def converters(self) -> list[BaseConverter]:
+        """Chaîne de convertisseurs, par ordre de priorité."""
+        return self._converters
+
+    @converters.setter
+    def converters(self, converters: list[BaseConverter]) -> None:
+        self._converters = converters
+        self.refresh_available()
+
+    def refresh_available(self) -> None:
+        """
+        Recalcule les convertisseurs disponibles.
+
+        is_available() est interrogé une fois par convertisseur au lieu
+        d'une fois par fichier. À rappeler si l'environnement change en
+        cours d'exécution (installation de LibreOffice, etc.).
+        """
+        self._available = [c for c in self._converters if c.is_available()]
+        self._by_ext = {}
+
+    def _converters_for(self, extension: str) -> list[BaseConverter]:
+        """Convertisseurs disponibles pour une extension (mémoïsé par extension)."""
+        ext = extension.lower()
+        converters = self._by_ext.get(ext)
+        if converters is None:
+            converters = [c for c in self._available if c.can_convert(ext)]
+            self._by_ext[ext] = converters
+        return converters
+
+    @property
+    def _interrupted(self) -> bool:
+        """Vrai si une interruption a été demandée."""
+        return self._stop.is_set()
+
+    @_interrupted.setter
+    def _interrupted(self, value: bool) -> None:
+        if value:
+            self._stop.set()
+        else:
+            self._stop.clear()
+
     def _setup_signal_handler(self) -> None:
         """Configure la gestion de Ctrl+C."""
         def signal_handler(signum, frame):
-            self._interrupted = True
+            # Seulement lever le drapeau: le handler s'exécute dans le thread
+            # principal, qui peut tenir un verrou du pool (submit). Les
+            # boucles de traitement annulent elles-mêmes le travail restant.
+            self._stop.set()
             self.logger.warning("Interruption demandée (Ctrl+C), arrêt propre...")
 
         signal.signal(signal.SIGINT, signal_handler)
 
-    def _hide_file(self, file_path: Path) -> None:
-        """
-        Rend un fichier caché (Windows uniquement).
-
-        Utilise l'attribut FILE_ATTRIBUTE_HIDDEN de Windows.
+    # Plateforme choisie à l'import: pas de test de sys.platform par fichier
+    if sys.platform == "win32":
+        def _hide_file(self, file_path: Path, stat: os.stat_result | None = None) -> None:
+            """
+            Rend un fichier caché (Windows uniquement).
+
+            Utilise l'attribut FILE_ATTRIBUTE_HIDDEN de Windows. Les attributs
+            existants sont conservés: ils sont lus dans le stat du parcours
+            quand il est fourni, sinon via GetFileAttributesW.
+
+            Args:
+                file_path: Chemin du fichier à cacher
+                stat: stat du fichier déjà obtenu (optionnel)
+            """
+            # Obtenir les attributs actuels
+            attrs = getattr(stat, "st_file_attributes", None)
+            if attrs is None:
+                attrs = _GetFileAttributesW(str(file_path))
+                if attrs == INVALID_FILE_ATTRIBUTES:
+                    raise OSError(f"Impossible de lire les attributs de {file_path}")
+
+            # Ajouter l'attribut caché
+            if not _SetFileAttributesW(str(file_path), attrs | FILE_ATTRIBUTE_HIDDEN):
+                raise OSError(f"Impossible de cacher {file_path}")
+    else:
+        def _hide_file(self, file_path: Path, stat: os.stat_result | None = None) -> None:
+            """Rend un fichier caché: sans effet hors Windows."""
+
+    def _start_deleter(self) -> None:
+        """Démarre le thread de suppression des sources."""
+        self._delete_queue = queue.SimpleQueue()
+        self._delete_thread = threading.Thread(
+            target=self._delete_loop,
+            args=(self._delete_queue,),
+            name="converter_pdf-delete",
+            daemon=True,
+        )
+        self._delete_thread.start()
+
+    def _stop_deleter(self) -> None:
+        """Attend la fin des suppressions en attente et arrête le thread."""
+        if self._delete_thread is None:
+            return
+        self._delete_queue.put(None)  # Sentinelle: fin du thread
+        self._delete_thread.join()
+        self._delete_queue = None
+        self._delete_thread = None
+
+    def _delete_loop(self, paths: queue.SimpleQueue) -> None:
+        """Thread de suppression: supprime les sources jusqu'à la sentinelle."""
+        while (source := paths.get()) is not None:
+            try:
+                os.unlink(source)
+            except OSError as e:
+                with self.logger.file_context(source):
+                    self.logger.warning(f"Impossible de supprimer le source: {e}")
 
-        Args:
-            file_path: Chemin du fichier à cacher
-        """
-        if sys.platform != "win32":
-            self.logger.debug("hide_source ignoré (non-Windows)")
+    def _delete_source(self, source: Path) -> None:
+        """Supprime un source, via le thread de suppression s'il est actif."""
+        if self._delete_queue is not None:
+            self._delete_queue.put(source)
+            self.logger.debug("Suppression du source planifiée")
             return
 
-        import ctypes
-        FILE_ATTRIBUTE_HIDDEN = 0x02
+        try:
+            os.unlink(source)
+            self.logger.debug("Fichier source supprimé")
+        except Exception as e:
+            self.logger.warning(f"Impossible de supprimer le source: {e}")
 
-        # Obtenir les attributs actuels
-        attrs = ctypes.windll.kernel32.GetFileAttributesW(str(file_path))
-        if attrs == -1:
-            raise OSError(f"Impossible de lire les attributs de {file_path}")
+    def _is_up_to_date(
+        self,
+        source: Path,
+        dest: Path,
+        source_stat: os.stat_result | None = None,
+    ) -> bool:
+        """
+        Vérifie si le PDF est plus récent que le fichier source.
+
+        Args:
+            source: Fichier source
+            dest: PDF existant
+            source_stat: stat du source déjà connu (évite un appel système)
 
-        # Ajouter l'attribut caché
-        new_attrs = attrs | FILE_ATTRIBUTE_HIDDEN
-        result = ctypes.windll.kernel32.SetFileAttributesW(str(file_path), new_attrs)
-        if not result:
-            raise OSError(f"Impossible de cacher {file_path}")
+        Returns:
+            True si le PDF n'a pas besoin d'être regénéré
+        """
+        try:
+            if source_stat is None:
+                source_stat = source.stat()
+            return dest.stat().st_mtime_ns >= source_stat.st_mtime_ns
+        except OSError:
+            return False
 
     def _get_dest_path(self, source: Path, dest_dir: Path | None) -> Path:
         """
@@ -125,8 +404,9 @@ class FileProcessor:
         """
         if dest_dir is None:
             dest_dir = source.parent
-        else:
-            dest_dir.mkdir(parents=True, exist_ok=True)
+        elif dest_dir not in self._ensured_dirs:
+            os.makedirs(dest_dir, exist_ok=True)
+            self._ensured_dirs.add(dest_dir)
 
         if self.config.keep_extension:
             # document.docx -> document.docx.pdf
@@ -137,10 +417,45 @@ class FileProcessor:
 
         return dest_dir / pdf_name
 
+    def _dest_exists(self, dest: Path) -> bool:
+        """
+        Vérifie si le PDF de destination existe.
+
+        Pendant process_directory, le répertoire de destination est lu une
+        seule fois (os.scandir) au lieu d'un stat par nom candidat.
+        """
+        if self._dest_cache is None:
+            return dest.exists()
+
+        names = self._dest_cache.get(dest.parent)
+        if names is None:
+            try:
+                with os.scandir(dest.parent) as entries:
+                    scanned = {os.path.normcase(entry.name) for entry in entries}
+            except OSError:
+                scanned = set()
+            names = self._dest_cache.setdefault(dest.parent, scanned)
+        return os.path.normcase(dest.name) in names
+
+    def _mark_dest_created(self, dest: Path) -> None:
+        """Enregistre un PDF créé dans le cache des répertoires de destination."""
+        if self._dest_cache is not None and dest.parent in self._dest_cache:
+            self._dest_cache[dest.parent].add(os.path.normcase(dest.name))
+
+    def _record_result(self, result: ConversionResult) -> None:
+        """Ajoute un résultat au rapport de session et au journal (thread-safe)."""
+        with self._lock:
+            if self.report:
+                self.report.add_result(result)
+            # Ligne construite (et horodatée) tout de suite: le journal
+            # regroupe lui-même les écritures disque
+            self.journal.log(result)
+
     def process_file(
         self,
         source: Path,
         dest_dir: Path | None = None,
+        stat: os.stat_result | None = None,
     ) -> ConversionResult:
         """
         Traite un fichier unique.
@@ -148,74 +463,99 @@ class FileProcessor:
         Args:
             source: Fichier source
             dest_dir: Répertoire de destination (optionnel)
+            stat: stat du source déjà obtenu lors du parcours (optionnel)
 
         Returns:
             Résultat de la conversion
         """
-        dest = self._get_dest_path(source, dest_dir)
+        ext = source.suffix.lower()
 
         # Taille du fichier source
         try:
-            source_size = source.stat().st_size
+            if stat is None:
+                stat = source.stat()
+            source_size = stat.st_size
             source_size_str = format_size(source_size)
         except OSError:
             source_size = 0
             source_size_str = "?"
 
         with self.logger.file_context(source):
-            # Vérifier si le fichier est déjà un PDF
-            if source.suffix.lower() == ".pdf":
-                if dest_dir is None or dest_dir == source.parent:
-                    self.logger.info(f"Ignoré (déjà PDF) : {source.name}")
-                    result = ConversionResult(
-                        status=ConversionStatus.SKIPPED_PDF,
-                        source=source,
-                        dest=None,
-                        duration=0,
-                        method="skip",
-                        message="Fichier déjà au format PDF",
-                    )
-                    if self.report:
-                        self.report.add_result(result)
-                    return result
-
-            # Vérifier si le PDF existe déjà
-            if dest.exists() and not self.config.force:
-                self.logger.info(f"Ignoré (existe) : {source.name} ({source_size_str})")
+            # Vérifier si le fichier est déjà un PDF (avant tout calcul de
+            # destination: pas de mkdir pour un fichier ignoré)
+            if ext == ".pdf" and (dest_dir is None or dest_dir == source.parent):
+                self.logger.info(f"Ignoré (déjà PDF) : {source.name}")
                 result = ConversionResult(
-                    status=ConversionStatus.SKIPPED_EXISTS,
+                    status=ConversionStatus.SKIPPED_PDF,
                     source=source,
-                    dest=dest,
+                    dest=None,
                     duration=0,
                     method="skip",
-                    message="PDF déjà existant",
+                    message="Fichier déjà au format PDF",
+                    source_size=source_size,
                 )
-                if self.report:
-                    self.report.add_result(result)
+                self._record_result(result)
                 return result
 
-            # Gérer les conflits de noms
-            if dest.exists() and self.config.force:
-                self.logger.debug(f"Remplacement: {dest.name}")
-            else:
-                counter = 1
-                original_dest = dest
-                while dest.exists():
-                    if self.config.keep_extension:
-                        pdf_name = f"{source.name}_{counter}.pdf"
-                    else:
-                        pdf_name = f"{source.stem}_{counter}.pdf"
-                    dest = (dest_dir or source.parent) / pdf_name
-                    counter += 1
+            dest = self._get_dest_path(source, dest_dir)
+
+            # Vérifier si le PDF existe déjà
+            replace_existing = self.config.force
+            if self._dest_exists(dest) and not self.config.force:
+                if not self.config.incremental:
+                    self.logger.info(f"Ignoré (existe) : {source.name} ({source_size_str})")
+                    result = ConversionResult(
+                        status=ConversionStatus.SKIPPED_EXISTS,
+                        source=source,
+                        dest=dest,
+                        duration=0,
+                        method="skip",
+                        message="PDF déjà existant",
+                        source_size=source_size,
+                    )
+                elif self._is_up_to_date(source, dest, stat):
+                    self.logger.info(f"Ignoré (inchangé) : {source.name} ({source_size_str})")
+                    result = ConversionResult(
+                        status=ConversionStatus.SKIPPED_UNCHANGED,
+                        source=source,
+                        dest=dest,
+                        duration=0,
+                        method="skip",
+                        message="PDF à jour",
+                        source_size=source_size,
+                    )
+                else:
+                    result = None
+                    replace_existing = True
+                    self.logger.debug(f"PDF obsolète, reconversion: {dest.name}")
+
+                if result is not None:
+                    self._record_result(result)
+                    return result
+
+            # Gérer les conflits de noms (sous verrou: en parallèle, deux
+            # sources de même nom ne doivent pas viser le même PDF)
+            with self._lock:
+                reserved = self._reserved_dests
+                exists = self._dest_exists(dest)
+                if exists and replace_existing and dest not in reserved:
+                    self.logger.debug(f"Remplacement: {dest.name}")
+                elif exists or dest in reserved:
+                    base = dest
+                    stem = source.name if self.config.keep_extension else source.stem
+                    for counter in itertools.count(self._last_suffix.get(base, 0) + 1):
+                        dest = base.parent / f"{stem}_{counter}.pdf"
+                        if not (self._dest_exists(dest) or dest in reserved):
+                            break
+                    self._last_suffix[base] = counter
+                if self.config.workers > 1:
+                    reserved.add(dest)
 
             # Mode dry-run: simuler sans convertir
             if self.config.dry_run:
                 # Trouver le convertisseur qui serait utilisé
-                converter_name = "none"
-                for converter in self.converters:
-                    if converter.can_convert(source.suffix) and converter.is_available():
-                        converter_name = converter.name
-                        break
+                candidates = self._converters_for(ext)
+                converter_name = candidates[0].name if candidates else "none"
 
                 self.logger.info(f"[DRY-RUN] {source.name} ({source_size_str}) -> {dest.name} [{converter_name}]")
                 result = ConversionResult(
@@ -225,26 +565,19 @@ class FileProcessor:
                     duration=0,
                     method=f"dry_run:{converter_name}",
                     message="Simulation (dry-run)",
+                    source_size=source_size,
                 )
-                if self.report:
-                    self.report.add_result(result)
+                self._record_result(result)
                 return result
 
             # Log de début de conversion avec infos
             self.logger.info(f"Conversion : {source.name} ({source_size_str})")
 
             # Essayer les convertisseurs en chaîne
-            start = time.time()
+            start_ns = time.perf_counter_ns()
             result: ConversionResult | None = None
 
-            for converter in self.converters:
-                if not converter.can_convert(source.suffix):
-                    continue
-
-                if not converter.is_available():
-                    self.logger.debug(f"{converter.name} non disponible, skip")
-                    continue
-
+            for converter in self._converters_for(ext):
                 self.logger.debug(f"Tentative avec {converter.name}")
                 result = converter.convert(source, dest)
 
@@ -272,7 +605,7 @@ class FileProcessor:
                     status=ConversionStatus.SKIPPED_UNSUPPORTED,
                     source=source,
                     dest=None,
-                    duration=time.time() - start,
+                    duration=(time.perf_counter_ns() - start_ns) / 1e9,
                     method="none",
                     message=f"Aucun convertisseur pour {source.suffix}",
                 )
@@ -287,28 +620,35 @@ class FileProcessor:
                     self.logger.debug(f"Exception détaillée: {result.exception}")
 
             # Ajouter au rapport
-            if self.report:
-                self.report.add_result(result)
+            self._record_result(result)
+
+            if result.is_success and result.dest:
+                self._mark_dest_created(result.dest)
 
             # Si la conversion a créé un dossier (archive/MSG), le mémoriser pour traitement ultérieur
-            if result.is_success and result.dest and result.dest.is_dir():
-                resolved_dest = result.dest.resolve()
-                if resolved_dest not in self._processed_folders:
-                    self._extracted_folders.append(resolved_dest)
-                    self.logger.debug(f"Dossier extrait à traiter: {result.dest}")
+            # (pas de stat pour les convertisseurs qui ne produisent que des PDF)
+            if (
+                result.is_success
+                and result.dest
+                and converter.produces_folder
+                and result.dest.is_dir()
+            ):
+                # Chemin absolu normalisé, sans résolution des liens (pas
+                # d'appel système par composant comme Path.resolve)
+                folder = Path(os.path.abspath(result.dest))
+                with self._lock:
+                    if folder not in self._processed_folders:
+                        self._extracted_folders.append(folder)
+                        self.logger.debug(f"Dossier extrait à traiter: {result.dest}")
 
             # Supprimer le source si demandé et succès
             if result.is_success and self.config.delete_source:
-                try:
-                    source.unlink()
-                    self.logger.debug("Fichier source supprimé")
-                except Exception as e:
-                    self.logger.warning(f"Impossible de supprimer le source: {e}")
+                self._delete_source(source)
 
             # Cacher le source si demandé et succès (Windows uniquement)
             if result.is_success and self.config.hide_source:
                 try:
-                    self._hide_file(source)
+                    self._hide_file(source, stat)
                     self.logger.debug("Fichier source caché")
                 except Exception as e:
                     self.logger.warning(f"Impossible de cacher le source: {e}")
@@ -318,8 +658,8 @@ class FileProcessor:
     def _process_single_directory(
         self,
         directory: Path,
-        pattern: str,
-        extensions: set[str],
+        recursive: bool,
+        extensions: frozenset[str],
         dest_dir: Path | None,
     ) -> None:
         """
@@ -327,29 +667,128 @@ class FileProcessor:
 
         Args:
             directory: Répertoire à traiter
-            pattern: Pattern glob (* ou **/*)
-            extensions: Extensions à traiter
+            recursive: Inclure les sous-répertoires
+            extensions: Extensions à traiter (minuscules)
             dest_dir: Répertoire de destination (optionnel)
         """
-        for file_path in sorted(directory.glob(pattern)):
+        files = _iter_files(directory, recursive, extensions)
+
+        if self.config.workers > 1 or dest_dir is not None:
+            # Liste complète avant traitement: nécessaire au tri du plus gros
+            # au plus petit, et évite de parcourir les PDF écrits dans un
+            # répertoire de sortie situé sous le répertoire traité
+            files = list(files)
+            self.logger.info(f"{len(files)} fichier(s) à traiter dans {directory}")
+            if self.config.workers > 1:
+                self._process_files_parallel(files, dest_dir)
+                return
+
+        else:
+            # Les PDF sont écrits à côté des sources, dans des répertoires
+            # déjà listés: la conversion commence pendant le parcours, qui se
+            # poursuit dans un thread
+            files = _prefetch(files)
+
+        count = 0
+        for file_path, stat in files:
             if self._interrupted:
                 break
 
-            if not file_path.is_file():
-                continue
+            count += 1
+            self.stats["total"] += 1
+            result = self.process_file(file_path, dest_dir, stat)
+            self._count_result(result)
 
-            if file_path.suffix.lower() not in extensions:
-                continue
+        if dest_dir is None:
+            files.close()  # Arrête le thread de parcours après une interruption
+            self.logger.info(f"{count} fichier(s) traité(s) dans {directory}")
+
+    def _count_result(self, result: ConversionResult) -> None:
+        """Met à jour les statistiques avec un résultat."""
+        if result.is_success:
+            self.stats["success"] += 1
+        elif result.is_skipped:
+            self.stats["skipped"] += 1
+        else:
+            self.stats["failed"] += 1
 
-            self.stats["total"] += 1
-            result = self.process_file(file_path, dest_dir)
+    def _is_thread_safe(self, extension: str) -> bool:
+        """Vrai si tous les convertisseurs utilisables pour l'extension sont thread-safe."""
+        return all(converter.thread_safe for converter in self._converters_for(extension))
 
-            if result.is_success:
-                self.stats["success"] += 1
-            elif result.is_skipped:
-                self.stats["skipped"] += 1
-            else:
-                self.stats["failed"] += 1
+    def _process_if_running(
+        self,
+        source: Path,
+        dest_dir: Path | None,
+        stat: os.stat_result | None = None,
+    ) -> ConversionResult | None:
+        """Traite un fichier sauf si une interruption a été demandée."""
+        if self._interrupted:
+            return None
+        return self.process_file(source, dest_dir, stat)
+
+    def _process_files_parallel(
+        self,
+        files: list[tuple[Path, os.stat_result | None]],
+        dest_dir: Path | None,
+    ) -> None:
+        """
+        Traite une liste de fichiers avec config.workers threads.
+
+        Les fichiers dont un convertisseur n'est pas thread-safe (COM,
+        LibreOffice) sont traités séquentiellement dans le thread principal
+        pendant que le pool traite les autres, soumis du plus gros au plus
+        petit pour ne pas finir sur un long fichier isolé. Les statistiques
+        ne sont mises à jour que depuis le thread principal.
+
+        Args:
+            files: Couples (fichier, stat) issus de _iter_files
+            dest_dir: Répertoire de destination (optionnel)
+        """
+        safe_by_ext: dict[str, bool] = {}
+        parallel: list[tuple[Path, os.stat_result | None]] = []
+        serial: list[tuple[Path, os.stat_result | None]] = []
+        for item in files:
+            ext = item[0].suffix.lower()
+            if ext not in safe_by_ext:
+                safe_by_ext[ext] = self._is_thread_safe(ext)
+            (parallel if safe_by_ext[ext] else serial).append(item)
+
+        parallel.sort(key=_file_size, reverse=True)
+
+        try:
+            with ThreadPoolExecutor(
+                max_workers=self.config.workers,
+                thread_name_prefix="converter_pdf",
+            ) as executor:
+                self._executor = executor
+                futures = []
+                for file_path, stat in parallel:
+                    if self._interrupted:
+                        break
+                    futures.append(
+                        executor.submit(self._process_if_running, file_path, dest_dir, stat)
+                    )
+
+                for file_path, stat in serial:
+                    if self._interrupted:
+                        break
+                    self.stats["total"] += 1
+                    self._count_result(self.process_file(file_path, dest_dir, stat))
+
+                for future in as_completed(futures):
+                    if self._interrupted:
+                        # Annuler les fichiers pas encore démarrés
+                        executor.shutdown(wait=False, cancel_futures=True)
+                    if future.cancelled():
+                        continue
+                    result = future.result()
+                    if result is None:  # Interrompu avant traitement
+                        continue
+                    self.stats["total"] += 1
+                    self._count_result(result)
+        finally:
+            self._executor = None
 
     def process_directory(
         self,
@@ -387,34 +826,51 @@ class FileProcessor:
         else:
             self.report = None
 
+        # Journal CSV (NullJournal si désactivé)
+        self.journal = Journal(self.config, self.logger, output_dir)
+
         # Réinitialiser les stats et les listes de dossiers
         self.stats = {"total": 0, "success": 0, "failed": 0, "skipped": 0}
         self._extracted_folders = []
         self._processed_folders = set()
+        self._reserved_dests = set()
+        self._last_suffix = {}
+        self._dest_cache = {}
+        self._ensured_dirs = set()
 
         # Afficher la configuration
         self._print_config(directory)
 
-        # Pattern de recherche
-        pattern = "**/*" if self.config.recursive else "*"
-        extensions = self.config.get_all_extensions()
+        # Extensions à traiter
+        extensions = frozenset(ext.lower() for ext in self.config.get_all_extensions())
 
         self.logger.info(f"Démarrage du traitement : {directory}")
         self.logger.info(f"Mode : {'récursif' if self.config.recursive else 'non récursif'}")
         print("")  # Ligne vide pour aérer
 
-        start_total = time.time()
+        start_total_ns = time.perf_counter_ns()
+
+        # En parallèle, les logs passent par une file écrite par un seul thread
+        if self.config.workers > 1:
+            self.logger.start_queue()
+        if self.config.delete_source and not self.config.dry_run:
+            self._start_deleter()
+        if self.config.hide_source and sys.platform != "win32":
+            self.logger.debug("hide_source ignoré (non-Windows)")
 
         try:
             # Traiter le répertoire initial
-            self._process_single_directory(directory, pattern, extensions, dest_dir)
+            self._process_single_directory(directory, self.config.recursive, extensions, dest_dir)
 
             # Traiter les dossiers extraits (archives/MSG) récursivement
             extraction_pass = 0
             while self._extracted_folders and not self._interrupted:
                 extraction_pass += 1
-                folders_to_process = self._extracted_folders.copy()
+                # Tri: un dossier passe avant ses sous-dossiers
+                folders_to_process = sorted(self._extracted_folders)
                 self._extracted_folders = []
+                # Préfixes des dossiers parcourus pendant cette passe
+                covered: list[str] = []
 
                 self.logger.info(f"\n--- Traitement des contenus extraits (passe {extraction_pass}) ---")
 
@@ -427,18 +883,32 @@ class FileProcessor:
                         self.logger.debug(f"Dossier déjà traité, ignoré: {folder}")
                         continue
 
+                    # Sous-dossier d'un dossier parcouru dans cette passe: il
+                    # existait déjà lors de ce parcours récursif, ses fichiers
+                    # ont été traités
+                    folder_str = os.fspath(folder)
+                    if folder_str.startswith(tuple(covered)):
+                        self.logger.debug(f"Dossier inclus dans un dossier déjà traité, ignoré: {folder}")
+                        self._processed_folders.add(folder)
+                        continue
+
                     self._processed_folders.add(folder)
+                    covered.append(os.path.join(folder_str, ""))
                     self.logger.info(f"Traitement du contenu extrait: {folder.name}/")
 
                     # Traiter ce dossier (toujours récursif pour les contenus extraits)
-                    self._process_single_directory(folder, "**/*", extensions, None)
+                    self._process_single_directory(folder, True, extensions, None)
 
         except KeyboardInterrupt:
             self.logger.warning("Interruption clavier")
         finally:
-            pass
+            self._stop_deleter()
+            if self.config.workers > 1:
+                self.logger.stop_queue()
+            self._dest_cache = None
+            self.journal.close()
 
-        duration_total = time.time() - start_total
+        duration_total = (time.perf_counter_ns() - start_total_ns) / 1e9
 
         # Finaliser et sauvegarder le rapport
         if self.report:
@@ -454,74 +924,88 @@ class FileProcessor:
 
     def _print_config(self, directory: Path) -> None:
         """Affiche la configuration de traitement."""
-        print("\n" + "=" * 80)
+        lines = ["", "=" * 80]
         if self.config.dry_run:
-            print("CONFIGURATION (MODE DRY-RUN - SIMULATION)")
+            lines.append("CONFIGURATION (MODE DRY-RUN - SIMULATION)")
         else:
-            print("CONFIGURATION")
-        print("=" * 80)
-        print(f"  Répertoire      : {directory}")
-        print(f"  Récursif        : {'Oui' if self.config.recursive else 'Non'}")
-        print(f"  Méthode         : {self.config.method}")
-        print(f"  Forcer          : {'Oui' if self.config.force else 'Non'}")
-        print(f"  Nommage PDF     : {'fichier.ext.pdf' if self.config.keep_extension else 'fichier.pdf'}")
-        print(f"  Suppr. source   : {'Oui' if self.config.delete_source else 'Non'}")
-        print(f"  Cacher source   : {'Oui' if self.config.hide_source else 'Non'}")
+            lines.append("CONFIGURATION")
+        lines += [
+            "=" * 80,
+            f"  Répertoire      : {directory}",
+            f"  Récursif        : {'Oui' if self.config.recursive else 'Non'}",
+            f"  Méthode         : {self.config.method}",
+            f"  Forcer          : {'Oui' if self.config.force else 'Non'}",
+            f"  Incrémental     : {'Oui' if self.config.incremental else 'Non'}",
+            f"  Nommage PDF     : {'fichier.ext.pdf' if self.config.keep_extension else 'fichier.pdf'}",
+            f"  Suppr. source   : {'Oui' if self.config.delete_source else 'Non'}",
+            f"  Cacher source   : {'Oui' if self.config.hide_source else 'Non'}",
+        ]
         if self.config.dry_run:
-            print(f"  Mode            : DRY-RUN (simulation)")
-        print(f"  Rapport         : Oui")
-        print(f"  Niveau log      : {self.config.log_level}")
+            lines.append("  Mode            : DRY-RUN (simulation)")
+        lines += [
+            "  Rapport         : Oui",
+            f"  Niveau log      : {self.config.log_level}",
+        ]
 
         # Convertisseurs disponibles
-        print("\n  Convertisseurs :")
+        lines += ["", "  Convertisseurs :"]
         for conv in self.converters:
-            status = "OK" if conv.is_available() else "Non disponible"
-            print(f"    - {conv.name}: {status}")
+            status = "OK" if conv in self._available else "Non disponible"
+            lines.append(f"    - {conv.name}: {status}")
 
-        print("=" * 80 + "\n")
+        lines += ["=" * 80, "", ""]
+        # Une seule écriture: pas d'entrelacement avec d'autres threads
+        sys.stdout.write("\n".join(lines))
 
     def _print_summary(self, duration: float) -> None:
         """Affiche le résumé du traitement."""
-        print("\n" + "=" * 80)
+        lines = ["", "=" * 80]
         if self.config.dry_run:
-            print("RÉSUMÉ (DRY-RUN - AUCUN FICHIER MODIFIÉ)")
+            lines.append("RÉSUMÉ (DRY-RUN - AUCUN FICHIER MODIFIÉ)")
         else:
-            print("RÉSUMÉ")
-        print("=" * 80)
+            lines.append("RÉSUMÉ")
+        lines.append("=" * 80)
 
         # Statistiques de base
-        print(f"  Durée totale      : {duration:.1f}s")
-        print(f"  Fichiers analysés : {self.stats['total']}")
+        lines += [
+            f"  Durée totale      : {duration:.1f}s",
+            f"  Fichiers analysés : {self.stats['total']}",
+        ]
 
         if self.stats['total'] > 0:
             success_pct = (self.stats['success'] / self.stats['total']) * 100
-            print(f"    - Convertis     : {self.stats['success']} ({success_pct:.0f}%)")
+            lines.append(f"    - Convertis     : {self.stats['success']} ({success_pct:.0f}%)")
         else:
-            print(f"    - Convertis     : 0")
+            lines.append("    - Convertis     : 0")
 
-        print(f"    - Ignorés       : {self.stats['skipped']}")
-        print(f"    - Échecs        : {self.stats['failed']}")
+        lines += [
+            f"    - Ignorés       : {self.stats['skipped']}",
+            f"    - Échecs        : {self.stats['failed']}",
+        ]
 
         # Statistiques de volume depuis le rapport
         if self.report and self.report.total_source_bytes > 0:
-            print("")
-            print(f"  Volume source     : {self.report._format_size(self.report.total_source_bytes)}")
-            print(f"  Volume PDF        : {self.report._format_size(self.report.total_dest_bytes)}")
+            lines += [
+                "",
+                f"  Volume source     : {self.report._format_size(self.report.total_source_bytes)}",
+                f"  Volume PDF        : {self.report._format_size(self.report.total_dest_bytes)}",
+            ]
             if self.report.total_dest_bytes > 0:
                 ratio = (self.report.total_dest_bytes / self.report.total_source_bytes) * 100
-                print(f"  Ratio             : {ratio:.0f}%")
+                lines.append(f"  Ratio             : {ratio:.0f}%")
 
         # Rapport
         if self.report:
             report_dir = self.report.output_directory or self.report.source_directory
             if report_dir:
-                print(f"\n  Rapport           : {report_dir}/conversion_report_*.txt")
+                lines += ["", f"  Rapport           : {report_dir}/conversion_report_*.txt"]
 
         # Conseils
         if self.stats["failed"] > 0:
-            print("\n  [!] Des fichiers ont échoué. Consultez le rapport pour les détails.")
+            lines += ["", "  [!] Des fichiers ont échoué. Consultez le rapport pour les détails."]
 
         if self.stats["skipped"] > 0 and not self.config.force:
-            print("\n  [i] Utilisez --force pour reconvertir les fichiers existants")
+            lines += ["", "  [i] Utilisez --force pour reconvertir les fichiers existants"]
 
-        print("=" * 80 + "\n")
+        lines += ["=" * 80, "", ""]
+        sys.stdout.write("\n".join(lines))
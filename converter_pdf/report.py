@@ -7,20 +7,62 @@ avec statistiques détaillées, erreurs et fichiers problématiques.
 
 from __future__ import annotations
 
+import heapq
+import os
 import traceback
-from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator
 
 if TYPE_CHECKING:
     from .converters.base import ConversionResult, ConversionStatus
 
 
-@dataclass
+# Séparateurs du rapport texte
+_SEP = "=" * 80
+_SEP_LIGHT = "-" * 80
+
+
+def _format_size(size_bytes: int) -> str:
+    """Formate une taille en bytes en format lisible."""
+    if size_bytes < 1024:
+        return f"{size_bytes} B"
+    elif size_bytes < 1024 * 1024:
+        return f"{size_bytes / 1024:.1f} KB"
+    elif size_bytes < 1024 * 1024 * 1024:
+        return f"{size_bytes / (1024 * 1024):.1f} MB"
+    else:
+        return f"{size_bytes / (1024 * 1024 * 1024):.2f} GB"
+
+
+def _format_exception(exception: BaseException) -> str:
+    """Formate une exception: type, message et traceback complète."""
+    tb_str = "".join(traceback.format_exception(
+        type(exception),
+        exception,
+        exception.__traceback__
+    ))
+    return f"{type(exception).__name__}: {exception}\n{tb_str}"
+
+
+def _format_duration(seconds: float) -> str:
+    """Formate une durée en format lisible."""
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    elif seconds < 3600:
+        mins = int(seconds // 60)
+        secs = seconds % 60
+        return f"{mins}m {secs:.0f}s"
+    else:
+        hours = int(seconds // 3600)
+        mins = int((seconds % 3600) // 60)
+        return f"{hours}h {mins}m"
+
+
+@dataclass(slots=True)
 class FileStats:
-    """Statistiques pour un type de fichier."""
+    """Statistiques pour un type de fichier (slots: pas de __dict__ par instance)."""
     count: int = 0
     success: int = 0
     failed: int = 0
@@ -52,11 +94,11 @@ class SessionReport:
     results: list["ConversionResult"] = field(default_factory=list)
 
     # Statistiques par type de fichier
-    stats_by_type: dict[str, FileStats] = field(default_factory=lambda: defaultdict(FileStats))
+    stats_by_type: dict[str, FileStats] = field(default_factory=dict)
 
     # Listes pour le rapport détaillé
     conversions: list[tuple[Path, Path, str, float]] = field(default_factory=list)  # (source, dest, method, duration)
-    errors: list[tuple[Path, str, str]] = field(default_factory=list)  # (path, reason, details)
+    errors: list[tuple[Path, str, BaseException | None]] = field(default_factory=list)  # (path, reason, exception)
     password_protected: list[Path] = field(default_factory=list)
     skipped_existing: list[Path] = field(default_factory=list)
 
@@ -65,6 +107,11 @@ class SessionReport:
     total_dest_bytes: int = 0
     total_duration: float = 0.0
 
+    # Compteurs globaux tenus à jour par add_result (lecture en O(1))
+    _success: int = field(default=0, init=False, repr=False)
+    _failed: int = field(default=0, init=False, repr=False)
+    _skipped: int = field(default=0, init=False, repr=False)
+
     def add_result(self, result: "ConversionResult") -> None:
         """
         Ajoute un résultat de conversion au rapport.
@@ -73,19 +120,30 @@ class SessionReport:
             result: Résultat de la conversion
         """
         self.results.append(result)
+        status = result.status.value
 
         # Extension du fichier
         ext = result.source.suffix.lower()
-        stats = self.stats_by_type[ext]
+        stats = self.stats_by_type.get(ext)
+        if stats is None:
+            stats = self.stats_by_type[ext] = FileStats()
         stats.count += 1
 
-        # Tailles
-        source_size = int(result.source_size_mb * 1024 * 1024)
-        dest_size = int(result.dest_size_mb * 1024 * 1024)
+        # Fichier non supporté: seulement compté (ni taille, ni durée,
+        # ni liste détaillée dans le rapport)
+        if status == "skipped_unsupported":
+            stats.skipped_unsupported += 1
+            self._skipped += 1
+            return
+
+        # Tailles (en octets, déjà mesurées par ConversionResult: un PDF
+        # absent a une taille nulle, sans nouveau stat ici)
+        source_size = result.source_size
         stats.source_size_bytes += source_size
         self.total_source_bytes += source_size
 
-        if result.dest and result.dest.exists():
+        if result.dest:
+            dest_size = result.dest_size
             stats.dest_size_bytes += dest_size
             self.total_dest_bytes += dest_size
 
@@ -94,65 +152,41 @@ class SessionReport:
         self.total_duration += result.duration
 
         # Status
-        status = result.status.value
         if status == "success":
             stats.success += 1
+            self._success += 1
             # Collecter les conversions réussies
             dest_path = result.dest if result.dest else result.source.with_suffix(result.source.suffix + ".pdf")
             self.conversions.append((result.source, dest_path, result.method, result.duration))
         elif status == "failed":
             stats.failed += 1
-            # Collecter les détails de l'erreur avec traceback complet
+            self._failed += 1
+            # L'exception est conservée telle quelle: la traceback n'est
+            # formatée que si le rapport est généré
             error_msg = result.message or "Erreur inconnue"
-            error_details = ""
-            if result.exception:
-                # Inclure le type d'exception et la traceback complète
-                exc_type = type(result.exception).__name__
-                exc_msg = str(result.exception)
-                # Obtenir la traceback si disponible
-                tb_str = "".join(traceback.format_exception(
-                    type(result.exception),
-                    result.exception,
-                    result.exception.__traceback__
-                ))
-                error_details = f"{exc_type}: {exc_msg}\n{tb_str}"
-            self.errors.append((result.source, error_msg, error_details))
-        elif status == "skipped_exists":
+            self.errors.append((result.source, error_msg, result.exception))
+        elif status in ("skipped_exists", "skipped_unchanged"):
             stats.skipped_exists += 1
+            self._skipped += 1
             self.skipped_existing.append(result.source)
         elif status == "skipped_password":
             stats.skipped_password += 1
+            self._skipped += 1
             self.password_protected.append(result.source)
-        elif status == "skipped_unsupported":
-            stats.skipped_unsupported += 1
 
     def finalize(self) -> None:
         """Finalise le rapport (appelé à la fin de la session)."""
         self.end_time = datetime.now()
 
-    def _format_size(self, size_bytes: int) -> str:
-        """Formate une taille en bytes en format lisible."""
-        if size_bytes < 1024:
-            return f"{size_bytes} B"
-        elif size_bytes < 1024 * 1024:
-            return f"{size_bytes / 1024:.1f} KB"
-        elif size_bytes < 1024 * 1024 * 1024:
-            return f"{size_bytes / (1024 * 1024):.1f} MB"
-        else:
-            return f"{size_bytes / (1024 * 1024 * 1024):.2f} GB"
-
-    def _format_duration(self, seconds: float) -> str:
-        """Formate une durée en format lisible."""
-        if seconds < 60:
-            return f"{seconds:.1f}s"
-        elif seconds < 3600:
-            mins = int(seconds // 60)
-            secs = seconds % 60
-            return f"{mins}m {secs:.0f}s"
-        else:
-            hours = int(seconds // 3600)
-            mins = int((seconds % 3600) // 60)
-            return f"{hours}h {mins}m"
+    # Tampon d'écriture du fichier rapport (octets)
+    WRITE_BUFFER_SIZE = 1024 * 1024
+
+    # Nombre maximal de types détaillés dans "DÉTAIL PAR TYPE"
+    TYPE_DETAIL_LIMIT = 50
+
+    # Formatage partagé avec le résumé console du processeur
+    _format_size = staticmethod(_format_size)
+    _format_duration = staticmethod(_format_duration)
 
     @property
     def total_files(self) -> int:
@@ -162,20 +196,17 @@ class SessionReport:
     @property
     def total_success(self) -> int:
         """Nombre de conversions réussies."""
-        return sum(s.success for s in self.stats_by_type.values())
+        return self._success
 
     @property
     def total_failed(self) -> int:
         """Nombre d'échecs."""
-        return sum(s.failed for s in self.stats_by_type.values())
+        return self._failed
 
     @property
     def total_skipped(self) -> int:
         """Nombre de fichiers ignorés."""
-        return sum(
-            s.skipped_exists + s.skipped_password + s.skipped_unsupported
-            for s in self.stats_by_type.values()
-        )
+        return self._skipped
 
     def generate(self) -> str:
         """
@@ -184,70 +215,85 @@ class SessionReport:
         Returns:
             Rapport formaté en texte
         """
-        lines = []
-        sep = "=" * 80
-        sep_light = "-" * 80
+        return "\n".join(self._iter_lines())
+
+    def _iter_lines(self) -> Iterator[str]:
+        """
+        Produit les lignes du rapport une à une (sans fin de ligne).
+
+        Utilisé par generate() et par save(), qui écrit au fil de l'eau
+        sans construire le rapport complet en mémoire.
+        """
+        sep = _SEP
+        sep_light = _SEP_LIGHT
 
         # En-tête
-        lines.append(sep)
-        lines.append(f"RAPPORT DE CONVERSION - {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(sep)
-        lines.append("")
+        yield from (
+            sep,
+            f"RAPPORT DE CONVERSION - {self.start_time:%Y-%m-%d %H:%M:%S}",
+            sep,
+            "",
+        )
 
         # Informations de session
-        lines.append("SESSION")
-        lines.append(sep_light)
+        yield from ("SESSION", sep_light)
         if self.source_directory:
-            lines.append(f"  Répertoire source  : {self.source_directory}")
+            yield f"  Répertoire source  : {self.source_directory}"
         if self.output_directory:
-            lines.append(f"  Répertoire sortie  : {self.output_directory}")
-        lines.append(f"  Mode récursif      : {'Oui' if self.recursive else 'Non'}")
+            yield f"  Répertoire sortie  : {self.output_directory}"
+        yield f"  Mode récursif      : {'Oui' if self.recursive else 'Non'}"
         if self.end_time:
             duration = (self.end_time - self.start_time).total_seconds()
-            lines.append(f"  Durée session      : {self._format_duration(duration)}")
-        lines.append("")
+            yield f"  Durée session      : {_format_duration(duration)}"
+        yield ""
 
         # Résumé global
-        lines.append("RÉSUMÉ")
-        lines.append(sep_light)
-        lines.append(f"  Fichiers analysés  : {self.total_files}")
-        if self.total_files > 0:
-            success_pct = (self.total_success / self.total_files) * 100
-            lines.append(f"  Convertis          : {self.total_success} ({success_pct:.0f}%)")
+        total_files = self.total_files
+        total_success = self.total_success
+        yield from ("RÉSUMÉ", sep_light, f"  Fichiers analysés  : {total_files}")
+        if total_files > 0:
+            success_pct = (total_success / total_files) * 100
+            yield f"  Convertis          : {total_success} ({success_pct:.0f}%)"
         else:
-            lines.append(f"  Convertis          : 0")
-        lines.append(f"  Ignorés            : {self.total_skipped}")
-        lines.append(f"    - Déjà existants : {len(self.skipped_existing)}")
-        lines.append(f"    - Mot de passe   : {len(self.password_protected)}")
-        lines.append(f"  Échecs             : {self.total_failed}")
-        lines.append("")
+            yield f"  Convertis          : 0"
+        yield from (
+            f"  Ignorés            : {self.total_skipped}",
+            f"    - Déjà existants : {len(self.skipped_existing)}",
+            f"    - Mot de passe   : {len(self.password_protected)}",
+            f"  Échecs             : {self.total_failed}",
+            "",
+        )
 
         # Statistiques de taille
         if self.total_source_bytes > 0:
-            lines.append("VOLUMES")
-            lines.append(sep_light)
-            lines.append(f"  Taille sources     : {self._format_size(self.total_source_bytes)}")
-            lines.append(f"  Taille PDF générés : {self._format_size(self.total_dest_bytes)}")
+            yield "VOLUMES"
+            yield sep_light
+            yield f"  Taille sources     : {_format_size(self.total_source_bytes)}"
+            yield f"  Taille PDF générés : {_format_size(self.total_dest_bytes)}"
             if self.total_dest_bytes > 0:
                 ratio = (self.total_dest_bytes / self.total_source_bytes) * 100
-                lines.append(f"  Ratio              : {ratio:.0f}%")
-            lines.append(f"  Temps conversion   : {self._format_duration(self.total_duration)}")
-            if self.total_success > 0:
-                avg_time = self.total_duration / self.total_success
-                lines.append(f"  Temps moyen/fichier: {avg_time:.2f}s")
-            lines.append("")
+                yield f"  Ratio              : {ratio:.0f}%"
+            yield f"  Temps conversion   : {_format_duration(self.total_duration)}"
+            if total_success > 0:
+                avg_time = self.total_duration / total_success
+                yield f"  Temps moyen/fichier: {avg_time:.2f}s"
+            yield ""
 
         # Détail par type de fichier
         if self.stats_by_type:
-            lines.append("DÉTAIL PAR TYPE")
-            lines.append(sep_light)
-
-            # Trier par nombre de fichiers décroissant
-            sorted_types = sorted(
-                self.stats_by_type.items(),
-                key=lambda x: x[1].count,
-                reverse=True
-            )
+            yield "DÉTAIL PAR TYPE"
+            yield sep_light
+
+            # Trier par nombre de fichiers décroissant (seuls les
+            # TYPE_DETAIL_LIMIT types les plus fréquents sont détaillés)
+            items = self.stats_by_type.items()
+            limit = self.TYPE_DETAIL_LIMIT
+            hidden_types = max(len(items) - limit, 0)
+            sort_key = lambda x: x[1].count
+            if hidden_types:
+                sorted_types = heapq.nlargest(limit, items, key=sort_key)
+            else:
+                sorted_types = sorted(items, key=sort_key, reverse=True)
 
             for ext, stats in sorted_types:
                 status_parts = []
@@ -261,62 +307,60 @@ class SessionReport:
                     status_parts.append(f"{stats.skipped_password} mdp")
 
                 status_str = ", ".join(status_parts) if status_parts else "aucun"
-                size_str = self._format_size(stats.source_size_bytes)
+                size_str = _format_size(stats.source_size_bytes)
 
-                lines.append(f"  {ext:8} : {stats.count:4} fichiers ({size_str:>10}) -> {status_str}")
+                yield f"  {ext:8} : {stats.count:4} fichiers ({size_str:>10}) -> {status_str}"
 
-            lines.append("")
+            if hidden_types:
+                yield f"  ... et {hidden_types} autre(s) type(s)"
+            yield ""
 
         # Détail des conversions réussies
         if self.conversions:
-            lines.append("CONVERSIONS RÉUSSIES")
-            lines.append(sep_light)
+            yield from ("CONVERSIONS RÉUSSIES", sep_light)
+            # Chemin relatif par simple préfixe de chaîne (pas de
+            # relative_to ni d'exception par fichier hors du répertoire)
+            prefix = os.path.join(self.source_directory, "") if self.source_directory else None
             for source, dest, method, duration in self.conversions:
-                # Afficher le chemin relatif si possible
-                try:
-                    if self.source_directory and source.is_relative_to(self.source_directory):
-                        rel_source = source.relative_to(self.source_directory)
-                    else:
-                        rel_source = source.name
-                except ValueError:
+                source_str = str(source)
+                if prefix and source_str.startswith(prefix):
+                    rel_source = source_str[len(prefix):]
+                else:
                     rel_source = source.name
 
                 # Nom du fichier destination
                 dest_name = dest.name if dest else "?"
 
-                lines.append(f"  {rel_source}")
-                lines.append(f"      -> {dest_name} ({method}, {duration:.1f}s)")
-            lines.append("")
+                yield f"  {rel_source}"
+                yield f"      -> {dest_name} ({method}, {duration:.1f}s)"
+            yield ""
 
         # Détail des erreurs
         if self.errors:
-            lines.append("ÉCHECS DÉTAILLÉS")
-            lines.append(sep_light)
-            for i, (path, reason, details) in enumerate(self.errors, 1):
-                lines.append(f"  [{i}] {path.name}")
-                lines.append(f"      Chemin  : {path}")
-                lines.append(f"      Raison  : {reason}")
+            yield "ÉCHECS DÉTAILLÉS"
+            yield sep_light
+            for i, (path, reason, exception) in enumerate(self.errors, 1):
+                yield f"  [{i}] {path.name}"
+                yield f"      Chemin  : {path}"
+                yield f"      Raison  : {reason}"
+                details = _format_exception(exception) if exception else ""
                 if details:
                     # Afficher la traceback complète avec indentation
-                    lines.append("      Détails :")
+                    yield "      Détails :"
                     for detail_line in details.strip().split("\n"):
-                        lines.append(f"        {detail_line}")
-                lines.append("")
+                        yield f"        {detail_line}"
+                yield ""
 
         # Fichiers protégés par mot de passe
         if self.password_protected:
-            lines.append("FICHIERS PROTÉGÉS PAR MOT DE PASSE")
-            lines.append(sep_light)
+            yield "FICHIERS PROTÉGÉS PAR MOT DE PASSE"
+            yield sep_light
             for path in self.password_protected:
-                lines.append(f"  - {path}")
-            lines.append("")
+                yield f"  - {path}"
+            yield ""
 
         # Pied de page
-        lines.append(sep)
-        lines.append(f"Rapport généré le {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(sep)
-
-        return "\n".join(lines)
+        yield from (sep, f"Rapport généré le {datetime.now():%Y-%m-%d %H:%M:%S}", sep)
 
     def save(self, output_dir: Path | None = None) -> Path | None:
         """
@@ -336,9 +380,14 @@ class SessionReport:
             timestamp = self.start_time.strftime("%Y%m%d_%H%M%S")
             report_path = output_dir / f"conversion_report_{timestamp}.txt"
 
-            content = self.generate()
-            with open(report_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            # Écriture au fil des lignes: le rapport complet n'est jamais
+            # construit en mémoire (même contenu que generate())
+            lines = self._iter_lines()
+            with open(report_path, "w", encoding="utf-8", buffering=self.WRITE_BUFFER_SIZE) as f:
+                f.write(next(lines))
+                for line in lines:
+                    f.write("\n")
+                    f.write(line)
 
             return report_path
 
@@ -13,16 +13,35 @@ from __future__ import annotations
 import shutil
 import tempfile
 from pathlib import Path
-from typing import Generator
+from typing import Callable, Generator
 from unittest.mock import MagicMock
 
 import pytest
 
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
 from converter_pdf.config import Config
 from converter_pdf.logger import ConverterLogger
 from converter_pdf.converters.base import ConversionResult, ConversionStatus
 
 
+# PNG minimal valide (1x1 pixel), utilisé quand Pillow est absent
+MINIMAL_PNG = bytes([
+    0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A,  # PNG signature
+    0x00, 0x00, 0x00, 0x0D, 0x49, 0x48, 0x44, 0x52,  # IHDR chunk
+    0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01,
+    0x08, 0x02, 0x00, 0x00, 0x00, 0x90, 0x77, 0x53,
+    0xDE, 0x00, 0x00, 0x00, 0x0C, 0x49, 0x44, 0x41,  # IDAT chunk
+    0x54, 0x08, 0xD7, 0x63, 0xF8, 0xFF, 0xFF, 0x3F,
+    0x00, 0x05, 0xFE, 0x02, 0xFE, 0xDC, 0xCC, 0x59,
+    0xE7, 0x00, 0x00, 0x00, 0x00, 0x49, 0x45, 0x4E,  # IEND chunk
+    0x44, 0xAE, 0x42, 0x60, 0x82
+])
+
+
 # =============================================================================
 # Fixtures de configuration
 # =============================================================================
@@ -213,29 +232,14 @@ startxref
         height: int = 100
     ) -> Path:
         """Crée un fichier image PNG simple."""
-        try:
-            from PIL import Image
+        file = self.base_dir / name
+        if Image is not None:
             img = Image.new("RGB", (width, height), color="white")
-            file = self.base_dir / name
             img.save(file)
-            return file
-        except ImportError:
-            # Fallback: créer un fichier PNG minimal (1x1 pixel)
-            # PNG minimal valide
-            png_data = bytes([
-                0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A,  # PNG signature
-                0x00, 0x00, 0x00, 0x0D, 0x49, 0x48, 0x44, 0x52,  # IHDR chunk
-                0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01,
-                0x08, 0x02, 0x00, 0x00, 0x00, 0x90, 0x77, 0x53,
-                0xDE, 0x00, 0x00, 0x00, 0x0C, 0x49, 0x44, 0x41,  # IDAT chunk
-                0x54, 0x08, 0xD7, 0x63, 0xF8, 0xFF, 0xFF, 0x3F,
-                0x00, 0x05, 0xFE, 0x02, 0xFE, 0xDC, 0xCC, 0x59,
-                0xE7, 0x00, 0x00, 0x00, 0x00, 0x49, 0x45, 0x4E,  # IEND chunk
-                0x44, 0xAE, 0x42, 0x60, 0x82
-            ])
-            file = self.base_dir / name
-            file.write_bytes(png_data)
-            return file
+        else:
+            # Fallback: PNG minimal (1x1 pixel)
+            file.write_bytes(MINIMAL_PNG)
+        return file
 
     def create_subdirectory(self, name: str) -> Path:
         """Crée un sous-répertoire."""
@@ -305,6 +309,21 @@ def skipped_result(temp_dir: Path) -> ConversionResult:
     )
 
 
+@pytest.fixture
+def make_result() -> Callable[..., ConversionResult]:
+    """Factory de résultats de conversion sans fichier réel."""
+    def _make(status: ConversionStatus, name: str = "doc.docx") -> ConversionResult:
+        return ConversionResult(
+            status=status,
+            source=Path(name),
+            dest=None,
+            duration=0.5,
+            method="test",
+        )
+
+    return _make
+
+
 # =============================================================================
 # Markers personnalisés
 # =============================================================================
@@ -11,6 +11,7 @@ Teste:
 
 from __future__ import annotations
 
+import io
 import tarfile
 import zipfile
 from pathlib import Path
@@ -44,7 +45,7 @@ class ArchiveFactory:
             Path vers le ZIP créé
         """
         zip_path = self.base_dir / name
-        with zipfile.ZipFile(zip_path, 'w') as zf:
+        with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_STORED) as zf:
             for filename, content in files.items():
                 zf.writestr(filename, content)
         return zip_path
@@ -53,30 +54,29 @@ class ArchiveFactory:
         """Crée un fichier TAR."""
         tar_path = self.base_dir / name
         with tarfile.open(tar_path, 'w') as tf:
-            for filename, content in files.items():
-                import io
-                data = content.encode('utf-8')
-                info = tarfile.TarInfo(name=filename)
-                info.size = len(data)
-                tf.addfile(info, io.BytesIO(data))
+            self._add_tar_members(tf, files)
         return tar_path
 
     def create_tar_gz(self, name: str, files: dict[str, str]) -> Path:
         """Crée un fichier TAR.GZ."""
         tar_path = self.base_dir / name
         with tarfile.open(tar_path, 'w:gz') as tf:
-            for filename, content in files.items():
-                import io
-                data = content.encode('utf-8')
-                info = tarfile.TarInfo(name=filename)
-                info.size = len(data)
-                tf.addfile(info, io.BytesIO(data))
+            self._add_tar_members(tf, files)
         return tar_path
 
+    @staticmethod
+    def _add_tar_members(tf: tarfile.TarFile, files: dict[str, str]) -> None:
+        """Ajoute les fichiers à une archive TAR ouverte."""
+        for filename, content in files.items():
+            data = content.encode('utf-8')
+            info = tarfile.TarInfo(name=filename)
+            info.size = len(data)
+            tf.addfile(info, io.BytesIO(data))
+
     def create_zip_with_folder(self, name: str, folder_name: str, files: dict[str, str]) -> Path:
         """Crée un ZIP avec un dossier racine."""
         zip_path = self.base_dir / name
-        with zipfile.ZipFile(zip_path, 'w') as zf:
+        with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_STORED) as zf:
             for filename, content in files.items():
                 zf.writestr(f"{folder_name}/{filename}", content)
         return zip_path
@@ -93,18 +93,16 @@ class ArchiveFactory:
         Returns:
             Path vers le ZIP externe
         """
-        import io
-
         # Créer le ZIP interne en mémoire
         inner_buffer = io.BytesIO()
-        with zipfile.ZipFile(inner_buffer, 'w') as inner_zf:
+        with zipfile.ZipFile(inner_buffer, 'w', compression=zipfile.ZIP_STORED) as inner_zf:
             for filename, content in inner_files.items():
                 inner_zf.writestr(filename, content)
         inner_data = inner_buffer.getvalue()
 
         # Créer le ZIP externe contenant le ZIP interne
         outer_path = self.base_dir / outer_name
-        with zipfile.ZipFile(outer_path, 'w') as outer_zf:
+        with zipfile.ZipFile(outer_path, 'w', compression=zipfile.ZIP_STORED) as outer_zf:
             outer_zf.writestr(inner_name, inner_data)
         return outer_path
 
@@ -224,6 +222,17 @@ class TestArchiveTypeDetection:
 
         assert converter._get_archive_type(source) == "unknown"
 
+    def test_detect_case_and_dotted_names(self, mock_logger):
+        """Casse ignorée, points multiples dans le nom."""
+        from converter_pdf.converters.archive import ArchiveConverter
+
+        converter = ArchiveConverter(Config(), mock_logger)
+
+        assert converter._get_archive_type(Path("Backup.v2.ZIP")) == "zip"
+        assert converter._get_archive_type(Path("data.2024.TAR.GZ")) == "tar.gz"
+        assert converter._get_archive_type(Path("notes.gz")) == "unknown"
+        assert converter._get_archive_type(Path("zip")) == "unknown"
+
 
 # =============================================================================
 # Tests des patterns à ignorer
@@ -269,6 +278,29 @@ class TestIgnorePatterns:
         assert converter._should_ignore(Path("document.txt")) is False
         assert converter._should_ignore(Path("folder/image.png")) is False
 
+    def test_should_ignore_member_names(self, mock_logger):
+        """Les noms de membres (chaînes '/') sont acceptés tels quels."""
+        from converter_pdf.converters.archive import ArchiveConverter
+
+        converter = ArchiveConverter(Config(), mock_logger)
+        assert converter._should_ignore("__MACOSX/._doc.txt") is True
+        assert converter._should_ignore("folder/.hidden/a.txt") is True
+        assert converter._should_ignore("folder/sub/") is False
+        assert converter._should_ignore("./folder/doc.txt") is False
+
+    def test_ignore_name_cached(self, mock_logger):
+        """Chaque nom n'est classé qu'une fois."""
+        from converter_pdf.converters.archive import ArchiveConverter
+
+        converter = ArchiveConverter(Config(), mock_logger)
+        ArchiveConverter._should_ignore_name.cache_clear()
+
+        converter._should_ignore(Path("src/a.txt"))
+        converter._should_ignore(Path("src/b.txt"))
+
+        info = ArchiveConverter._should_ignore_name.cache_info()
+        assert (info.hits, info.misses) == (1, 3)
+
 
 # =============================================================================
 # Tests de sanitization des noms
@@ -355,6 +387,66 @@ class TestZipExtraction:
         assert count == 1
         assert (extract_dir / "doc.txt").exists()
 
+    def test_extract_zip_streams_content_and_folders(self, mock_logger, temp_dir, archive_factory):
+        """Contenu copié à l'identique, sous-dossiers créés."""
+        from converter_pdf.converters.archive import ArchiveConverter
+
+        converter = ArchiveConverter(Config(), mock_logger)
+        big = "x" * (3 * ArchiveConverter.COPY_BUFFER_SIZE // 2)
+
+        zip_file = archive_factory.create_zip("test.zip", {
+            "a/b/big.txt": big,
+            "a/c.txt": "petit",
+        })
+
+        extract_dir = temp_dir / "extracted"
+        extract_dir.mkdir()
+        count = converter._extract_archive(zip_file, extract_dir, "zip")
+
+        assert count == 2
+        assert (extract_dir / "a" / "b" / "big.txt").read_text() == big
+        assert (extract_dir / "a" / "c.txt").read_text() == "petit"
+
+    def test_extract_zip_parallel(self, mock_logger, temp_dir, archive_factory):
+        """Au-delà du seuil, les fichiers sont copiés par plusieurs threads."""
+        from converter_pdf.converters.archive import ArchiveConverter
+
+        converter = ArchiveConverter(Config(), mock_logger)
+        converter.EXTRACT_WORKERS = 3
+        converter.PARALLEL_EXTRACT_MIN_FILES = 2
+        files = {f"dir{i % 2}/file{i}.txt": f"contenu {i}" for i in range(10)}
+        zip_file = archive_factory.create_zip("test.zip", files)
+
+        extract_dir = temp_dir / "extracted"
+        extract_dir.mkdir()
+        with patch.object(
+            converter, "_copy_zip_members", wraps=converter._copy_zip_members
+        ) as copy_members:
+            count = converter._extract_archive(zip_file, extract_dir, "zip")
+
+        assert count == 10
+        assert copy_members.call_count == 3
+        for name, content in files.items():
+            assert (extract_dir / name).read_text() == content
+
+    def test_extract_zip_stays_in_dest_dir(self, mock_logger, temp_dir, archive_factory):
+        """Les chemins '..' et absolus restent dans le dossier d'extraction."""
+        from converter_pdf.converters.archive import ArchiveConverter
+
+        converter = ArchiveConverter(Config(), mock_logger)
+
+        zip_file = archive_factory.create_zip("test.zip", {
+            "../evil.txt": "hors",
+            "/abs/root.txt": "absolu",
+        })
+
+        extract_dir = temp_dir / "extracted"
+        extract_dir.mkdir()
+        converter._extract_archive(zip_file, extract_dir, "zip")
+
+        assert (extract_dir / "abs" / "root.txt").read_text() == "absolu"
+        assert not (temp_dir / "evil.txt").exists()
+
 
 # =============================================================================
 # Tests d'extraction TAR
@@ -397,6 +489,23 @@ class TestTarExtraction:
         assert count == 1
         assert (extract_dir / "compressed.txt").exists()
 
+    def test_tar_gz_opened_seekable_with_large_buffer(self, mock_logger, temp_dir, archive_factory):
+        """TAR.GZ ouvert en mode 'r:gz' avec le grand tampon de copie."""
+        from converter_pdf.converters.archive import ArchiveConverter
+
+        converter = ArchiveConverter(Config(), mock_logger)
+        tar_file = archive_factory.create_tar_gz("test.tar.gz", {"a.txt": "contenu"})
+
+        extract_dir = temp_dir / "extracted"
+        extract_dir.mkdir()
+        with patch("converter_pdf.converters.archive.tarfile.open", wraps=tarfile.open) as tar_open:
+            converter._extract_archive(tar_file, extract_dir, "tar.gz")
+
+        tar_open.assert_called_once_with(
+            tar_file, "r:gz", copybufsize=ArchiveConverter.COPY_BUFFER_SIZE
+        )
+        assert (extract_dir / "a.txt").read_text() == "contenu"
+
 
 # =============================================================================
 # Tests de la gestion des dossiers dupliqués
@@ -419,6 +528,18 @@ class TestEffectiveSourceDir:
 
         assert result == temp_dir / "test"
 
+    def test_hidden_parent_directory_not_ignored(self, mock_logger, temp_dir):
+        """Seul le nom des éléments compte, pas le chemin du dossier temporaire."""
+        from converter_pdf.converters.archive import ArchiveConverter
+
+        converter = ArchiveConverter(Config(), mock_logger)
+        extract_dir = temp_dir / ".cache"
+        (extract_dir / "test").mkdir(parents=True)
+
+        result = converter._get_effective_source_dir(extract_dir, "test")
+
+        assert result == extract_dir / "test"
+
     def test_single_folder_different_name(self, mock_logger, temp_dir):
         """Si le dossier a un nom différent, utiliser le dossier parent."""
         from converter_pdf.converters.archive import ArchiveConverter
@@ -47,6 +47,11 @@ class TestConfigDefaults:
         config = Config()
         assert config.force is False
 
+    def test_default_incremental(self):
+        """incremental est False par défaut."""
+        config = Config()
+        assert config.incremental is False
+
     def test_default_delete_source(self):
         """delete_source est False par défaut."""
         config = Config()
@@ -79,6 +84,21 @@ class TestConfigDefaults:
         assert config.libreoffice_timeout == 60
         assert config.browser_timeout == 30
 
+    def test_default_word_optimize_for_screen(self):
+        """L'export Word optimisé écran est désactivé par défaut."""
+        config = Config()
+        assert config.word_optimize_for_screen is False
+
+    def test_default_excel_skip_empty_sheets(self):
+        """Les feuilles Excel vides sont masquées par défaut."""
+        config = Config()
+        assert config.excel_skip_empty_sheets is True
+
+    def test_default_workers(self):
+        """Les fichiers sont traités un par un par défaut."""
+        config = Config()
+        assert config.workers == 1
+
 
 class TestConfigValidation:
     """Tests de validation des paramètres."""
@@ -124,6 +144,11 @@ class TestConfigValidation:
             config = Config(ocr_engine=engine)
             assert config.ocr_engine == engine
 
+    def test_invalid_workers_raises(self):
+        """workers doit être au moins 1."""
+        with pytest.raises(ValueError, match="workers doit être >= 1"):
+            Config(workers=0)
+
     def test_hide_source_delete_source_incompatible(self):
         """hide_source et delete_source sont incompatibles."""
         with pytest.raises(ValueError, match="delete_source et hide_source sont incompatibles"):
@@ -341,6 +366,28 @@ class TestConfigFromArgs:
         config.update_from_args(Args())
         assert config.hide_source is True
 
+    def test_update_from_args_workers(self):
+        """update_from_args traite --workers."""
+        config = Config()
+
+        class Args:
+            method = None
+            log_level = None
+            log_file = None
+            ocr_engine = None
+            workers = 4
+            recursive = False
+            force = False
+            delete = False
+            hide = False
+            ocr = False
+            dry_run = False
+            no_keep_ext = False
+            no_report = False
+
+        config.update_from_args(Args())
+        assert config.workers == 4
+
     def test_update_from_args_hide_delete_incompatible(self):
         """update_from_args lève une erreur si hide et delete sont tous deux True."""
         config = Config()
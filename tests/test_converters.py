@@ -6,6 +6,7 @@ Teste:
 - TextConverter (txt, log)
 - ImageConverter (jpg, png, etc.)
 - XmlConverter (xml)
+- Détection des outils externes
 - Converter chain
 """
 
@@ -37,6 +38,7 @@ class TestConversionStatus:
         assert ConversionStatus.FAILED
         assert ConversionStatus.SKIPPED_PASSWORD
         assert ConversionStatus.SKIPPED_EXISTS
+        assert ConversionStatus.SKIPPED_UNCHANGED
         assert ConversionStatus.SKIPPED_UNSUPPORTED
         assert ConversionStatus.SKIPPED_PDF
 
@@ -94,6 +96,7 @@ class TestConversionResult:
         skipped_statuses = [
             ConversionStatus.SKIPPED_PASSWORD,
             ConversionStatus.SKIPPED_EXISTS,
+            ConversionStatus.SKIPPED_UNCHANGED,
             ConversionStatus.SKIPPED_UNSUPPORTED,
             ConversionStatus.SKIPPED_PDF,
         ]
@@ -154,6 +157,33 @@ class TestConversionResult:
         )
         assert result.source_size_mb == pytest.approx(1.0, rel=0.01)
 
+    def test_given_size_not_recomputed(self, temp_dir: Path):
+        """Une taille fournie n'est pas recalculée (pas de stat)."""
+        source = temp_dir / "test.txt"
+        source.write_text("Hello World")
+
+        result = ConversionResult(
+            status=ConversionStatus.SKIPPED_EXISTS,
+            source=source,
+            dest=None,
+            duration=0,
+            method="skip",
+            source_size=42,
+        )
+        assert result.source_size == 42
+
+    def test_missing_files_size_zero(self, temp_dir: Path):
+        """Fichiers absents : tailles à 0, sans exception."""
+        result = ConversionResult(
+            status=ConversionStatus.FAILED,
+            source=temp_dir / "absent.txt",
+            dest=temp_dir / "absent.pdf",
+            duration=0,
+            method="test",
+        )
+        assert result.source_size == 0
+        assert result.dest_size == 0
+
     def test_str_representation(self, temp_dir: Path):
         """__str__ retourne une représentation lisible."""
         source = temp_dir / "test.txt"
@@ -309,6 +339,60 @@ class TestTextConverter:
         if text_converter.is_available():
             assert result.status == ConversionStatus.SUCCESS
 
+    @pytest.mark.requires_reportlab
+    def test_convert_leaves_no_temp_file(self, text_converter, file_factory, temp_dir):
+        """Le PDF est écrit dans un fichier temporaire puis renommé."""
+        source = file_factory.create_text_file("atomic.txt", "contenu")
+        dest = temp_dir / "atomic.txt.pdf"
+
+        result = text_converter.convert(source, dest)
+
+        if text_converter.is_available():
+            assert result.status == ConversionStatus.SUCCESS
+            assert dest.exists()
+        assert not (temp_dir / "atomic.txt.pdf.tmp").exists()
+
+    @pytest.mark.requires_reportlab
+    def test_convert_failure_removes_temp_file(self, text_converter, file_factory, temp_dir):
+        """En cas d'échec, aucun PDF partiel ne reste sur le disque."""
+        source = file_factory.create_text_file("broken.txt", "contenu")
+        dest = temp_dir / "broken.txt.pdf"
+
+        with patch("converter_pdf.converters.text.os.replace", side_effect=OSError("disque plein")):
+            result = text_converter.convert(source, dest)
+
+        assert result.status == ConversionStatus.FAILED
+        assert not dest.exists()
+        assert not (temp_dir / "broken.txt.pdf.tmp").exists()
+
+    @pytest.mark.requires_reportlab
+    def test_convert_large_text(self, text_converter, file_factory, temp_dir):
+        """Un texte plus long qu'un bloc est lu et rendu par morceaux."""
+        content = "\n".join(f"Ligne {i}" for i in range(text_converter.CHUNK_LINES * 2 + 10))
+        source = file_factory.create_text_file("large.log", content)
+        dest = temp_dir / "large.log.pdf"
+
+        result = text_converter.convert(source, dest)
+
+        if text_converter.is_available():
+            assert result.status == ConversionStatus.SUCCESS
+            assert dest.exists()
+
+    @pytest.mark.requires_reportlab
+    def test_styles_built_once(self, text_converter, file_factory, temp_dir):
+        """Les styles ReportLab sont partagés entre les conversions."""
+        from converter_pdf.converters.text import _get_styles
+
+        if not text_converter.is_available():
+            pytest.skip("ReportLab non installé")
+
+        source = file_factory.create_text_file("a.txt", "A")
+        text_converter.convert(source, temp_dir / "a.txt.pdf")
+        styles = _get_styles()
+        text_converter.convert(source, temp_dir / "b.txt.pdf")
+
+        assert _get_styles() is styles
+
     def test_is_available_without_reportlab(self, mock_logger):
         """is_available retourne False sans ReportLab."""
         from converter_pdf.converters.text import TextConverter
@@ -415,6 +499,353 @@ class TestXmlConverter:
             # Devrait réussir même avec XML invalide (garde le contenu brut)
             assert result.status == ConversionStatus.SUCCESS
 
+    def test_format_xml_indents(self, xml_converter):
+        """Le XML est réindenté, sans lignes vides."""
+        formatted = xml_converter._format_xml("<root>\n\n<a>1</a><b/></root>")
+
+        lines = formatted.strip().split("\n")
+        assert "  <a>1</a>" in lines
+        assert "  <b/>" in lines
+        assert all(line.strip() for line in lines)
+
+    def test_format_xml_minidom_fallback(self, xml_converter):
+        """Sans lxml, le formatage passe par minidom."""
+        with patch("converter_pdf.converters.xml_converter.LXML_AVAILABLE", False):
+            formatted = xml_converter._format_xml("<root><a>1</a></root>")
+
+        assert "  <a>1</a>" in formatted.split("\n")
+
+    def test_format_xml_malformed_raises(self, xml_converter):
+        """Un XML mal formé lève une exception (gérée par convert)."""
+        with pytest.raises(Exception):
+            xml_converter._format_xml("<root><unclosed>")
+
+    @pytest.mark.requires_reportlab
+    def test_convert_large_xml(self, xml_converter, file_factory, temp_dir):
+        """Un XML plus long qu'un bloc est découpé sur plusieurs pages."""
+        items = "".join(f"<item id='{i}'>valeur &amp; {i}</item>" for i in range(1200))
+        source = file_factory.create_xml_file("large.xml", f"<root>{items}</root>")
+        dest = temp_dir / "large.xml.pdf"
+
+        result = xml_converter.convert(source, dest)
+
+        if xml_converter.is_available():
+            assert result.status == ConversionStatus.SUCCESS
+            assert dest.exists()
+
+
+# =============================================================================
+# Tests ReportLab Word (fallback)
+# =============================================================================
+
+class TestReportLabWordConverter:
+    """Tests du convertisseur Word de secours."""
+
+    @pytest.fixture
+    def word_converter(self, mock_logger):
+        """Crée une instance de ReportLabWordConverter."""
+        from converter_pdf.converters.reportlab_fallback import ReportLabWordConverter
+        return ReportLabWordConverter(Config(), mock_logger)
+
+    @pytest.fixture
+    def docx_file(self, temp_dir):
+        """Crée un .docx avec titres, paragraphe et tableau."""
+        docx = pytest.importorskip("docx")
+
+        doc = docx.Document()
+        doc.add_heading("Titre", 1)
+        doc.add_heading("Section", 2)
+        doc.add_paragraph("Texte <b> & suite")
+        table = doc.add_table(rows=2, cols=2)
+        table.cell(0, 0).text = "A"
+        table.cell(1, 1).text = "D"
+        path = temp_dir / "document.docx"
+        doc.save(path)
+        return path
+
+    def test_read_docx_lxml(self, word_converter, docx_file):
+        """Lecture directe du XML : styles, texte et tableaux."""
+        pytest.importorskip("lxml")
+
+        paragraphs, tables = word_converter._read_docx(docx_file)
+
+        assert paragraphs[0] == ("heading 1", "Titre")
+        assert paragraphs[1] == ("heading 2", "Section")
+        assert paragraphs[2][1] == "Texte <b> & suite"
+        assert tables == [[["A", ""], ["", "D"]]]
+
+    def test_read_docx_python_docx_fallback(self, word_converter, docx_file):
+        """Sans lxml, lecture via python-docx avec le même résultat."""
+        with patch("converter_pdf.converters.reportlab_fallback.LXML_AVAILABLE", False):
+            paragraphs, tables = word_converter._read_docx(docx_file)
+
+        assert [text for _, text in paragraphs] == ["Titre", "Section", "Texte <b> & suite"]
+        assert tables == [[["A", ""], ["", "D"]]]
+
+    @pytest.mark.requires_reportlab
+    def test_convert_docx(self, word_converter, docx_file, temp_dir):
+        """Conversion complète d'un .docx."""
+        dest = temp_dir / "document.docx.pdf"
+
+        result = word_converter.convert(docx_file, dest)
+
+        if word_converter.is_available():
+            assert result.status == ConversionStatus.SUCCESS
+            assert dest.exists()
+
+
+# =============================================================================
+# Tests ReportLab Excel (fallback)
+# =============================================================================
+
+class TestReportLabExcelConverter:
+    """Tests du convertisseur Excel de secours."""
+
+    @pytest.fixture
+    def excel_converter(self, mock_logger):
+        """Crée une instance de ReportLabExcelConverter."""
+        from converter_pdf.converters.reportlab_fallback import ReportLabExcelConverter
+        return ReportLabExcelConverter(Config(), mock_logger)
+
+    def test_display_rows(self, excel_converter):
+        """Cellules vides effacées, texte long tronqué."""
+        pd = pytest.importorskip("pandas")
+
+        df = pd.DataFrame({
+            "a": [1, None],
+            "b": ["x" * 60, None],
+        })
+
+        rows = excel_converter._display_rows(df)
+
+        assert rows[0] == ["1.0", "x" * 47 + "..."]
+        assert rows[1] == ["", ""]
+
+    @pytest.mark.requires_reportlab
+    def test_convert_multiple_sheets(self, excel_converter, temp_dir):
+        """Conversion d'un classeur à plusieurs feuilles, dont une tronquée."""
+        pd = pytest.importorskip("pandas")
+        pytest.importorskip("openpyxl")
+
+        source = temp_dir / "classeur.xlsx"
+        with pd.ExcelWriter(source) as writer:
+            pd.DataFrame({"n": range(150)}).to_excel(writer, sheet_name="Longue", index=False)
+            pd.DataFrame({"a": [1, None]}).to_excel(writer, sheet_name="Courte", index=False)
+        dest = temp_dir / "classeur.xlsx.pdf"
+
+        result = excel_converter.convert(source, dest)
+
+        if excel_converter.is_available():
+            assert result.status == ConversionStatus.SUCCESS
+            assert dest.exists()
+
+
+# =============================================================================
+# Tests OfficeWordConverter
+# =============================================================================
+
+class TestOfficeWordConverter:
+    """Tests du convertisseur Word COM (application simulée)."""
+
+    def make_word(self, events: list, open_error: Exception | None = None):
+        """Application Word simulée qui trace les changements de pagination."""
+
+        class FakeOptions:
+            def __init__(self):
+                object.__setattr__(self, "Pagination", True)
+
+            def __setattr__(self, name, value):
+                events.append((name, value))
+                object.__setattr__(self, name, value)
+
+        word = MagicMock()
+        word.Options = FakeOptions()
+        document = word.Documents.Open.return_value
+        if open_error is not None:
+            word.Documents.Open.side_effect = open_error
+        else:
+            word.Documents.Open.side_effect = lambda *a, **k: events.append("open") or document
+        document.Close.side_effect = lambda *a: events.append("close")
+        return word
+
+    def convert(self, word, mock_logger, temp_dir):
+        from contextlib import contextmanager
+
+        from converter_pdf.converters.office import OfficeWordConverter
+
+        @contextmanager
+        def fake_context(*args, **kwargs):
+            yield word
+
+        with patch("converter_pdf.converters.office.WIN32COM_AVAILABLE", True), \
+                patch("converter_pdf.converters.office.office_app_context", fake_context):
+            converter = OfficeWordConverter(Config(), mock_logger)
+            return converter.convert(temp_dir / "doc.docx", temp_dir / "doc.docx.pdf")
+
+    def test_pagination_restored_after_close(self, mock_logger, temp_dir):
+        """La pagination en arrière-plan est coupée puis restaurée."""
+        events = []
+        word = self.make_word(events)
+
+        result = self.convert(word, mock_logger, temp_dir)
+
+        assert result.status == ConversionStatus.SUCCESS
+        assert events == [("Pagination", False), "open", "close", ("Pagination", True)]
+        assert word.Options.Pagination is True
+
+    def test_pagination_restored_when_open_fails(self, mock_logger, temp_dir):
+        """La pagination est restaurée même si l'ouverture échoue."""
+        events = []
+        word = self.make_word(events, open_error=RuntimeError("boom"))
+
+        result = self.convert(word, mock_logger, temp_dir)
+
+        assert result.status == ConversionStatus.FAILED
+        assert events == [("Pagination", False), ("Pagination", True)]
+
+
+# =============================================================================
+# Tests OfficeExcelConverter
+# =============================================================================
+
+class TestOfficeExcelConverter:
+    """Tests du convertisseur Excel COM (application simulée)."""
+
+    def make_sheet(self, used_cells: int, first_value, a1_value=None):
+        """Feuille COM simulée (visible, sans forme)."""
+        ws = MagicMock(Visible=-1)
+        ws.UsedRange.Count = used_cells
+        ws.UsedRange.Cells.return_value.Value = first_value
+        ws.Range.return_value.Value = a1_value
+        ws.Shapes.Count = 0
+        return ws
+
+    def test_single_cell_outside_a1_not_hidden(self, mock_logger):
+        """Une feuille dont la seule cellule remplie n'est pas A1 reste visible."""
+        from converter_pdf.converters.office import OfficeExcelConverter
+
+        converter = OfficeExcelConverter(Config(), mock_logger)
+        only_b5 = self.make_sheet(1, "donnée en B5")
+        empty = self.make_sheet(1, None)
+        data = self.make_sheet(20, "titre", "titre")
+        wb = MagicMock(Worksheets=[only_b5, empty, data])
+
+        converter._hide_empty_sheets(wb)
+
+        assert only_b5.Visible == -1
+        assert empty.Visible == 0
+        assert data.Visible == -1
+
+    def test_manual_calculation_set_after_open_and_restored(self, mock_logger, temp_dir):
+        """Le recalcul manuel est appliqué classeur ouvert, puis restauré."""
+        from contextlib import contextmanager
+
+        from converter_pdf.converters.office import OfficeExcelConverter
+
+        events = []
+
+        class FakeExcel:
+            def __init__(self):
+                object.__setattr__(self, "Workbooks", MagicMock())
+                object.__setattr__(self, "Calculation", -4105)  # xlCalculationAutomatic
+                workbook = self.Workbooks.Open.return_value
+                self.Workbooks.Open.side_effect = lambda *a, **k: events.append("open") or workbook
+                workbook.Close.side_effect = lambda *a: events.append("close")
+
+            def __setattr__(self, name, value):
+                events.append((name, value))
+                object.__setattr__(self, name, value)
+
+        @contextmanager
+        def fake_context(*args, **kwargs):
+            yield FakeExcel()
+
+        with patch("converter_pdf.converters.office.WIN32COM_AVAILABLE", True), \
+                patch("converter_pdf.converters.office.office_app_context", fake_context):
+            converter = OfficeExcelConverter(Config(excel_skip_empty_sheets=False), mock_logger)
+            result = converter.convert(temp_dir / "book.xlsx", temp_dir / "book.xlsx.pdf")
+
+        assert result.status == ConversionStatus.SUCCESS
+        calculation = [e for e in events if e == "open" or e == "close" or e[0] == "Calculation"]
+        assert calculation == ["open", ("Calculation", -4135), ("Calculation", -4105), "close"]
+
+
+# =============================================================================
+# Tests LibreOfficeConverter
+# =============================================================================
+
+class TestLibreOfficeConverter:
+    """Tests du convertisseur LibreOffice (subprocess simulé)."""
+
+    def make_converter(self, mock_logger, temp_dir):
+        from converter_pdf.converters.libreoffice import LibreOfficeConverter
+
+        converter = LibreOfficeConverter(Config(), mock_logger)
+        converter.__dict__["libreoffice_path"] = temp_dir / "soffice"
+        return converter
+
+    def test_generated_pdf_replaces_existing_dest(self, mock_logger, temp_dir, file_factory):
+        """Le PDF généré remplace un PDF de destination existant."""
+        converter = self.make_converter(mock_logger, temp_dir)
+        source = file_factory.create_text_file("report.docx", "x")
+        dest = temp_dir / "report.docx.pdf"
+        dest.write_bytes(b"%PDF ancien")
+
+        def fake_run(cmd, **kwargs):
+            (temp_dir / "report.pdf").write_bytes(b"%PDF nouveau")
+            return MagicMock(returncode=0, stderr="")
+
+        with patch("converter_pdf.converters.libreoffice.subprocess.run", side_effect=fake_run):
+            result = converter.convert(source, dest)
+
+        assert result.status == ConversionStatus.SUCCESS
+        assert dest.read_bytes() == b"%PDF nouveau"
+        assert not (temp_dir / "report.pdf").exists()
+
+    def test_missing_generated_pdf_fails(self, mock_logger, temp_dir, file_factory):
+        """Sans PDF généré, la conversion échoue proprement."""
+        converter = self.make_converter(mock_logger, temp_dir)
+        source = file_factory.create_text_file("report.docx", "x")
+
+        with patch(
+            "converter_pdf.converters.libreoffice.subprocess.run",
+            return_value=MagicMock(returncode=0, stderr=""),
+        ):
+            result = converter.convert(source, temp_dir / "report.docx.pdf")
+
+        assert result.status == ConversionStatus.FAILED
+        assert result.message == "PDF non créé par LibreOffice"
+
+
+# =============================================================================
+# Tests détection des outils externes
+# =============================================================================
+
+class TestExternalToolDetection:
+    """Tests de la détection des outils externes (navigateur, LibreOffice)."""
+
+    def test_missing_browser_detected_once(self, mock_logger):
+        """L'absence de navigateur est mémorisée (pas de re-détection)."""
+        from converter_pdf.converters.html import HtmlConverter
+
+        converter = HtmlConverter(Config(), mock_logger)
+        with patch.object(HtmlConverter, "_detect_browser", return_value=None) as detect:
+            assert converter.is_available() is False
+            assert converter.is_available() is False
+
+        assert detect.call_count == 1
+
+    def test_missing_libreoffice_detected_once(self, mock_logger):
+        """L'absence de LibreOffice est mémorisée (pas de re-détection)."""
+        from converter_pdf.converters.libreoffice import LibreOfficeConverter
+
+        converter = LibreOfficeConverter(Config(), mock_logger)
+        with patch.object(LibreOfficeConverter, "_detect_libreoffice", return_value=None) as detect:
+            assert converter.is_available() is False
+            assert converter.is_available() is False
+
+        assert detect.call_count == 1
+
 
 # =============================================================================
 # Tests Converter Chain
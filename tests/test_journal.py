@@ -0,0 +1,198 @@
+"""
+Tests pour le module journal.py.
+
+Teste:
+- Ouverture / fermeture du journal CSV
+- Filtrage des erreurs
+- Écriture par lots
+- Thread d'écriture
+"""
+
+from __future__ import annotations
+
+import csv
+import queue
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from converter_pdf.config import Config
+from converter_pdf.converters.base import ConversionStatus
+from converter_pdf.journal import Journal, NullJournal
+
+
+def read_rows(path: Path) -> list[list[str]]:
+    """Lit les lignes du journal CSV."""
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+
+# =============================================================================
+# Tests Journal
+# =============================================================================
+
+class TestJournal:
+    """Tests du journal CSV."""
+
+    def test_disabled_creates_nothing(self, mock_logger, temp_dir, make_result):
+        """Journal désactivé : aucun fichier créé."""
+        journal = Journal(Config(journal_enabled=False), mock_logger, temp_dir)
+        journal.log(make_result(ConversionStatus.FAILED))
+        journal.close()
+
+        assert isinstance(journal, NullJournal)
+        assert journal.path is None
+        assert list(temp_dir.glob("conversion_log_*.csv")) == []
+
+    def test_enabled_returns_journal(self, mock_logger, temp_dir):
+        """Journal activé : instance réelle."""
+        journal = Journal(Config(journal_enabled=True), mock_logger, temp_dir)
+        assert type(journal) is Journal
+
+    def test_errors_only_filters_success(self, mock_logger, temp_dir, make_result):
+        """En mode erreurs seulement, les succès ne sont pas journalisés."""
+        config = Config(journal_enabled=True, journal_errors_only=True)
+        with Journal(config, mock_logger, temp_dir) as journal:
+            journal.log(make_result(ConversionStatus.SUCCESS, "ok.docx"))
+            journal.log(make_result(ConversionStatus.FAILED, "ko.docx"))
+
+        rows = read_rows(journal.path)
+        assert rows[0] == Journal.COLUMNS
+        assert [row[3] for row in rows[1:]] == ["ko.docx"]
+
+    def test_rows_buffered_until_flush_every(self, mock_logger, temp_dir, make_result):
+        """Les lignes sont écrites par lots de journal_flush_every."""
+        config = Config(journal_enabled=True, journal_errors_only=False, journal_flush_every=3)
+        journal = Journal(config, mock_logger, temp_dir)
+        journal.open()
+
+        journal.log(make_result(ConversionStatus.FAILED))
+        journal.log(make_result(ConversionStatus.FAILED))
+        assert len(read_rows(journal.path)) == 1  # En-tête seulement
+
+        journal.log(make_result(ConversionStatus.FAILED))
+        journal._queue.join()  # Attendre le thread d'écriture
+        assert len(read_rows(journal.path)) == 4
+
+        journal.close()
+
+    def test_log_many_written_by_thread(self, mock_logger, temp_dir, make_result):
+        """Les lignes sont écrites par le thread du journal, pas l'appelant."""
+        config = Config(journal_enabled=True, journal_errors_only=False, journal_flush_every=3)
+        journal = Journal(config, mock_logger, temp_dir)
+        writers = []
+        original = journal._write_rows
+
+        def record_thread():
+            writers.append(threading.current_thread().name)
+            original()
+
+        with patch.object(journal, "_write_rows", side_effect=record_thread):
+            journal.log_many([make_result(ConversionStatus.FAILED) for _ in range(5)])
+            journal._queue.join()
+
+        assert writers and set(writers) == {"converter_pdf-journal"}
+        journal.close()
+        assert len(read_rows(journal.path)) == 6
+
+    def test_queue_full_waits_and_keeps_order(self, mock_logger, temp_dir, make_result):
+        """File pleine: l'appelant attend le thread d'écriture, l'ordre est conservé."""
+        config = Config(journal_enabled=True, journal_errors_only=False, journal_flush_every=1)
+        journal = Journal(config, mock_logger, temp_dir)
+        journal.open()
+        put = journal._queue.put
+        timeouts = []
+
+        def full_once(row, timeout=None):
+            if timeout is not None and not timeouts:
+                timeouts.append(timeout)
+                raise queue.Full
+            put(row)
+
+        with patch.object(journal._queue, "put", side_effect=full_once):
+            journal.log_many([
+                make_result(ConversionStatus.FAILED, f"doc{i}.docx") for i in range(3)
+            ])
+        journal.close()
+
+        assert timeouts == [Journal.QUEUE_PUT_TIMEOUT]
+        mock_logger.warning.assert_called_once()
+        assert [row[3] for row in read_rows(journal.path)[1:]] == [
+            "doc0.docx", "doc1.docx", "doc2.docx"
+        ]
+
+    def test_close_stops_writer_thread(self, mock_logger, temp_dir):
+        """close() arrête le thread d'écriture."""
+        config = Config(journal_enabled=True, journal_errors_only=False)
+        journal = Journal(config, mock_logger, temp_dir)
+        journal.open()
+        thread = journal._thread
+
+        journal.close()
+
+        assert not thread.is_alive()
+        assert journal._queue is None
+
+    def test_close_writes_pending_rows(self, mock_logger, temp_dir, make_result):
+        """close() écrit les lignes encore en attente."""
+        config = Config(journal_enabled=True, journal_errors_only=False)
+        journal = Journal(config, mock_logger, temp_dir)
+        journal.log(make_result(ConversionStatus.SUCCESS))
+        journal.close()
+
+        assert len(read_rows(journal.path)) == 2
+
+    def test_fsync_every_row(self, mock_logger, temp_dir, make_result):
+        """journal_fsync_every_row écrit chaque ligne immédiatement."""
+        config = Config(
+            journal_enabled=True,
+            journal_errors_only=False,
+            journal_fsync_every_row=True,
+        )
+        journal = Journal(config, mock_logger, temp_dir)
+        journal.log(make_result(ConversionStatus.SUCCESS))
+
+        assert len(read_rows(journal.path)) == 2
+        journal.close()
+
+    def test_exception_single_line_by_default(self, mock_logger, temp_dir):
+        """Par défaut, l'exception est résumée sur une ligne."""
+        try:
+            raise ValueError("fichier corrompu")
+        except ValueError as e:
+            exc = e
+
+        journal = Journal(Config(journal_enabled=True), mock_logger, temp_dir)
+        assert journal._format_exception(exc) == "ValueError: fichier corrompu"
+
+    def test_exception_full_traceback(self, mock_logger, temp_dir):
+        """journal_full_traceback écrit la trace complète."""
+        try:
+            raise ValueError("fichier corrompu")
+        except ValueError as e:
+            exc = e
+
+        journal = Journal(
+            Config(journal_enabled=True, journal_full_traceback=True), mock_logger, temp_dir
+        )
+        formatted = journal._format_exception(exc)
+        assert formatted.startswith("Traceback")
+        assert formatted.endswith("ValueError: fichier corrompu")
+
+    def test_timestamp_cached_per_second(self, mock_logger, temp_dir):
+        """L'horodatage n'est recalculé qu'au changement de seconde."""
+        journal = Journal(Config(journal_enabled=True), mock_logger, temp_dir)
+
+        with patch("converter_pdf.journal.time.time", return_value=1_700_000_000.2):
+            first = journal._timestamp()
+        with patch("converter_pdf.journal.time.time", return_value=1_700_000_000.9):
+            assert journal._timestamp() is first
+        with patch("converter_pdf.journal.time.time", return_value=1_700_000_001.0):
+            assert journal._timestamp() != first
+
+    def test_invalid_flush_every_raises(self):
+        """journal_flush_every doit être au moins 1."""
+        with pytest.raises(ValueError, match="journal_flush_every"):
+            Config(journal_flush_every=0)
@@ -0,0 +1,347 @@
+"""
+Tests pour le module logger.py.
+
+Teste:
+- Fichier de log (écritures regroupées)
+- Contexte fichier
+- Couleurs console
+- Horodatage en cache
+- Rotation par compteur d'octets
+- File de logs (QueueHandler)
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import uuid
+from unittest.mock import patch
+
+import pytest
+
+from converter_pdf.logger import (
+    ColoredFormatter,
+    ConverterLogger,
+    _CachedTimeFormatter,
+    _FastRotatingHandler,
+)
+
+
+@pytest.fixture
+def file_logger(temp_dir):
+    """Logger avec fichier de log, console silencieuse."""
+    logger = ConverterLogger(f"test_{uuid.uuid4().hex}")
+    log_file = temp_dir / "converter.log"
+    logger.setup(level="CRITICAL", log_file=log_file, console_colors=False)
+    yield logger, log_file
+    logger.close()
+    for handler in list(logger.logger.handlers):
+        handler.close()
+        logger.logger.removeHandler(handler)
+
+
+# =============================================================================
+# Tests fichier de log
+# =============================================================================
+
+class TestFileLogging:
+    """Tests de l'écriture dans le fichier de log."""
+
+    def test_debug_buffered_until_flush(self, file_logger):
+        """Les records DEBUG restent en mémoire jusqu'au vidage."""
+        logger, log_file = file_logger
+
+        logger.debug("message tamponné")
+        assert "message tamponné" not in log_file.read_text(encoding="utf-8")
+
+        logger.flush()
+        assert "message tamponné" in log_file.read_text(encoding="utf-8")
+
+    def test_error_flushes_immediately(self, file_logger):
+        """Un record ERROR vide le tampon immédiatement."""
+        logger, log_file = file_logger
+
+        logger.debug("avant l'erreur")
+        logger.error("erreur grave")
+
+        content = log_file.read_text(encoding="utf-8")
+        assert "avant l'erreur" in content
+        assert "erreur grave" in content
+
+    def test_file_context_in_file(self, file_logger, temp_dir):
+        """Le nom du fichier en cours apparaît dans le log."""
+        logger, log_file = file_logger
+
+        with logger.file_context(temp_dir / "document.docx"):
+            logger.warning("attention")
+        logger.flush()
+
+        assert "[document.docx] attention" in log_file.read_text(encoding="utf-8")
+
+    def test_disabled_level_skips_formatting(self, temp_dir):
+        """Un niveau désactivé n'évalue pas les extras."""
+        logger = ConverterLogger(f"test_{uuid.uuid4().hex}")
+        logger.setup(level="WARNING", console_colors=False)
+
+        class Unformattable:
+            def __format__(self, spec):
+                raise AssertionError("extras formatés pour un niveau désactivé")
+
+        logger.debug("ignoré", value=Unformattable())
+        assert logger.logger.level == logging.WARNING
+
+    def test_level_checked_once_per_call(self, file_logger):
+        """Le niveau n'est vérifié qu'une fois par appel."""
+        logger, _ = file_logger
+
+        with patch.object(logger.logger, "isEnabledFor", wraps=logger.logger.isEnabledFor) as check:
+            logger.debug("message")
+            logger.error("erreur", exc=ValueError("x"), code=3)
+
+        assert check.call_count == 2
+
+    def test_logger_level_is_lowest_handler_level(self, file_logger):
+        """Avec un fichier DEBUG, le logger accepte DEBUG."""
+        logger, _ = file_logger
+        assert logger.logger.isEnabledFor(logging.DEBUG)
+
+    def test_file_context_without_filter(self, file_logger, temp_dir):
+        """Le contexte fichier est injecté sans filtre sur le logger."""
+        logger, _ = file_logger
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        logger.logger.addHandler(handler)
+        try:
+            with logger.file_context(temp_dir / "rapport.xlsx"):
+                logger.info("dans le contexte")
+            logger.info("hors contexte")
+        finally:
+            logger.logger.removeHandler(handler)
+
+        assert logger.logger.filters == []
+        assert [r.file_ctx for r in records] == ["[rapport.xlsx] ", ""]
+
+    def test_buffer_level_follows_file_level(self, file_logger):
+        """Le tampon filtre au niveau du fichier de log."""
+        logger, _ = file_logger
+
+        buffers = [h for h in logger.logger.handlers if isinstance(h, logging.handlers.MemoryHandler)]
+        assert len(buffers) == 1
+        assert buffers[0].level == logging.DEBUG
+
+
+# =============================================================================
+# Tests fermeture
+# =============================================================================
+
+class TestClose:
+    """Tests de close() et de la reconfiguration."""
+
+    def test_close_stops_flush_thread(self, file_logger):
+        """close() arrête le thread de vidage et écrit les records en attente."""
+        logger, log_file = file_logger
+        thread = logger._flush_thread
+        logger.debug("en attente")
+
+        with patch("converter_pdf.logger.atexit.unregister") as unregister:
+            logger.close()
+
+        assert not thread.is_alive()
+        assert logger._flush_thread is None
+        unregister.assert_called_once_with(logger.close)
+        assert "en attente" in log_file.read_text(encoding="utf-8")
+
+    def test_setup_after_close_uses_single_thread(self, file_logger, temp_dir):
+        """Reconfigurer ne laisse pas de thread de vidage orphelin."""
+        logger, _ = file_logger
+        first = logger._flush_thread
+
+        logger.close()
+        logger.setup(level="CRITICAL", log_file=temp_dir / "other.log", console_colors=False)
+
+        assert not first.is_alive()
+        flush_threads = [
+            t for t in threading.enumerate()
+            if t is first or t is logger._flush_thread
+        ]
+        assert flush_threads == [logger._flush_thread]
+
+
+# =============================================================================
+# Tests file de logs
+# =============================================================================
+
+class TestLogQueue:
+    """Tests du passage des logs par une file (start_queue / stop_queue)."""
+
+    def test_records_written_by_listener_thread(self, file_logger):
+        """Les handlers sont appelés depuis le thread du QueueListener."""
+        logger, _ = file_logger
+        threads = []
+        handler = logging.Handler()
+        handler.emit = lambda record: threads.append(threading.current_thread())
+        logger.logger.addHandler(handler)
+
+        logger.start_queue()
+        try:
+            logger.info("en file")
+        finally:
+            logger.stop_queue()
+            logger.logger.removeHandler(handler)
+
+        assert threads and threads[0] is not threading.current_thread()
+
+    def test_stop_restores_handlers(self, file_logger):
+        """stop_queue rétablit les handlers d'origine."""
+        logger, _ = file_logger
+        handlers = list(logger.logger.handlers)
+
+        logger.start_queue()
+        assert [type(h) for h in logger.logger.handlers] == [logging.handlers.QueueHandler]
+        logger.stop_queue()
+
+        assert logger.logger.handlers == handlers
+
+    def test_pending_records_written_on_stop(self, file_logger, temp_dir):
+        """Les records en file et le contexte fichier sont écrits à l'arrêt."""
+        logger, log_file = file_logger
+
+        logger.start_queue()
+        with logger.file_context(temp_dir / "document.docx"):
+            logger.warning("depuis la file")
+        logger.stop_queue()
+        logger.flush()
+
+        assert "[document.docx] depuis la file" in log_file.read_text(encoding="utf-8")
+
+
+# =============================================================================
+# Tests rotation
+# =============================================================================
+
+class TestFastRotatingHandler:
+    """Tests du handler de rotation à compteur d'octets."""
+
+    def test_counter_starts_from_existing_size(self, temp_dir):
+        """Le compteur reprend la taille du fichier existant."""
+        log_file = temp_dir / "existing.log"
+        log_file.write_text("x" * 42, encoding="utf-8")
+
+        handler = _FastRotatingHandler(log_file, maxBytes=1000, backupCount=1, encoding="utf-8")
+        try:
+            assert handler._bytes_written == 42
+        finally:
+            handler.close()
+
+    def test_rollover_when_counter_exceeds_max(self, temp_dir):
+        """La rotation a lieu quand le compteur dépasse maxBytes."""
+        log_file = temp_dir / "rotate.log"
+        handler = _FastRotatingHandler(log_file, maxBytes=100, backupCount=2, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        try:
+            for i in range(5):
+                handler.emit(logging.makeLogRecord({"msg": f"ligne {i} " + "x" * 30, "levelno": logging.INFO}))
+        finally:
+            handler.close()
+
+        backup = temp_dir / "rotate.log.1"
+        assert backup.exists()
+        assert log_file.stat().st_size <= 100
+        assert "ligne 4" in log_file.read_text(encoding="utf-8")
+        assert handler._bytes_written == log_file.stat().st_size
+
+
+    def test_stream_flushed_on_error_only(self, temp_dir):
+        """Les records sous ERROR restent dans le tampon du fichier."""
+        log_file = temp_dir / "buffered.log"
+        handler = _FastRotatingHandler(log_file, maxBytes=0, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        try:
+            handler.emit(logging.makeLogRecord({"msg": "debug", "levelno": logging.DEBUG}))
+            assert log_file.read_text(encoding="utf-8") == ""
+
+            handler.emit(logging.makeLogRecord({"msg": "erreur", "levelno": logging.ERROR}))
+            assert log_file.read_text(encoding="utf-8") == "debug\nerreur\n"
+        finally:
+            handler.close()
+
+# =============================================================================
+# Tests couleurs console
+# =============================================================================
+
+class TestColoredFormatter:
+    """Tests du formatter console coloré."""
+
+    def make_record(self, level: int = logging.WARNING) -> logging.LogRecord:
+        return logging.makeLogRecord({
+            "msg": "message",
+            "levelno": level,
+            "levelname": logging.getLevelName(level),
+        })
+
+    def test_isatty_checked_once(self):
+        """isatty() est appelé à la construction, pas à chaque record."""
+        with patch("converter_pdf.logger.sys.stdout") as stdout:
+            stdout.isatty.return_value = True
+            formatter = ColoredFormatter("%(levelname)s %(message)s")
+            formatter.format(self.make_record())
+            formatter.format(self.make_record())
+
+        assert stdout.isatty.call_count == 1
+
+    def test_level_colored_on_tty(self):
+        """Sur un terminal, le niveau est coloré."""
+        with patch("converter_pdf.logger.sys.stdout") as stdout:
+            stdout.isatty.return_value = True
+            formatter = ColoredFormatter("%(levelname)s %(message)s")
+
+        message = formatter.format(self.make_record(logging.ERROR))
+        assert message == f"{ColoredFormatter.COLORS[logging.ERROR]}\033[1mERROR\033[0m message"
+
+    def test_colored_level_keeps_alignment(self):
+        """L'alignement du niveau est conservé, hors codes couleur."""
+        with patch("converter_pdf.logger.sys.stdout") as stdout:
+            stdout.isatty.return_value = True
+            formatter = ColoredFormatter("%(levelname)-7s| %(message)s")
+
+        message = formatter.format(self.make_record(logging.INFO))
+        assert message == f"{ColoredFormatter.COLORS[logging.INFO]}\033[1mINFO\033[0m   | message"
+
+    def test_no_colors_when_disabled(self):
+        """Sans couleurs, le message est inchangé."""
+        formatter = ColoredFormatter("%(levelname)s %(message)s", include_colors=False)
+        assert formatter.format(self.make_record()) == "WARNING message"
+
+
+# =============================================================================
+# Tests horodatage
+# =============================================================================
+
+class TestCachedTimeFormatter:
+    """Tests du cache d'horodatage."""
+
+    def make_record(self, created: float) -> logging.LogRecord:
+        record = logging.makeLogRecord({"msg": "message"})
+        record.created = created
+        return record
+
+    def test_strftime_once_per_second(self):
+        """strftime n'est appelé qu'au changement de seconde."""
+        formatter = _CachedTimeFormatter("%(asctime)s %(message)s", datefmt="%H:%M:%S")
+
+        with patch("converter_pdf.logger.time.strftime", wraps=time.strftime) as strftime:
+            first = formatter.formatTime(self.make_record(1_700_000_000.1), "%H:%M:%S")
+            same = formatter.formatTime(self.make_record(1_700_000_000.8), "%H:%M:%S")
+            formatter.formatTime(self.make_record(1_700_000_001.0), "%H:%M:%S")
+
+        assert first == same
+        assert strftime.call_count == 2
+
+    def test_matches_standard_formatter(self):
+        """Le résultat est identique à celui de logging.Formatter."""
+        record = self.make_record(1_700_000_000.5)
+        expected = logging.Formatter(datefmt="%Y-%m-%d %H:%M:%S").formatTime(record, "%Y-%m-%d %H:%M:%S")
+        assert _CachedTimeFormatter().formatTime(record, "%Y-%m-%d %H:%M:%S") == expected
+
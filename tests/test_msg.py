@@ -409,6 +409,102 @@ class TestFilteringThresholds:
         assert converter.ALWAYS_FILTER_SURFACE == 25000  # ~158x158px
 
 
+# =============================================================================
+# Tests extraction du contenu
+# =============================================================================
+
+class TestMsgExtractContent:
+    """Tests de l'extraction unique du contenu du message."""
+
+    def test_extract_content_fields(self, mock_logger):
+        """Les métadonnées et le corps sont extraits dans MessageContent."""
+        from datetime import datetime
+        from converter_pdf.converters.msg import MsgConverter, MessageContent
+
+        converter = MsgConverter(Config(), mock_logger)
+        msg = MagicMock(spec=["subject", "sender", "to", "date", "body", "htmlBody"])
+        msg.subject = "Sujet"
+        msg.sender = "a@example.com"
+        msg.to = None
+        msg.date = datetime(2024, 1, 2, 3, 4, 5)
+        msg.body = "Corps"
+        msg.htmlBody = b"<p>Corps</p>"
+
+        content = converter._extract_content(msg)
+
+        assert isinstance(content, MessageContent)
+        assert content.subject == "Sujet"
+        assert content.sender == "a@example.com"
+        assert content.to == ""
+        assert content.date == "2024-01-02 03:04:05"
+        assert content.body == "Corps"
+        assert content.html_body == b"<p>Corps</p>"
+
+    def test_extract_content_string_date(self, mock_logger):
+        """Une date déjà au format texte est conservée."""
+        from converter_pdf.converters.msg import MsgConverter
+
+        converter = MsgConverter(Config(), mock_logger)
+        msg = MagicMock(spec=["date"])
+        msg.date = "Mon, 1 Jan 2024"
+
+        content = converter._extract_content(msg)
+
+        assert content.date == "Mon, 1 Jan 2024"
+        assert content.subject == ""
+        assert content.html_body is None
+
+
+class TestMsgStripHtml:
+    """Tests du nettoyage HTML avant rendu navigateur."""
+
+    def test_strip_scripts_and_refresh(self, mock_logger):
+        """Les scripts et <meta refresh> sont supprimés."""
+        from converter_pdf.converters.msg import MsgConverter
+
+        converter = MsgConverter(Config(), mock_logger)
+        html = (
+            '<meta http-equiv="refresh" content="0; url=http://x">'
+            "<SCRIPT type='text/javascript'>alert(1);\n</SCRIPT>"
+            "<p>Bonjour</p><script src='a.js'></script>"
+        )
+
+        assert converter._strip_html(html) == "<p>Bonjour</p>"
+
+    def test_strip_keeps_styles(self, mock_logger):
+        """Les feuilles de style (mise en forme Outlook) sont conservées."""
+        from converter_pdf.converters.msg import MsgConverter
+
+        converter = MsgConverter(Config(), mock_logger)
+        html = "<style>p { color: red; }</style><p>Texte</p>"
+
+        assert converter._strip_html(html) == html
+
+
+class TestMsgSplitLines:
+    """Tests du découpage du corps texte en blocs."""
+
+    def test_split_lines_chunks(self, mock_logger):
+        """Le texte est découpé en blocs de TEXT_CHUNK_LINES lignes."""
+        from converter_pdf.converters.msg import MsgConverter
+
+        converter = MsgConverter(Config(), mock_logger)
+        text = "\n".join(f"ligne {i}" for i in range(450))
+
+        chunks = converter._split_lines(text, 200)
+
+        assert [len(c.split("\n")) for c in chunks] == [200, 200, 50]
+        assert "\n".join(chunks) == text
+
+    def test_split_lines_short_text(self, mock_logger):
+        """Un texte court reste en un seul bloc."""
+        from converter_pdf.converters.msg import MsgConverter
+
+        converter = MsgConverter(Config(), mock_logger)
+
+        assert converter._split_lines("a\nb") == ["a\nb"]
+
+
 # =============================================================================
 # Tests de conversion (sans dépendances)
 # =============================================================================
@@ -7,10 +7,13 @@ Teste:
 - Traitement de fichiers individuels
 - Traitement de répertoires
 - Statistiques
+- Traitement parallèle
 """
 
 from __future__ import annotations
 
+import os
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -18,7 +21,8 @@ import pytest
 
 from converter_pdf.config import Config
 from converter_pdf.converters.base import ConversionResult, ConversionStatus
-from converter_pdf.processor import FileProcessor, format_size
+from converter_pdf.journal import Journal
+from converter_pdf.processor import FileProcessor, _iter_files, _prefetch, format_size
 
 
 # =============================================================================
@@ -50,6 +54,12 @@ class TestFormatSize:
         assert format_size(1024 * 1024 * 1024) == "1.00 GB"
         assert format_size(1024 * 1024 * 1024 * 2.5) == "2.50 GB"
 
+    def test_unit_boundaries(self):
+        """Le changement d'unité se fait exactement à chaque puissance de 1024."""
+        assert format_size(1024 * 1024 - 1) == "1024.0 KB"
+        assert format_size(1024 ** 4) == "1024.00 GB"
+        assert format_size(0.6) == "1 B"
+
 
 # =============================================================================
 # Tests FileProcessor - Initialisation
@@ -134,6 +144,17 @@ class TestFileProcessorDestPath:
         assert dest.parent == dest_dir
         assert dest_dir.exists()  # Créé automatiquement
 
+    def test_dest_dir_created_once(self, mock_logger, temp_dir):
+        """Le répertoire de destination n'est créé qu'une fois."""
+        processor = FileProcessor(Config(), mock_logger)
+        dest_dir = temp_dir / "output"
+
+        with patch("converter_pdf.processor.os.makedirs", wraps=os.makedirs) as makedirs:
+            processor._get_dest_path(temp_dir / "a.docx", dest_dir)
+            processor._get_dest_path(temp_dir / "b.docx", dest_dir)
+
+        makedirs.assert_called_once_with(dest_dir, exist_ok=True)
+
 
 # =============================================================================
 # Tests FileProcessor - process_file
@@ -152,6 +173,18 @@ class TestFileProcessorProcessFile:
 
         assert result.status == ConversionStatus.SKIPPED_PDF
 
+    def test_pdf_skip_does_not_compute_dest(self, mock_logger, temp_dir):
+        """Un PDF ignoré ne calcule pas de destination (pas de mkdir)."""
+        processor = FileProcessor(Config(), mock_logger)
+        source = temp_dir / "document.pdf"
+        source.write_bytes(b"%PDF-1.4 test")
+
+        with patch.object(processor, "_get_dest_path") as get_dest_path:
+            result = processor.process_file(source, temp_dir)
+
+        assert result.status == ConversionStatus.SKIPPED_PDF
+        get_dest_path.assert_not_called()
+
     def test_process_existing_pdf_skipped(self, mock_logger, temp_dir):
         """Si le PDF existe déjà, le fichier est ignoré."""
         config = Config(force=False)
@@ -181,6 +214,55 @@ class TestFileProcessorProcessFile:
         # Ne devrait pas être SKIPPED_EXISTS
         assert result.status != ConversionStatus.SKIPPED_EXISTS
 
+    def test_process_incremental_skips_up_to_date(self, mock_logger, temp_dir):
+        """En mode incrémental, un PDF plus récent que le source est conservé."""
+        import os
+
+        config = Config(incremental=True)
+        processor = FileProcessor(config, mock_logger)
+
+        source = temp_dir / "document.txt"
+        source.write_text("test")
+        dest = temp_dir / "document.txt.pdf"
+        dest.write_bytes(b"%PDF-1.4 existing")
+        os.utime(source, (1_000_000, 1_000_000))
+
+        result = processor.process_file(source)
+
+        assert result.status == ConversionStatus.SKIPPED_UNCHANGED
+        assert result.is_skipped
+
+    def test_process_incremental_reconverts_stale(self, mock_logger, temp_dir):
+        """En mode incrémental, un PDF plus ancien que le source est remplacé."""
+        import os
+
+        config = Config(incremental=True)
+        processor = FileProcessor(config, mock_logger)
+
+        source = temp_dir / "document.txt"
+        source.write_text("test")
+        dest = temp_dir / "document.txt.pdf"
+        dest.write_bytes(b"%PDF-1.4 old")
+        os.utime(dest, (1_000_000, 1_000_000))
+
+        mock_converter = MagicMock()
+        mock_converter.can_convert.return_value = True
+        mock_converter.is_available.return_value = True
+        mock_converter.convert.return_value = ConversionResult(
+            status=ConversionStatus.SUCCESS,
+            source=source,
+            dest=dest,
+            duration=0.1,
+            method="mock",
+        )
+        processor.converters = [mock_converter]
+
+        result = processor.process_file(source)
+
+        assert result.status == ConversionStatus.SUCCESS
+        # Le PDF obsolète est remplacé, pas de document.txt_1.pdf
+        mock_converter.convert.assert_called_once_with(source, dest)
+
     def test_process_unsupported_format(self, mock_logger, temp_dir):
         """Un format non supporté retourne SKIPPED_UNSUPPORTED."""
         processor = FileProcessor(Config(), mock_logger)
@@ -233,6 +315,27 @@ class TestFileProcessorProcessFile:
             # Le source devrait être supprimé (ou tentative de suppression)
             pass  # Dépend de l'implémentation
 
+    def test_directory_deletes_sources_in_background(self, mock_logger, temp_dir, file_factory):
+        """Pendant process_directory, les sources sont supprimés par un thread dédié."""
+        config = Config(report_enabled=False, delete_source=True)
+        processor = FileProcessor(config, mock_logger)
+        sources = [file_factory.create_text_file(f"doc{i}.txt", "content") for i in range(3)]
+        deleters = []
+        original_unlink = os.unlink
+
+        def record_unlink(path):
+            deleters.append(threading.current_thread().name)
+            original_unlink(path)
+
+        with patch("converter_pdf.processor.os.unlink", side_effect=record_unlink):
+            stats = processor.process_directory(temp_dir)
+
+        deleted = stats["success"]
+        assert deleted > 0
+        assert sum(not source.exists() for source in sources) == deleted
+        assert set(deleters) == {"converter_pdf-delete"}
+        assert processor._delete_thread is None
+
 
 # =============================================================================
 # Tests FileProcessor - process_directory
@@ -321,6 +424,123 @@ class TestFileProcessorProcessDirectory:
         assert stats["skipped"] >= 1
 
 
+# =============================================================================
+# Tests _iter_files
+# =============================================================================
+
+class TestIterFiles:
+    """Tests du parcours des fichiers à traiter."""
+
+    def test_filters_by_extension(self, temp_dir):
+        """Seules les extensions demandées sont retenues (casse ignorée)."""
+        (temp_dir / "a.txt").write_text("a")
+        (temp_dir / "B.TXT").write_text("b")
+        (temp_dir / "image.png").write_bytes(b"")
+        (temp_dir / "sans_extension").write_text("")
+
+        files = list(_iter_files(temp_dir, False, frozenset({".txt"})))
+
+        assert [f.name for f, _ in files] == ["B.TXT", "a.txt"]
+
+    def test_recursive(self, temp_dir):
+        """Les sous-répertoires ne sont parcourus qu'en mode récursif."""
+        sub = temp_dir / "sub" / "deep"
+        sub.mkdir(parents=True)
+        (temp_dir / "root.txt").write_text("r")
+        (sub / "nested.txt").write_text("n")
+
+        assert [f for f, _ in _iter_files(temp_dir, False, frozenset({".txt"}))] == [temp_dir / "root.txt"]
+        assert [f for f, _ in _iter_files(temp_dir, True, frozenset({".txt"}))] == sorted(
+            [temp_dir / "root.txt", sub / "nested.txt"]
+        )
+
+    def test_same_order_as_glob(self, temp_dir):
+        """L'ordre est celui de sorted(directory.glob("**/*"))."""
+        for name in ("b/z.txt", "a/y.txt", "a-b.txt", "c.txt"):
+            path = temp_dir / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("x")
+
+        expected = [p for p in sorted(temp_dir.glob("**/*")) if p.is_file()]
+        assert [f for f, _ in _iter_files(temp_dir, True, frozenset({".txt"}))] == expected
+
+    def test_lazy_walk(self, temp_dir):
+        """Le premier fichier est produit avant la lecture des autres répertoires."""
+        (temp_dir / "a.txt").write_text("a")
+        (temp_dir / "z").mkdir()
+        (temp_dir / "z" / "b.txt").write_text("b")
+
+        with patch("converter_pdf.processor.os.scandir", wraps=os.scandir) as scandir:
+            files = _iter_files(temp_dir, True, frozenset({".txt"}))
+            first, _ = next(files)
+            assert first == temp_dir / "a.txt"
+            assert scandir.call_count == 1
+            assert [f for f, _ in files] == [temp_dir / "z" / "b.txt"]
+
+    def test_stat_returned_with_path(self, temp_dir):
+        """Le stat de chaque fichier est fourni avec son chemin."""
+        (temp_dir / "doc.txt").write_text("12345")
+
+        [(path, stat)] = _iter_files(temp_dir, False, frozenset({".txt"}))
+
+        assert path == temp_dir / "doc.txt"
+        assert stat.st_size == 5
+
+
+# =============================================================================
+# Tests _prefetch
+# =============================================================================
+
+class TestPrefetch:
+    """Tests de la lecture anticipée par un thread."""
+
+    def test_items_in_order(self):
+        """Tous les éléments sont produits, dans l'ordre."""
+        assert list(_prefetch(iter(range(100)), size=4)) == list(range(100))
+
+    def test_items_produced_by_other_thread(self):
+        """L'itérateur source est consommé hors du thread appelant."""
+        threads = []
+
+        def source():
+            for i in range(3):
+                threads.append(threading.current_thread())
+                yield i
+
+        list(_prefetch(source()))
+        assert threads and threading.current_thread() not in threads
+
+    def test_producer_stops_when_closed(self):
+        """Abandonner l'itération arrête le thread de lecture."""
+        stopped = threading.Event()
+
+        def endless():
+            try:
+                i = 0
+                while True:
+                    yield i
+                    i += 1
+            finally:
+                stopped.set()
+
+        items = _prefetch(endless(), size=2)
+        assert next(items) == 0
+        items.close()
+
+        assert stopped.wait(2)
+
+    def test_error_propagated(self):
+        """Une erreur du parcours est relevée chez l'appelant."""
+        def failing():
+            yield 1
+            raise RuntimeError("parcours")
+
+        items = _prefetch(failing())
+        assert next(items) == 1
+        with pytest.raises(RuntimeError, match="parcours"):
+            next(items)
+
+
 # =============================================================================
 # Tests FileProcessor - Interruption
 # =============================================================================
@@ -355,6 +575,346 @@ class TestFileProcessorInterruption:
         # Devrait s'arrêter avant de traiter tous les fichiers
         assert stats["total"] < 5
 
+    def test_interrupted_backed_by_event(self, mock_logger):
+        """_interrupted reflète l'Event partagé avec les threads."""
+        processor = FileProcessor(Config(report_enabled=False), mock_logger)
+
+        processor._interrupted = True
+        assert processor._stop.is_set()
+        processor._interrupted = False
+        assert not processor._stop.is_set()
+
+    def test_signal_only_sets_stop(self, mock_logger):
+        """Ctrl+C lève seulement le drapeau, sans toucher au pool."""
+        processor = FileProcessor(Config(report_enabled=False, workers=2), mock_logger)
+        processor._executor = MagicMock()
+
+        with patch("converter_pdf.processor.signal.signal") as install:
+            processor._setup_signal_handler()
+        handler = install.call_args.args[1]
+        handler(2, None)
+
+        assert processor._interrupted is True
+        processor._executor.shutdown.assert_not_called()
+
+
+# =============================================================================
+# Tests FileProcessor - Convertisseurs disponibles
+# =============================================================================
+
+class TestFileProcessorAvailableConverters:
+    """Tests de l'index des convertisseurs disponibles par extension."""
+
+    def make_converter(self, extension: str, available: bool = True) -> MagicMock:
+        converter = MagicMock()
+        converter.can_convert.side_effect = lambda ext: ext == extension
+        converter.is_available.return_value = available
+        return converter
+
+    def test_availability_checked_once(self, mock_logger):
+        """is_available() n'est appelé qu'à l'affectation de la chaîne."""
+        processor = FileProcessor(Config(), mock_logger)
+        converter = self.make_converter(".txt")
+        processor.converters = [converter]
+
+        for _ in range(3):
+            assert processor._converters_for(".TXT") == [converter]
+
+        assert converter.is_available.call_count == 1
+        assert converter.can_convert.call_count == 1
+
+    def test_unavailable_converter_excluded(self, mock_logger):
+        """Un convertisseur indisponible n'est jamais proposé."""
+        processor = FileProcessor(Config(), mock_logger)
+        processor.converters = [self.make_converter(".txt", available=False)]
+
+        assert processor._converters_for(".txt") == []
+
+    def test_refresh_available(self, mock_logger):
+        """refresh_available() prend en compte un changement d'environnement."""
+        processor = FileProcessor(Config(), mock_logger)
+        converter = self.make_converter(".docx", available=False)
+        processor.converters = [converter]
+        assert processor._converters_for(".docx") == []
+
+        converter.is_available.return_value = True
+        processor.refresh_available()
+
+        assert processor._converters_for(".docx") == [converter]
+
+
+# =============================================================================
+# Tests FileProcessor - Cache des destinations
+# =============================================================================
+
+class TestFileProcessorDestCache:
+    """Tests du cache des noms de PDF existants."""
+
+    def test_without_cache_uses_filesystem(self, mock_logger, temp_dir):
+        """Hors process_directory, l'existence est vérifiée sur disque."""
+        processor = FileProcessor(Config(), mock_logger)
+        dest = temp_dir / "doc.pdf"
+
+        assert processor._dest_exists(dest) is False
+        dest.write_bytes(b"%PDF")
+        assert processor._dest_exists(dest) is True
+
+    def test_directory_scanned_once(self, mock_logger, temp_dir):
+        """Le répertoire est lu une seule fois, puis le cache fait foi."""
+        processor = FileProcessor(Config(), mock_logger)
+        processor._dest_cache = {}
+        (temp_dir / "existing.pdf").write_bytes(b"%PDF")
+
+        with patch("converter_pdf.processor.os.scandir", wraps=os.scandir) as scandir:
+            assert processor._dest_exists(temp_dir / "existing.pdf") is True
+            assert processor._dest_exists(temp_dir / "other.pdf") is False
+        assert scandir.call_count == 1
+
+    def test_created_pdf_marked(self, mock_logger, temp_dir):
+        """Un PDF créé pendant le traitement est ajouté au cache."""
+        processor = FileProcessor(Config(), mock_logger)
+        processor._dest_cache = {}
+        dest = temp_dir / "new.pdf"
+
+        assert processor._dest_exists(dest) is False
+        processor._mark_dest_created(dest)
+        assert processor._dest_exists(dest) is True
+
+    def test_cache_released_after_directory(self, mock_logger, temp_dir, file_factory):
+        """Le cache n'est conservé que pendant process_directory."""
+        processor = FileProcessor(Config(report_enabled=False), mock_logger)
+        file_factory.create_text_file("doc.txt")
+
+        processor.process_directory(temp_dir)
+
+        assert processor._dest_cache is None
+
+
+# =============================================================================
+# Tests FileProcessor - Traitement parallèle
+# =============================================================================
+
+class TestFileProcessorParallel:
+    """Tests du traitement parallèle (config.workers > 1)."""
+
+    def test_all_files_processed(self, mock_logger, temp_dir, file_factory):
+        """Tous les fichiers sont traités et comptés."""
+        config = Config(report_enabled=False, workers=4)
+        processor = FileProcessor(config, mock_logger)
+
+        for i in range(6):
+            file_factory.create_text_file(f"doc{i}.txt", f"content {i}")
+
+        stats = processor.process_directory(temp_dir)
+
+        assert stats["total"] == 6
+        assert stats["success"] + stats["failed"] + stats["skipped"] == 6
+
+    def test_same_stem_gets_distinct_pdfs(self, mock_logger, temp_dir, file_factory):
+        """Deux sources de même nom ne visent pas le même PDF."""
+        config = Config(report_enabled=False, workers=2, dry_run=True, keep_extension=False)
+        processor = FileProcessor(config, mock_logger)
+
+        first = processor.process_file(file_factory.create_text_file("doc.txt"))
+        second = processor.process_file(file_factory.create_text_file("doc.log"))
+
+        assert first.dest.name == "doc.pdf"
+        assert second.dest.name == "doc_1.pdf"
+
+    def test_collision_suffix_resumes_from_last(self, mock_logger, temp_dir, file_factory):
+        """Les conflits successifs reprennent au dernier suffixe attribué."""
+        config = Config(report_enabled=False, workers=2, dry_run=True, keep_extension=False)
+        processor = FileProcessor(config, mock_logger)
+        out = temp_dir / "out"
+        sources = []
+        for i in range(4):
+            (temp_dir / f"dir{i}").mkdir()
+            sources.append(file_factory.create_text_file(f"dir{i}/doc.txt"))
+
+        names = [processor.process_file(source, out).dest.name for source in sources[:3]]
+        with patch.object(processor, "_dest_exists", wraps=processor._dest_exists) as exists:
+            names.append(processor.process_file(sources[3], out).dest.name)
+
+        assert names == ["doc.pdf", "doc_1.pdf", "doc_2.pdf", "doc_3.pdf"]
+        # doc.pdf (deux vérifications) puis doc_3.pdf seulement
+        assert exists.call_count == 3
+
+    def test_largest_files_submitted_first(self, mock_logger, temp_dir, file_factory):
+        """Les fichiers sont soumis au pool du plus gros au plus petit."""
+        config = Config(report_enabled=False, workers=2)
+        processor = FileProcessor(config, mock_logger)
+        paths = [
+            file_factory.create_text_file("small.txt", "x"),
+            file_factory.create_text_file("large.txt", "x" * 1000),
+            file_factory.create_text_file("medium.txt", "x" * 100),
+        ]
+        files = [(path, path.stat()) for path in paths]
+        submitted = []
+
+        def fake_process(source, dest_dir, stat):
+            submitted.append(source.name)
+            return None
+
+        with patch.object(processor, "_process_if_running", side_effect=fake_process):
+            with patch("converter_pdf.processor.ThreadPoolExecutor") as executor_cls:
+                executor = executor_cls.return_value.__enter__.return_value
+                executor.submit.side_effect = lambda fn, *args: fn(*args)
+                with patch("converter_pdf.processor.as_completed", return_value=[]):
+                    processor._process_files_parallel(files, None)
+
+        assert submitted == ["large.txt", "medium.txt", "small.txt"]
+
+    def test_unsafe_converter_is_serial(self, mock_logger):
+        """Une extension gérée par un convertisseur non thread-safe est séquentielle."""
+        processor = FileProcessor(Config(workers=4), mock_logger)
+        unsafe = MagicMock(thread_safe=False)
+        unsafe.can_convert.side_effect = lambda ext: ext == ".docx"
+        unsafe.is_available.return_value = True
+        processor.converters = [unsafe]
+
+        assert processor._is_thread_safe(".docx") is False
+        assert processor._is_thread_safe(".txt") is True
+
+    def test_archives_are_serial(self, mock_logger, temp_dir):
+        """Les archives (contenu converti par la chaîne complète) sont séquentielles."""
+        processor = FileProcessor(Config(workers=4), mock_logger)
+        files = [(temp_dir / name, None) for name in ("a.zip", "b.7z", "c.tar", "d.txt")]
+        pooled = []
+        serial = []
+
+        def fake_pooled(source, dest_dir, stat):
+            pooled.append(source.name)
+            return None
+
+        def fake_serial(source, dest_dir, stat):
+            serial.append(source.name)
+            return MagicMock(is_success=True)
+
+        with patch.object(processor, "_process_if_running", side_effect=fake_pooled), \
+                patch.object(processor, "process_file", side_effect=fake_serial), \
+                patch("converter_pdf.processor.ThreadPoolExecutor") as executor_cls, \
+                patch("converter_pdf.processor.as_completed", return_value=[]):
+            executor = executor_cls.return_value.__enter__.return_value
+            executor.submit.side_effect = lambda fn, *args: fn(*args)
+            processor._process_files_parallel(files, None)
+
+        assert pooled == ["d.txt"]
+        assert serial == ["a.zip", "b.7z", "c.tar"]
+
+    def test_parallel_html_use_separate_browser_profiles(self, mock_logger, temp_dir, file_factory):
+        """Deux conversions HTML simultanées n'ont jamais le même profil navigateur."""
+        import time as time_module
+
+        from converter_pdf.converters import html as html_module
+        from converter_pdf.converters.html import HtmlConverter
+
+        file_factory.create_html_file("a.html")
+        file_factory.create_html_file("b.html")
+        both_running = threading.Barrier(2, timeout=5)
+        profiles = []
+
+        def fake_run(cmd, **kwargs):
+            profile = Path(next(a for a in cmd if a.startswith("--user-data-dir="))
+                           .split("=", 1)[1])
+            profiles.append(profile)
+            both_running.wait()  # Les deux navigateurs tournent en même temps
+            assert profile.is_dir()
+            dest = next(a for a in cmd if a.startswith("--print-to-pdf="))
+            Path(dest.split("=", 1)[1]).write_bytes(b"%PDF-1.4")
+            return MagicMock(returncode=0, stderr="")
+
+        # Même milliseconde pour les deux appels
+        fake_time = MagicMock(wraps=time_module)
+        fake_time.time.return_value = 1_700_000_000.0
+
+        with patch.object(HtmlConverter, "browser_path", temp_dir / "chrome"), \
+                patch.object(html_module, "time", fake_time), \
+                patch("converter_pdf.converters.html.subprocess.run", side_effect=fake_run):
+            processor = FileProcessor(Config(report_enabled=False, workers=2), mock_logger)
+            stats = processor.process_directory(temp_dir)
+
+        assert stats["success"] == 2
+        assert len(set(profiles)) == 2
+        assert not any(profile.exists() for profile in profiles)
+
+    def test_interrupted_skips_pending(self, mock_logger, temp_dir, file_factory):
+        """Après interruption, les fichiers en attente ne sont pas traités."""
+        config = Config(report_enabled=False, workers=2)
+        processor = FileProcessor(config, mock_logger)
+        processor._interrupted = True
+
+        assert processor._process_if_running(file_factory.create_text_file(), None) is None
+
+    def test_log_queue_used_while_processing(self, mock_logger, temp_dir, file_factory):
+        """Les logs passent par une file pendant le traitement parallèle."""
+        processor = FileProcessor(Config(report_enabled=False, workers=2), mock_logger)
+        file_factory.create_text_file("doc.txt")
+
+        processor.process_directory(temp_dir)
+
+        mock_logger.start_queue.assert_called_once()
+        mock_logger.stop_queue.assert_called_once()
+
+    def test_cached_stat_skips_source_stat(self, mock_logger, temp_dir, file_factory):
+        """Un stat fourni par le parcours évite un nouveau stat du source."""
+        processor = FileProcessor(Config(report_enabled=False, dry_run=True), mock_logger)
+        source = file_factory.create_text_file("doc.txt", "contenu")
+        stat = source.stat()
+
+        with patch.object(Path, "stat", autospec=True, side_effect=Path.stat) as path_stat:
+            result = processor.process_file(source, stat=stat)
+
+        assert source not in [call.args[0] for call in path_stat.call_args_list]
+        assert result.source_size == stat.st_size
+
+    def test_interrupt_cancels_pending_futures(self, mock_logger, temp_dir, file_factory):
+        """Une interruption annule les tâches du pool non démarrées."""
+        processor = FileProcessor(Config(report_enabled=False, workers=2), mock_logger)
+        files = [(file_factory.create_text_file(f"doc{i}.txt"), None) for i in range(3)]
+        futures = [MagicMock() for _ in files]
+        futures[0].cancelled.return_value = False
+        futures[0].result.return_value = None
+        for future in futures[1:]:
+            future.cancelled.return_value = True
+
+        def completed(pending):
+            processor._interrupted = True  # Ctrl+C pendant l'attente
+            yield from pending
+
+        with patch("converter_pdf.processor.ThreadPoolExecutor") as executor_cls:
+            executor = executor_cls.return_value.__enter__.return_value
+            executor.submit.side_effect = futures
+            with patch("converter_pdf.processor.as_completed", side_effect=completed):
+                processor._process_files_parallel(files, None)
+
+        executor.shutdown.assert_called_with(wait=False, cancel_futures=True)
+        futures[1].result.assert_not_called()
+        assert processor.stats["total"] == 0
+        assert processor._executor is None
+
+    def test_interrupt_stops_submitting(self, mock_logger, temp_dir, file_factory):
+        """Après interruption, plus aucun fichier n'est soumis au pool."""
+        processor = FileProcessor(Config(report_enabled=False, workers=2), mock_logger)
+        files = [(file_factory.create_text_file(f"doc{i}.txt"), None) for i in range(3)]
+        processor._interrupted = True
+
+        with patch("converter_pdf.processor.ThreadPoolExecutor") as executor_cls:
+            executor = executor_cls.return_value.__enter__.return_value
+            processor._process_files_parallel(files, None)
+
+        executor.submit.assert_not_called()
+
+    def test_executor_cleared_on_error(self, mock_logger, temp_dir, file_factory):
+        """Le pool est oublié même si le traitement lève une exception."""
+        processor = FileProcessor(Config(report_enabled=False, workers=2), mock_logger)
+        files = [(file_factory.create_text_file("doc.txt"), None)]
+
+        with patch("converter_pdf.processor.as_completed", side_effect=RuntimeError("boom")):
+            with pytest.raises(RuntimeError):
+                processor._process_files_parallel(files, None)
+
+        assert processor._executor is None
+
 
 # =============================================================================
 # Tests FileProcessor - Rapport
@@ -388,6 +948,101 @@ class TestFileProcessorReport:
         assert len(reports) == 0
 
 
+# =============================================================================
+# Tests FileProcessor - Journal CSV
+# =============================================================================
+
+class TestFileProcessorJournal:
+    """Tests de l'écriture du journal CSV pendant le traitement."""
+
+    def test_journal_written_after_directory(self, mock_logger, temp_dir, file_factory):
+        """Chaque fichier traité produit une ligne dans le journal."""
+        config = Config(
+            report_enabled=False,
+            journal_enabled=True,
+            journal_errors_only=False,
+            journal_flush_every=2,
+        )
+        processor = FileProcessor(config, mock_logger)
+        for i in range(3):
+            file_factory.create_text_file(f"doc{i}.txt", f"content {i}")
+
+        processor.process_directory(temp_dir)
+
+        journals = list(temp_dir.glob("conversion_log_*.csv"))
+        assert len(journals) == 1
+        lines = journals[0].read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 4  # En-tête + 3 fichiers
+
+    def test_result_logged_when_recorded(self, mock_logger):
+        """Chaque résultat est transmis au journal dès son enregistrement."""
+        processor = FileProcessor(Config(journal_flush_every=3), mock_logger)
+        processor.journal = MagicMock()
+        result = ConversionResult(
+            status=ConversionStatus.FAILED,
+            source=Path("doc.txt"),
+            dest=None,
+            duration=0,
+            method="test",
+        )
+
+        processor._record_result(result)
+
+        processor.journal.log.assert_called_once_with(result)
+
+    def test_fsync_journal_row_on_disk_when_recorded(self, mock_logger, temp_dir):
+        """Avec journal_fsync_every_row, la ligne est sur disque dès l'enregistrement."""
+        config = Config(journal_enabled=True, journal_errors_only=False, journal_fsync_every_row=True)
+        processor = FileProcessor(config, mock_logger)
+        processor.journal = Journal(config, mock_logger, temp_dir)
+        result = ConversionResult(
+            status=ConversionStatus.FAILED,
+            source=Path("doc.txt"),
+            dest=None,
+            duration=0,
+            method="test",
+        )
+
+        processor._record_result(result)
+
+        lines = processor.journal.path.read_text(encoding="utf-8").splitlines()
+        processor.journal.close()
+        assert len(lines) == 2
+
+
+# =============================================================================
+# Tests FileProcessor - Affichage
+# =============================================================================
+
+class TestFileProcessorOutput:
+    """Tests de l'affichage de la configuration et du résumé."""
+
+    def test_config_single_write(self, mock_logger, temp_dir):
+        """La configuration est écrite en un seul appel."""
+        processor = FileProcessor(Config(), mock_logger)
+
+        with patch("converter_pdf.processor.sys.stdout") as stdout:
+            processor._print_config(temp_dir)
+
+        stdout.write.assert_called_once()
+        text = stdout.write.call_args.args[0]
+        assert f"  Répertoire      : {temp_dir}" in text
+        assert text.endswith("=" * 80 + "\n\n")
+
+    def test_summary_single_write(self, mock_logger):
+        """Le résumé est écrit en un seul appel."""
+        processor = FileProcessor(Config(), mock_logger)
+        processor.stats = {"total": 4, "success": 2, "failed": 1, "skipped": 1}
+
+        with patch("converter_pdf.processor.sys.stdout") as stdout:
+            processor._print_summary(3.0)
+
+        stdout.write.assert_called_once()
+        text = stdout.write.call_args.args[0]
+        assert "    - Convertis     : 2 (50%)" in text
+        assert "[!] Des fichiers ont échoué" in text
+
+
 # =============================================================================
 # Tests FileProcessor - Dry-Run
 # =============================================================================
@@ -620,13 +1275,16 @@ class TestFileProcessorHideSource:
         assert attrs != -1
         assert attrs & FILE_ATTRIBUTE_HIDDEN != 0
 
+    @pytest.mark.skipif(
+        __import__("sys").platform == "win32",
+        reason="_hide_file est sans effet hors Windows uniquement"
+    )
     def test_hide_file_skipped_on_non_windows(self, mock_logger, temp_dir):
         """_hide_file est ignorée sur les systèmes non-Windows."""
         processor = FileProcessor(Config(), mock_logger)
 
-        with patch('sys.platform', 'linux'):
-            # Ne devrait pas lever d'erreur
-            processor._hide_file(temp_dir / "test.txt")
+        # Ne devrait pas lever d'erreur
+        processor._hide_file(temp_dir / "test.txt")
 
 
 # =============================================================================
@@ -727,7 +1385,36 @@ class TestFileProcessorNestedExtraction:
         processor.process_file(source)
 
         # Le dossier devrait être dans la liste des dossiers extraits
-        assert output_folder.resolve() in processor._extracted_folders
+        assert output_folder.absolute() in processor._extracted_folders
+
+    def test_pdf_only_converter_skips_folder_check(
+        self, mock_logger, temp_dir, file_factory
+    ):
+        """Un convertisseur qui ne produit que des PDF n'entraîne pas de stat du résultat."""
+        processor = FileProcessor(Config(report_enabled=False), mock_logger)
+        source = file_factory.create_text_file("test.txt", "content")
+
+        def mock_convert(src, dst):
+            dst.write_bytes(b"%PDF")
+            return ConversionResult(
+                status=ConversionStatus.SUCCESS,
+                source=src,
+                dest=dst,
+                duration=0.1,
+                method="text",
+            )
+
+        mock_converter = MagicMock(produces_folder=False)
+        mock_converter.can_convert.return_value = True
+        mock_converter.is_available.return_value = True
+        mock_converter.convert.side_effect = mock_convert
+        processor.converters = [mock_converter]
+
+        with patch.object(Path, "is_dir", side_effect=AssertionError("is_dir appelé")):
+            result = processor.process_file(source)
+
+        assert result.is_success
+        assert processor._extracted_folders == []
 
     def test_extracted_folder_not_tracked_for_pdf(
         self, mock_logger, temp_dir, file_factory
@@ -779,6 +1466,25 @@ class TestFileProcessorNestedExtraction:
         assert Path("/fake/folder") not in processor._extracted_folders
         assert Path("/fake/processed") not in processor._processed_folders
 
+    def test_subfolder_of_folder_in_same_pass_skipped(self, mock_logger, temp_dir):
+        """Un sous-dossier extrait dans la même passe que son parent n'est pas reparcouru."""
+        processor = FileProcessor(Config(report_enabled=False), mock_logger)
+        parent = temp_dir / "archive"
+        child = parent / "message.msg-open"
+        child.mkdir(parents=True)
+        visited = []
+
+        def fake_process(directory, recursive, extensions, dest_dir):
+            visited.append(directory)
+            if directory == temp_dir:
+                processor._extracted_folders = [child, parent]
+
+        with patch.object(processor, "_process_single_directory", side_effect=fake_process):
+            processor.process_directory(temp_dir)
+
+        assert visited == [temp_dir, parent]
+        assert child in processor._processed_folders
+
     def test_nested_zip_extraction_flow(
         self, mock_logger, temp_dir
     ):
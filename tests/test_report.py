@@ -0,0 +1,227 @@
+"""
+Tests pour le module report.py.
+
+Teste:
+- Compteurs globaux
+- Génération du rapport texte
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+from converter_pdf.converters.base import ConversionResult, ConversionStatus
+from converter_pdf.report import FileStats, SessionReport, _format_duration, _format_size
+
+
+# =============================================================================
+# Tests compteurs
+# =============================================================================
+
+class TestSessionReportTotals:
+    """Tests des totaux de session."""
+
+    def test_totals_follow_statuses(self, make_result):
+        """Les totaux comptent chaque statut."""
+        report = SessionReport()
+        for status in (
+            ConversionStatus.SUCCESS,
+            ConversionStatus.SUCCESS,
+            ConversionStatus.FAILED,
+            ConversionStatus.SKIPPED_EXISTS,
+            ConversionStatus.SKIPPED_UNCHANGED,
+            ConversionStatus.SKIPPED_PASSWORD,
+            ConversionStatus.SKIPPED_UNSUPPORTED,
+        ):
+            report.add_result(make_result(status))
+
+        assert report.total_files == 7
+        assert report.total_success == 2
+        assert report.total_failed == 1
+        assert report.total_skipped == 4
+
+    def test_totals_match_per_type_stats(self, make_result):
+        """Les totaux sont égaux à la somme des statistiques par type."""
+        report = SessionReport()
+        report.add_result(make_result(ConversionStatus.SUCCESS, "a.docx"))
+        report.add_result(make_result(ConversionStatus.FAILED, "b.xlsx"))
+        report.add_result(make_result(ConversionStatus.SUCCESS, "c.xlsx"))
+
+        stats = report.stats_by_type.values()
+        assert report.total_success == sum(s.success for s in stats)
+        assert report.total_failed == sum(s.failed for s in stats)
+
+
+# =============================================================================
+# Tests formatage
+# =============================================================================
+
+class TestFormatting:
+    """Tests des fonctions de formatage du rapport."""
+
+    def test_format_size(self):
+        """Tailles en B, KB, MB et GB."""
+        assert _format_size(512) == "512 B"
+        assert _format_size(1536) == "1.5 KB"
+        assert _format_size(5 * 1024 * 1024) == "5.0 MB"
+        assert _format_size(3 * 1024 ** 3) == "3.00 GB"
+
+    def test_format_duration(self):
+        """Durées en secondes, minutes et heures."""
+        assert _format_duration(12.34) == "12.3s"
+        assert _format_duration(125) == "2m 5s"
+        assert _format_duration(3 * 3600 + 120) == "3h 2m"
+
+    def test_method_form_kept(self):
+        """SessionReport._format_size reste utilisable (résumé console)."""
+        assert SessionReport()._format_size(2048) == "2.0 KB"
+
+
+# =============================================================================
+# Tests génération
+# =============================================================================
+
+class TestSessionReportGenerate:
+    """Tests du rapport texte."""
+
+    def test_summary_section(self, make_result):
+        """Le résumé reprend les totaux."""
+        report = SessionReport()
+        report.add_result(make_result(ConversionStatus.SUCCESS))
+        report.add_result(make_result(ConversionStatus.FAILED, "ko.docx"))
+
+        text = report.generate()
+
+        assert "  Fichiers analysés  : 2" in text
+        assert "  Convertis          : 1 (50%)" in text
+        assert "  Échecs             : 1" in text
+        assert "  [1] ko.docx" in text
+
+    def test_conversion_paths_relative_to_source(self, make_result):
+        """Les conversions affichent le chemin relatif au répertoire source."""
+        report = SessionReport(source_directory=Path("/data"))
+        report.add_result(make_result(ConversionStatus.SUCCESS, "/data/sub/a.docx"))
+        report.add_result(make_result(ConversionStatus.SUCCESS, "/ailleurs/b.docx"))
+
+        text = report.generate()
+
+        assert f"  {Path('sub/a.docx')}\n" in text
+        assert "  b.docx\n" in text
+
+    def test_header_and_footer_separators(self):
+        """Le rapport commence et se termine par un séparateur."""
+        lines = SessionReport().generate().split("\n")
+
+        assert lines[0] == "=" * 80
+        assert lines[1].startswith("RAPPORT DE CONVERSION - ")
+        assert lines[-1] == "=" * 80
+
+    def test_type_detail_limited_to_most_frequent(self, make_result):
+        """Seuls les types les plus fréquents sont détaillés."""
+        report = SessionReport()
+        report.TYPE_DETAIL_LIMIT = 2
+        for name in ("a.docx", "b.docx", "c.docx", "d.xlsx", "e.xlsx", "f.txt", "g.csv"):
+            report.add_result(make_result(ConversionStatus.SUCCESS, name))
+
+        text = report.generate()
+
+        assert "  .docx    :    3 fichiers" in text
+        assert "  .xlsx    :    2 fichiers" in text
+        assert ".txt " not in text
+        assert "  ... et 2 autre(s) type(s)" in text
+
+    def test_traceback_formatted_only_on_generate(self, make_result):
+        """La traceback d'un échec n'est formatée qu'à la génération."""
+        try:
+            raise ValueError("fichier corrompu")
+        except ValueError as e:
+            exc = e
+        result = make_result(ConversionStatus.FAILED, "ko.docx")
+        result.exception = exc
+        report = SessionReport()
+
+        with patch("converter_pdf.report.traceback.format_exception") as format_exception:
+            report.add_result(result)
+        format_exception.assert_not_called()
+
+        text = report.generate()
+        assert "        ValueError: fichier corrompu" in text
+        assert "        Traceback (most recent call last):" in text
+
+
+# =============================================================================
+# Tests sauvegarde
+# =============================================================================
+
+class TestSessionReportSave:
+    """Tests de l'écriture du rapport sur disque."""
+
+    def test_saved_file_matches_generate(self, temp_dir, make_result):
+        """Le fichier écrit est identique au texte de generate()."""
+        report = SessionReport(source_directory=temp_dir)
+        report.add_result(make_result(ConversionStatus.SUCCESS))
+        report.add_result(make_result(ConversionStatus.FAILED, "ko.docx"))
+        report.finalize()
+
+        with patch("converter_pdf.report.datetime") as fake_datetime:
+            fake_datetime.now.return_value = report.end_time
+            path = report.save(temp_dir)
+            expected = report.generate()
+
+        assert path.read_text(encoding="utf-8") == expected
+
+
+# =============================================================================
+# Tests ajout de résultats
+# =============================================================================
+
+class TestSessionReportAddResult:
+    """Tests de l'ajout des résultats."""
+
+    def test_sizes_taken_from_result_without_stat(self, temp_dir):
+        """Les tailles viennent du résultat, sans stat du PDF."""
+        result = ConversionResult(
+            status=ConversionStatus.SUCCESS,
+            source=temp_dir / "doc.docx",
+            dest=temp_dir / "doc.docx.pdf",
+            duration=0.5,
+            method="test",
+            source_size=3000,
+            dest_size=1000,
+        )
+        report = SessionReport()
+
+        with patch.object(Path, "stat", side_effect=AssertionError("stat appelé")):
+            report.add_result(result)
+
+        assert report.total_source_bytes == 3000
+        assert report.total_dest_bytes == 1000
+        assert report.stats_by_type[".docx"].dest_size_bytes == 1000
+
+    def test_stats_created_per_extension(self, make_result):
+        """Une entrée de statistiques par extension (casse ignorée)."""
+        report = SessionReport()
+        report.add_result(make_result(ConversionStatus.SUCCESS, "a.DOCX"))
+        report.add_result(make_result(ConversionStatus.SUCCESS, "b.docx"))
+
+        assert list(report.stats_by_type) == [".docx"]
+        assert report.stats_by_type[".docx"].count == 2
+
+    def test_unsupported_only_counted(self, make_result):
+        """Un fichier non supporté est compté, sans taille ni durée."""
+        result = make_result(ConversionStatus.SKIPPED_UNSUPPORTED, "image.xyz")
+        result.source_size = 4096
+        report = SessionReport()
+
+        report.add_result(result)
+
+        stats = report.stats_by_type[".xyz"]
+        assert (stats.count, stats.skipped_unsupported) == (1, 1)
+        assert report.total_skipped == 1
+        assert report.total_source_bytes == 0
+        assert report.total_duration == 0.0
+
+    def test_file_stats_has_no_instance_dict(self):
+        """FileStats utilise des slots."""
+        assert not hasattr(FileStats(), "__dict__")